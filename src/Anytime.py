@@ -0,0 +1,67 @@
+from Solver import copy_kontainer
+
+# Pendukung mode anytime (param `time_limit`) Simulated Annealing dan Stochastic Hill-Climbing.
+#
+# State terbaik tidak di-copy setiap kali ada perbaikan (O(n) per perbaikan). Yang disimpan adalah
+# log swap yang diterapkan sejak state terbaik terakhir, sehingga state terbaik bisa dibangun ulang
+# dengan membatalkan swap-swap tsb dari belakang. Kalau log sudah lebih panjang dari jumlah barang,
+# state terbaik di-materialize sekali sebagai copy dan log berhenti diisi sampai ada perbaikan baru.
+# Selain swap, log juga bisa berisi UndoRecord dari Moves (param `moves`), yang membatalkan move
+# dengan mengembalikan list barang kontainer yang tersentuh.
+
+CALIBRATION_INTERVAL = 64   # deadline dicek dan laju pendinginan dikalibrasi ulang tiap sekian iterasi
+
+def calibrate_alpha(temperature, min_temperature, remaining_iterations):
+    # cooling rate supaya suhu turun dari `temperature` ke `min_temperature` tepat di deadline,
+    # dengan perkiraan sisa iterasi dari laju iterasi/detik yang terukur
+    if temperature <= min_temperature or remaining_iterations < 1:
+        return 1.0
+    return (min_temperature / temperature) ** (1 / remaining_iterations)
+
+def undo_swaps(kontainer, swaps):
+    for swap in reversed(swaps):
+        if not isinstance(swap, tuple):
+            swap.undo(kontainer)   # UndoRecord dari Moves
+            continue
+        i, index_i, j, index_j = swap
+        kontainer[i][index_i]['barang'], kontainer[j][index_j]['barang'] = \
+            kontainer[j][index_j]['barang'], kontainer[i][index_i]['barang']
+    return kontainer
+
+class BestSoFar:
+    def __init__(self, kontainer, objective):
+        self.objective = objective
+        self.undo_log  = []     # swap (i, index_i, j, index_j) / UndoRecord sejak state terbaik
+        self.snapshot  = None   # copy state terbaik, hanya kalau undo_log sudah kepanjangan
+        self.limit     = sum(len(container) for container in kontainer)
+
+    def record_swap(self, kontainer, i, index_i, j, index_j, objective):
+        # dipanggil setelah swap diterapkan ke kontainer; objective = nilai state setelah swap
+        return self.record(kontainer, (i, index_i, j, index_j), objective)
+
+    def record_move(self, kontainer, undo, objective):
+        # sama dengan record_swap untuk move dari Moves; undo = UndoRecord dari MoveGenerator.apply
+        return self.record(kontainer, undo, objective)
+
+    def record(self, kontainer, undo, objective):
+        if objective < self.objective:
+            self.objective = objective
+            self.undo_log.clear()
+            self.snapshot  = None
+            return True
+
+        if self.snapshot is None:
+            self.undo_log.append(undo)
+            if len(self.undo_log) > self.limit:
+                # UndoRecord mengembalikan list barang asli (bukan copy), jadi hasilnya di-copy sekali lagi
+                self.snapshot = copy_kontainer(undo_swaps(copy_kontainer(kontainer), self.undo_log))
+                self.undo_log.clear()
+        return False
+
+    def restore(self, kontainer):
+        # kembalikan state terbaik; kontainer (state sekarang) di-rollback in place kalau perlu
+        if self.snapshot is not None:
+            return self.snapshot
+        undo_swaps(kontainer, self.undo_log)
+        self.undo_log.clear()
+        return kontainer
@@ -0,0 +1,234 @@
+import importlib
+import json
+import multiprocessing as mp
+import os
+import platform
+import queue
+import random
+import resource
+import statistics
+import sys
+import time
+
+import Bounds
+from Solver import WORKER_POLL_INTERVAL
+
+# Benchmark: setiap algoritma dijalankan pada matriks (kelas instance x ukuran x seed). Instance
+# dibangkitkan ulang dari seed di proses anak sendiri, supaya peak RSS yang tercatat hanya milik
+# run tersebut (bukan sisa run sebelumnya). Hasil ditulis ke report JSON.
+
+ALGORITHMS = {
+    'sa'         : 'SimulatedAnnealing',
+    'steepest'   : 'HillClimbingSteepest',
+    'stochastic' : 'HillClimbingStochastic',
+    'ga'         : 'GeneticAlgorithm',
+    'tabu'       : 'TabuSearch',
+}
+
+INSTANCE_CLASSES = ('uniform', 'triplet', 'falkenauer')
+
+DEFAULT_SIZES      = [10, 100, 1000]
+DEFAULT_SEEDS      = [0, 1, 2]
+DEFAULT_TIME_LIMIT = 30.0   # detik per run; lewat dari ini run diminta berhenti (should_stop)
+KILL_GRACE         = 30.0   # tambahan waktu sebelum proses anak dimatikan paksa
+
+def generate_instance(kind, n, seed):
+    # uniform    : kapasitas 150, ukuran U[1, 149] (seperti case6.json)
+    # falkenauer : kelas "u" Falkenauer, kapasitas 150, ukuran U[20, 100]
+    # triplet    : kelas "t" Falkenauer, kapasitas 1000, tiap 3 barang pas mengisi 1 kontainer
+    #              (n dibulatkan ke bawah ke kelipatan 3, optimum = n/3)
+    rng = random.Random(seed)
+
+    if kind == 'uniform':
+        kapasitas = 150
+        ukuran    = [rng.randint(1, kapasitas - 1) for _ in range(n)]
+    elif kind == 'falkenauer':
+        kapasitas = 150
+        ukuran    = [rng.randint(20, 100) for _ in range(n)]
+    elif kind == 'triplet':
+        kapasitas = 1000
+        ukuran    = []
+        for _ in range(max(1, n // 3)):
+            first  = rng.randint(380, 490)
+            second = rng.randint(250, (kapasitas - first) // 2)
+            ukuran.extend((first, second, kapasitas - first - second))
+        rng.shuffle(ukuran)
+    else:
+        raise ValueError(f"Unknown instance class '{kind}', choose one of {INSTANCE_CLASSES}")
+
+    return {
+        'kapasitas_kontainer' : kapasitas,
+        'barang'              : [{'id': f"BRG{idx + 1:03d}", 'ukuran': size} for idx, size in enumerate(ukuran)],
+    }
+
+def run_case(algorithm, kind, n, seed, params, time_limit, result_queue):
+    instance    = generate_instance(kind, n, seed)
+    lower_bound = Bounds.lower_bound(instance)
+    solver      = importlib.import_module(ALGORITHMS[algorithm])
+
+    deadline    = time.perf_counter() + time_limit
+    start_time  = time.perf_counter()
+    result      = solver.solve(instance, {'lower_bound': lower_bound, **params, 'seed': seed, 'verbose': False},
+                               should_stop=lambda: time.perf_counter() > deadline)
+    wall_time   = time.perf_counter() - start_time
+
+    # ru_maxrss dalam KB di Linux, byte di macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        peak_rss *= 1024
+
+    result_queue.put({
+        'status'              : 'stopped' if result.extra.get('stopped_early') else 'ok',
+        'wall_time'           : wall_time,
+        'solve_time'          : result.execution_time,
+        'iterations'          : result.iterations,
+        'evaluations'         : result.evaluations,
+        'evaluations_per_sec' : result.evaluations / wall_time if wall_time > 0 else None,
+        'peak_rss_mb'         : peak_rss / (1024 * 1024),
+        'objective'           : result.objective,
+        'K'                   : result.K,
+        'lower_bound'         : lower_bound,
+        'gap'                 : result.K - lower_bound,
+    })
+
+def wait_for_record(result_queue, process, timeout):
+    # queue dibaca per potongan pendek sambil cek exitcode: proses anak yang mati (OOM, import error
+    # di spawn) langsung dicatat 'error', tidak menunggu time_limit + KILL_GRACE habis
+    give_up = time.perf_counter() + timeout
+    while True:
+        try:
+            return result_queue.get(timeout=max(min(WORKER_POLL_INTERVAL, give_up - time.perf_counter()), 0))
+        except queue.Empty:
+            pass
+        if process.exitcode is not None:
+            try:
+                return result_queue.get_nowait()   # record yang di-put tepat sebelum proses selesai
+            except queue.Empty:
+                return {'status': 'error', 'exitcode': process.exitcode}
+        if time.perf_counter() >= give_up:
+            process.terminate()
+            return {'status': 'timeout'}
+
+def run_benchmark(sizes=None, seeds=None, classes=None, algorithms=None, params=None,
+                  time_limit=DEFAULT_TIME_LIMIT, report_path=None, verbose=True):
+    sizes      = sizes or DEFAULT_SIZES
+    seeds      = seeds or DEFAULT_SEEDS
+    classes    = classes or list(INSTANCE_CLASSES)
+    algorithms = algorithms or list(ALGORITHMS)
+    params     = params or {}
+
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm '{algorithm}', choose one of {list(ALGORITHMS)}")
+    for kind in classes:
+        if kind not in INSTANCE_CLASSES:
+            raise ValueError(f"Unknown instance class '{kind}', choose one of {INSTANCE_CLASSES}")
+
+    # spawn: proses anak mulai bersih, jadi peak RSS tidak mewarisi memori proses induk
+    context = mp.get_context('spawn')
+    report  = {
+        'created_at' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python'     : platform.python_version(),
+        'platform'   : platform.platform(),
+        'cpu_count'  : os.cpu_count(),
+        'time_limit' : time_limit,
+        'params'     : params,
+        'runs'       : [],
+    }
+
+    for kind in classes:
+        for n in sizes:
+            for seed in seeds:
+                for algorithm in algorithms:
+                    result_queue = context.Queue()
+                    process      = context.Process(target=run_case,
+                                                   args=(algorithm, kind, n, seed, params, time_limit, result_queue))
+                    process.start()
+
+                    record = wait_for_record(result_queue, process, time_limit + KILL_GRACE)
+                    process.join()
+
+                    record = {'algorithm': algorithm, 'class': kind, 'n': n, 'seed': seed, **record}
+                    report['runs'].append(record)
+
+                    if verbose:
+                        print_record(record)
+                    if report_path:
+                        write_report(report, report_path)
+
+    report['summary'] = summarize(report['runs'])
+    if report_path:
+        write_report(report, report_path)
+    return report
+
+def summarize(runs):
+    groups = {}
+    for record in runs:
+        if record['status'] in ('ok', 'stopped'):
+            groups.setdefault((record['algorithm'], record['class'], record['n']), []).append(record)
+
+    summary = []
+    for (algorithm, kind, n), records in sorted(groups.items()):
+        summary.append({
+            'algorithm'                  : algorithm,
+            'class'                      : kind,
+            'n'                          : n,
+            'runs'                       : len(records),
+            'median_wall_time'           : statistics.median(record['wall_time'] for record in records),
+            'median_evaluations_per_sec' : statistics.median(record['evaluations_per_sec'] or 0 for record in records),
+            'max_peak_rss_mb'            : max(record['peak_rss_mb'] for record in records),
+            'mean_gap'                   : statistics.mean(record['gap'] for record in records),
+        })
+    return summary
+
+def write_report(report, report_path):
+    # tulis ke file sementara dulu supaya report tidak setengah jadi kalau benchmark dihentikan
+    temp_path = report_path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    os.replace(temp_path, report_path)
+
+def print_record(record):
+    label = f"{record['algorithm']:<10} {record['class']:<10} n={record['n']:<8} seed={record['seed']:<3}"
+    if record['status'] in ('ok', 'stopped'):
+        print(f"{label} {record['wall_time']:9.3f}s  {record['evaluations_per_sec'] or 0:12.0f} eval/s  "
+              f"{record['peak_rss_mb']:8.1f} MB  K={record['K']} (LB {record['lower_bound']}, gap {record['gap']})"
+              f"{'  [time limit]' if record['status'] == 'stopped' else ''}")
+    else:
+        exitcode = f" (exit code {record['exitcode']})" if 'exitcode' in record else ''
+        print(f"{label} {record['status'].upper()}{exitcode}")
+
+def parse_list(argument, cast=str):
+    return [cast(value) for value in argument.split(',') if value]
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ('-h', '--help'):
+        print("Usage: python3 Benchmark.py [report.json] [sizes] [seeds] [classes] [algorithms] [time_limit]")
+        print("Example: python3 Benchmark.py report.json 10,1000,100000 0,1 uniform,triplet sa,ga 60")
+        sys.exit(0)
+
+    report_path = sys.argv[1] if len(sys.argv) > 1 else 'benchmark_report.json'
+    sizes       = parse_list(sys.argv[2], int) if len(sys.argv) > 2 else DEFAULT_SIZES
+    seeds       = parse_list(sys.argv[3], int) if len(sys.argv) > 3 else DEFAULT_SEEDS
+    classes     = parse_list(sys.argv[4]) if len(sys.argv) > 4 else list(INSTANCE_CLASSES)
+    algorithms  = parse_list(sys.argv[5]) if len(sys.argv) > 5 else list(ALGORITHMS)
+    time_limit  = float(sys.argv[6]) if len(sys.argv) > 6 else DEFAULT_TIME_LIMIT
+
+    try:
+        report = run_benchmark(sizes, seeds, classes, algorithms, time_limit=time_limit, report_path=report_path)
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+
+    print("\n" + "="*60)
+    print("BENCHMARK SUMMARY")
+    print("="*60)
+    for row in report['summary']:
+        print(f"{row['algorithm']:<10} {row['class']:<10} n={row['n']:<8} median {row['median_wall_time']:.3f}s, "
+              f"{row['median_evaluations_per_sec']:.0f} eval/s, peak {row['max_peak_rss_mb']:.1f} MB, "
+              f"mean gap {row['mean_gap']:.2f}")
+    print(f"\nReport: {report_path}")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# Kernel "isi kontainer ini seoptimal mungkin": subset-sum exact atas ukuran barang (integer) dengan
+# bitset big-int Python. Bit ke-s dari `reachable` menyala kalau jumlah s bisa dibentuk dari barang
+# yang sudah diproses; menambah satu barang cukup satu shift + or, jadi satu solve O(n * C / 64).
+#
+# best_subset : jumlah terbaik <= kapasitas dari list ukuran + index barang yang dipilih
+# fill_bin    : kontainer target diisi dengan barang dari kontainer donor (isi target sendiri tetap),
+#               hasilnya daftar perpindahan yang bisa langsung dipakai sebagai move (lihat Moves)
+
+def best_subset(sizes, capacity):
+    if capacity <= 0:
+        return 0, []
+
+    mask   = (1 << (capacity + 1)) - 1
+    layers = [1]   # layers[k] = jumlah yang bisa dibentuk dari sizes[:k]
+    for size in sizes:
+        reachable = layers[-1]
+        if reachable >> capacity:
+            break   # kapasitas sudah bisa terisi penuh, barang sisanya tidak perlu dicoba
+        if size <= capacity:
+            reachable = (reachable | (reachable << size)) & mask
+        layers.append(reachable)
+
+    best   = layers[-1].bit_length() - 1
+    chosen = []
+    target = best
+    # backtrack: kalau target sudah bisa dibentuk tanpa barang k, barang k tidak dipakai
+    for k in range(len(layers) - 2, -1, -1):
+        if not (layers[k] >> target) & 1:
+            chosen.append(k)
+            target -= sizes[k]
+    chosen.reverse()
+    return best, chosen
+
+def fill_bin(kontainer, kapasitas, target, donors, totals=None):
+    # isi sisa kapasitas kontainer[target] dengan subset barang dari kontainer donor;
+    # mengembalikan (jumlah yang dipindah, [(donor, index barang)])
+    total_target = totals[target] if totals is not None else \
+                   sum(entry['barang']['ukuran'] for entry in kontainer[target])
+    pool  = [(b, index) for b in donors if b != target for index in range(len(kontainer[b]))]
+    sizes = [kontainer[b][index]['barang']['ukuran'] for b, index in pool]
+
+    filled, chosen = best_subset(sizes, kapasitas - total_target)
+    return filled, [pool[k] for k in chosen]
@@ -0,0 +1,117 @@
+import math
+from bisect import bisect_left, bisect_right
+
+# Lower bound jumlah kontainer (Martello & Toth, "Knapsack Problems", 1990, bab 8), dihitung dari
+# list barang dalam O(n log n). Kalau K solusi sudah sama dengan lower bound, solusi itu optimal dan
+# search boleh berhenti.
+#
+#   L1 : ceil(total ukuran / kapasitas)
+#   L2 : untuk setiap 0 <= alpha <= C/2, barang dibagi tiga kelompok
+#          J1 = {s > C - alpha}            (tidak bisa berbagi kontainer dengan barang J2/J3)
+#          J2 = {C/2 < s <= C - alpha}     (masing-masing butuh kontainer sendiri)
+#          J3 = {alpha <= s <= C/2}        (mengisi sisa kontainer J2, kelebihannya butuh kontainer baru)
+#        L(alpha) = |J1| + |J2| + max(0, ceil((sum J3 - (|J2| C - sum J2)) / C)), L2 = max L(alpha)
+#   L3 : barang diproses dari yang terbesar; selama kontainer barang tsb pasti berisi paling banyak
+#        satu barang lain (dua barang terkecil tidak muat bersamanya), kontainer itu bisa dipasangkan
+#        dengan barang terbesar yang masih muat tanpa merusak optimalitas (dominance Martello-Toth).
+#        L3 = kontainer yang sudah pasti + L2 dari barang sisanya.
+
+def bound_l1(sizes, kapasitas):
+    return math.ceil(sum(sizes) / kapasitas) if sizes else 0
+
+def bound_l2(sizes, kapasitas):
+    # sizes harus terurut naik
+    if not sizes:
+        return 0
+
+    prefix = [0]
+    for size in sizes:
+        prefix.append(prefix[-1] + size)
+
+    def sum_range(lo, hi):
+        return prefix[hi] - prefix[lo]
+
+    n          = len(sizes)
+    half       = bisect_right(sizes, kapasitas // 2)   # sizes[:half] <= C/2 (2s <= C)
+    candidates = {0, *sizes[:half]}                    # cukup alpha = 0 dan ukuran barang <= C/2
+    best       = 0
+
+    for alpha in candidates:
+        j1_start = bisect_right(sizes, kapasitas - alpha)   # J1 = sizes[j1_start:]
+        j3_start = bisect_left(sizes, alpha)                # J3 = sizes[j3_start:half]
+        j2_count = j1_start - half
+        j2_room  = j2_count * kapasitas - sum_range(half, j1_start)
+        overflow = sum_range(j3_start, half) - j2_room
+
+        bound = (n - j1_start) + j2_count + max(0, math.ceil(overflow / kapasitas))
+        best  = max(best, bound)
+
+    return best
+
+def bound_l3(sizes, kapasitas):
+    # sizes harus terurut naik. prev_alive / next_alive: disjoint set "barang hidup terdekat" ke kiri /
+    # kanan, supaya barang yang sudah dipasangkan bisa dilewati dalam O(alpha(n))
+    n          = len(sizes)
+    prev_alive = list(range(n + 1))   # index digeser +1; 0 = tidak ada
+    next_alive = list(range(n + 1))   # n = tidak ada
+
+    def find(parent, index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index         = parent[index]
+        return index
+
+    def remove(index):
+        prev_alive[index + 1] = index
+        next_alive[index]     = index + 1
+
+    def largest_alive(upto):
+        return find(prev_alive, upto + 1) - 1 if upto >= 0 else -1
+
+    def smallest_alive(start):
+        return find(next_alive, start) if start < n else n
+
+    fixed    = 0
+    residual = None
+    current  = largest_alive(n - 1)
+
+    while current >= 0:
+        remove(current)
+        smallest = smallest_alive(0)
+
+        if smallest == n or sizes[current] + sizes[smallest] > kapasitas:
+            fixed  += 1   # tidak ada barang lain yang muat: kontainer sendiri
+        else:
+            second = smallest_alive(smallest + 1)
+            if second < n and sizes[current] + sizes[smallest] + sizes[second] <= kapasitas:
+                # bisa berisi >= 3 barang: dominance tidak berlaku, begitu juga untuk barang yang lebih kecil
+                residual = [sizes[current]]
+                break
+            partner = largest_alive(bisect_right(sizes, kapasitas - sizes[current]) - 1)
+            remove(partner)
+            fixed  += 1
+
+        current = largest_alive(current - 1)
+
+    if residual is None:
+        return fixed
+
+    index = smallest_alive(0)
+    while index < n:
+        residual.append(sizes[index])
+        index = smallest_alive(index + 1)
+    residual.sort()
+
+    return max(bound_l2(sizes, kapasitas), fixed + bound_l2(residual, kapasitas))
+
+def compute_bounds(barang, kapasitas):
+    sizes = sorted(item['ukuran'] for item in barang)
+    return {
+        'L1' : bound_l1(sizes, kapasitas),
+        'L2' : bound_l2(sizes, kapasitas),
+        'L3' : bound_l3(sizes, kapasitas),
+    }
+
+def lower_bound(instance):
+    # bound terbaik (terbesar) dari L1, L2, L3
+    return max(compute_bounds(instance['barang'], instance['kapasitas_kontainer']).values())
@@ -1,119 +1,36 @@
 import random
-import math
-import json
 import sys
-import os
-import matplotlib.pyplot as plt
-import numpy as np
 import time
+import numpy as np
+from collections import OrderedDict
+from itertools import chain
+from Solution import BinPackingSolution
+from ResidualIndex import BestFitIndex, FirstFitTree
+from Initializer import create_initial_solution
+from Solver import Result, load_instance, pop_flag, print_gap, print_instance, print_kontainer, resolve_lower_bound
 
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-if len(sys.argv) > 1:
-    json_filename = sys.argv[1]
-else:
-    json_filename = 'case6.json'
-
-json_path = os.path.join(script_dir, json_filename)
-
-try:
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-    print(f"Using JSON file: {json_filename}")
-except FileNotFoundError:
-    print(f"Error: {json_filename} not found!")
-    sys.exit(1)
-
-# Variable Library
-kapasitas_kontainer   = data['kapasitas_kontainer']  # kapasitas kontainer dalam kg/m³
-barang                = data['barang'].copy()         # id barang
-jumlah_barang         = len(barang)                   # jumlah barang
-kontainer             = []                            # kontainer untuk menyimpan barang
-kontainer_id          = 0                             # id kontainer
-
-print(f"Loaded data from JSON file:")
-print(f"Kapasitas kontainer: {kapasitas_kontainer} kg/m³")
-print(f"Jumlah barang: {jumlah_barang}")
-print(f"Barang: {[f"{item['id']}({item['ukuran']})" for item in barang]}")
-
-barang_unrandomized = barang.copy()
-
-# declare kontainer array
-kontainer.append([])
-kontainer_space_left = kapasitas_kontainer
-
-# declare penyebaran kontainer secara random
-while True:
-    if len(barang) == 0:
-        break
-        
-    random_index   = random.randint(0, len(barang) - 1)
-    random_barang  = barang[random_index]
-    
-    if random_barang['ukuran'] <= kontainer_space_left:
-        kontainer[kontainer_id].append({
-            'barang': random_barang
-        })
-        
-        kontainer_space_left -= random_barang['ukuran']
-        barang.pop(random_index)
-
-    else:
-        kontainer_id += 1
-        kontainer.append([])
-        kontainer_space_left = kapasitas_kontainer
-
-print("\n" + "="*60)
-print("SPAWN BARANG DALAM KONTAINER")
-print("="*60)
-
-for idx, container in enumerate(kontainer):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_temp = item['barang']
-        print(f"  - ID: {barang_i_temp['id']}, Ukuran: {barang_i_temp['ukuran']} kg/m³")
-        total_ukuran += barang_i_temp['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
-
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(kontainer)}")
-print("="*60)
-
-# variabel untuk GA
-main_kromosom           = []  
-main_objective_function = 0   # objective function untuk kromosom utama
-
-for item_unrandomized in barang_unrandomized:
-    for idx_container, container in enumerate(kontainer):
-        for barang_in_container in container:
-            if barang_in_container['barang']['id'] == item_unrandomized['id']:
-                main_kromosom.append(idx_container + 1)
-                break     
-
-print("\n" + "="*60)
-print("GENETIC SEQUENCE (KROMOSOM)")
-print("="*60)
-
-for i, item_unrandomized in enumerate(barang_unrandomized):
-    print(f"{item_unrandomized['id']} (item {i+1}) -> Kontainer {main_kromosom[i]}")
-
-print(f"\nKromosom: {main_kromosom}")
-print("="*60)
-
+# library untuk genetic algorithm
+DEFAULT_PARAMS = {
+    'initial_strategy' : 'random',   # random | ffd | bfd
+    'encoding'         : 'label',    # label (nomor kontainer per barang) | grouping (gen = kontainer, Falkenauer)
+    'population_size'  : 50,
+    'max_iterations'   : 200,
+    'mutation_rate'    : 0.05,
+    'tournament_size'  : 5,
+    'lower_bound'      : 'auto',     # berhenti jika solusi terbaik tanpa overflow sudah <= lower bound ('auto' = Bounds, None = mati)
+    'seed'             : None,
+    'verbose'          : True,
+}
+
+ENCODINGS = ('label', 'grouping')
+
+P_OVERFLOW = 1000
+P_BINS     = 1.0
+P_DENSITY  = 0.1
 
 def calculate_objective_function(kromosom, barang, kapasitas): # objective function untuk fitness test
-    P_OVERFLOW = 1000
-    P_BINS     = 1.0
-    P_DENSITY  = 0.1
-    
-    if kromosom:
-        K = max(kromosom)
+    if len(kromosom) > 0:
+        K = int(max(kromosom))
     else:
         K = 0
         
@@ -140,196 +57,466 @@ def calculate_objective_function(kromosom, barang, kapasitas): # objective funct
     
     return cost, K, total_overflow, sum_squared_fill_ratios
 
+def calculate_population_fitness(population, ukuran, kapasitas): # fitness satu generasi sekaligus (batch)
+    # population: matriks (P x n) nomor kontainer 1-based, ukuran: vektor ukuran barang (n)
+    P, n = population.shape
+    if n == 0:
+        zeros = np.zeros(P)
+        return zeros, np.zeros(P, dtype=np.int64), zeros, zeros
+    
+    K     = population.max(axis=1).astype(np.int64)
+    K_max = int(K.max())
+    
+    # offset bincount: kontainer c milik individu p dipetakan ke slot p * K_max + (c - 1)
+    flat_index = (population - 1 + (np.arange(P) * K_max)[:, None]).ravel()
+    loads      = np.bincount(flat_index, weights=np.tile(ukuran, P), minlength=P * K_max).reshape(P, K_max)
+    counts     = np.bincount(flat_index, minlength=P * K_max).reshape(P, K_max)
+    
+    total_overflow = np.maximum(loads - kapasitas, 0).sum(axis=1)
+    
+    fill_ratio = loads / kapasitas
+    squared    = np.where(counts > 0, fill_ratio ** 2, 0.0)
+    # cumsum menjumlah berurutan per kontainer seperti versi skalar, jadi hasilnya identik bit-per-bit
+    sum_squared_fill_ratios = np.cumsum(squared, axis=1)[:, -1]
+    
+    cost = (P_OVERFLOW * total_overflow) + (P_BINS * K) - (P_DENSITY * sum_squared_fill_ratios)
+    
+    return cost, K, total_overflow, sum_squared_fill_ratios
 
-main_objective_function = calculate_objective_function(main_kromosom, barang_unrandomized, kapasitas_kontainer)
 
-def parent_crossover(parent_a, parent_b):
+def parent_crossover(parent_a, parent_b, rng=random):
     if len(parent_a) != len(parent_b):
         raise ValueError("Parents must have the same length for crossover.")
     n = len(parent_a)
     if n < 2:
         return parent_a.copy()
     
-    point = random.randint(1, n - 1)
-    child = parent_a[:point] + parent_b[point:]
+    point = rng.randint(1, n - 1)
+    child = np.concatenate((parent_a[:point], parent_b[point:]))
     return child
 
-def mutate_offspring(offspring, mutation_rate):
-    if not offspring:
+def mutate_offspring(offspring, mutation_rate, np_rng=None):
+    if len(offspring) == 0:
         return offspring
     
+    np_rng  = np_rng if np_rng is not None else np.random.default_rng()
     mutated = offspring.copy()
-    if mutated:
-        K_max = max(mutated)
-    else:
-        K_max = 1
+    K_max   = int(mutated.max())
     
-    for i in range(len(mutated)):
-        if random.random() < mutation_rate:
-            mutated[i] = random.randint(1, K_max + 1)
+    mask          = np_rng.random(len(mutated)) < mutation_rate
+    mutated[mask] = np_rng.integers(1, K_max + 2, size=int(mask.sum()))
     
     return mutated
 
 def repair_offspring(offspring, barang, kapasitas):
-    if not offspring:
+    if len(offspring) == 0:
         return offspring
     
-    K_max = max(offspring) if offspring else 1
+    repaired = offspring.tolist()
+    K_max    = max(repaired)
+    
+    # total & isi tiap kontainer dihitung sekali, lalu di-update berjalan
+    loads      = [0] * K_max
     containers = [[] for _ in range(K_max)]
+    for i, container_num in enumerate(repaired):
+        loads[container_num - 1] += barang[i]['ukuran']
+        containers[container_num - 1].append(i)
+    
+    residual_index = FirstFitTree([kapasitas - load for load in loads], reserve=len(repaired))
+    
+    for container_idx in range(K_max):
+        if loads[container_idx] <= kapasitas:
+            continue
+        
+        # keluarkan barang terbesar dulu sampai kontainer tidak overflow lagi
+        items_sorted = sorted(containers[container_idx], key=lambda i: barang[i]['ukuran'], reverse=True)
+        
+        for item_idx in items_sorted:
+            if loads[container_idx] <= kapasitas:
+                break
+            
+            item_size = barang[item_idx]['ukuran']
+            loads[container_idx] -= item_size
+            
+            # kontainer asal masih overflow (residual < 0) sehingga tidak mungkin terpilih
+            target_bin = residual_index.first_fit(item_size)
+            if target_bin == -1:
+                target_bin = residual_index.append(kapasitas - item_size)
+                loads.append(item_size)
+            else:
+                loads[target_bin] += item_size
+                residual_index.update(target_bin, kapasitas - loads[target_bin])
+            
+            repaired[item_idx] = target_bin + 1
+        
+        residual_index.update(container_idx, kapasitas - loads[container_idx])
+    
+    return np.array(repaired, dtype=np.int32)
+
+# Encoding 'grouping' (Falkenauer): individu tetap disimpan sebagai kromosom nomor kontainer supaya
+# fitness batch, cache, dan migrasi island tidak berubah, tapi operator genetiknya bekerja pada
+# kontainer utuh. Crossover menyisipkan sederet kontainer dari parent kedua ke parent pertama,
+# membuang kontainer parent pertama yang barangnya ikut tersisip, lalu memasukkan ulang barang yang
+# terlepas dengan best-fit decreasing (BestFitIndex). Mutasi membubarkan kontainer acak anak sebelum
+# barang dimasukkan ulang. Anak selalu feasible, jadi repair_offspring tidak dipakai.
+def decode_groups(kromosom, ukuran):
+    # (isi tiap kontainer, total tiap kontainer), kontainer diurutkan menurut nomornya
+    labels = kromosom.tolist()
+    groups = []
+    loads  = []
+    previous = None
+    for item_idx in np.argsort(kromosom, kind='stable').tolist():
+        if labels[item_idx] != previous:
+            previous = labels[item_idx]
+            groups.append([])
+            loads.append(0)
+        groups[-1].append(item_idx)
+        loads[-1] += ukuran[item_idx]
+    return groups, loads
+
+def encode_groups(groups, n):
+    kromosom = np.empty(n, dtype=np.int32)
+    lengths  = [len(group) for group in groups]
+    kromosom[np.fromiter(chain.from_iterable(groups), dtype=np.int64, count=n)] = \
+        np.repeat(np.arange(1, len(groups) + 1, dtype=np.int32), lengths)
+    return kromosom
+
+def best_fit_insert(groups, loads, items, ukuran, kapasitas, residual_index=None):
+    # items dimasukkan sesuai urutan yang diberikan; kontainer baru dibuka kalau tidak ada yang muat.
+    # residual_index boleh dipakai ulang antar anak (dikosongkan dulu di sini)
+    if residual_index is None:
+        residual_index = BestFitIndex(kapasitas)
+    residual_index.clear()
+    residual_index.add_many([kapasitas - load for load in loads])
+    
+    for item_idx in items:
+        item_size   = ukuran[item_idx]
+        b, residual = residual_index.pop_best_fit(item_size)
+        if b is None:
+            b        = len(groups)
+            residual = kapasitas
+            groups.append([])
+            loads.append(0)
+        groups[b].append(item_idx)
+        loads[b] += item_size
+        residual_index.add(b, residual - item_size)
+    
+    return groups
+
+def group_crossover(parent_a, parent_b, ukuran, kapasitas, mutation_rate, rng=random, residual_index=None):
+    # parent_a / parent_b: hasil decode_groups (tidak diubah). Crossover + mutasi sekaligus, supaya
+    # barang yang terlepas cukup dimasukkan ulang sekali
+    groups_a, loads_a = parent_a
+    groups_b, loads_b = parent_b
+    n                 = sum(len(group) for group in groups_a)
+    
+    # kontainer yang disisipkan: potongan berurutan dari parent b
+    start = rng.randrange(len(groups_b))
+    end   = rng.randint(start + 1, len(groups_b))
+    
+    taken = [False] * n
+    for group in groups_b[start:end]:
+        for item_idx in group:
+            taken[item_idx] = True
     
-    for i, container_num in enumerate(offspring):
-        if container_num <= K_max:
-            containers[container_num - 1].append((i, barang[i]['ukuran']))
+    # kontainer parent a yang bentrok dengan kontainer sisipan dibuang, sisa barangnya dilepas
+    free      = []
+    survivors = []
+    for group, load in zip(groups_a, loads_a):
+        if any(taken[item_idx] for item_idx in group):
+            free.extend(item_idx for item_idx in group if not taken[item_idx])
+        else:
+            survivors.append((group, load))
     
-    repaired = offspring.copy()
+    groups = []
+    loads  = []
+    for group, load in chain(zip(groups_b[start:end], loads_b[start:end]), survivors):
+        if rng.random() < mutation_rate:
+            free.extend(group)   # mutasi: kontainer dibubarkan
+        else:
+            groups.append(group[:])   # di-copy karena best_fit_insert menambah isi kontainer
+            loads.append(load)
     
-    for container_idx, container in enumerate(containers):
-        total_size = sum(item[1] for item in container)
+    free.sort(key=lambda item_idx: ukuran[item_idx], reverse=True)
+    return encode_groups(best_fit_insert(groups, loads, free, ukuran, kapasitas, residual_index), n)
+
+def random_grouping(n, ukuran, kapasitas, rng=random, residual_index=None):
+    # individu awal feasible: best-fit dengan urutan barang acak
+    items = list(range(n))
+    rng.shuffle(items)
+    return encode_groups(best_fit_insert([], [], items, ukuran, kapasitas, residual_index), n)
+
+class FitnessCache: # cache LRU fitness, key = isi kromosom (bytes)
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits    = 0
+        self.misses  = 0
+    
+    def evaluate(self, population, ukuran, kapasitas):
+        fitness_scores = np.empty(len(population))
+        missing_rows   = []
+        missing_keys   = []
+        
+        for idx, individual in enumerate(population):
+            key = individual.tobytes()
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                fitness_scores[idx] = self.entries[key]
+                self.hits += 1
+            else:
+                missing_rows.append(idx)
+                missing_keys.append(key)
+                self.misses += 1
         
-        if total_size > kapasitas:
-            items_sorted = sorted(container, key=lambda x: x[1], reverse=True)
+        # kromosom yang belum pernah dihitung tetap dievaluasi sekaligus (batch)
+        if missing_rows:
+            cost, _, _, _ = calculate_population_fitness(population[missing_rows], ukuran, kapasitas)
+            fitness_scores[missing_rows] = cost
             
-            for item_idx, item_size in items_sorted:
-                current_total = sum(item[1] for item in container if item[0] != item_idx)
-                
-                if current_total <= kapasitas:
-                    placed = False
-                    for target_bin in range(len(containers)):
-                        if target_bin != container_idx:
-                            target_total = sum(item[1] for item in containers[target_bin])
-                            if target_total + item_size <= kapasitas:
-                                repaired[item_idx] = target_bin + 1
-                                containers[target_bin].append((item_idx, item_size))
-                                placed = True
-                                break
-                    
-                    if not placed:
-                        K_max += 1
-                        repaired[item_idx] = K_max
-                        containers.append([(item_idx, item_size)])
-                    
-                    container = [item for item in container if item[0] != item_idx]
-    
-    return repaired
-
-# library untuk genetic algorithm
-POPULATION_SIZE = 50
-MAX_ITERATIONS  = 200
-MUTATION_RATE   = 0.05
-TOURNAMENT_SIZE = 5
-
-population = []
-population.append(main_kromosom.copy())
+            for key, fitness in zip(missing_keys, cost):
+                self.entries[key] = fitness
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        
+        return fitness_scores
+    
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
 
-for _ in range(POPULATION_SIZE - 1):
-    random_kromosom = []
-    if barang_unrandomized:
-        K_max = len(kontainer)
-    else:
-        K_max = 1
+def tournament_selection(fitness_scores, tournament_size, rng=random): # return indeks individu pemenang
+    contestants = rng.sample(range(len(fitness_scores)), min(tournament_size, len(fitness_scores)))
     
-    for item in barang_unrandomized:
-        random_kromosom.append(random.randint(1, K_max + 2))
+    best = contestants[0]
+    for idx in contestants[1:]:
+        if fitness_scores[idx] < fitness_scores[best]:
+            best = idx
     
-    population.append(random_kromosom)
+    return best
+
+def initialize_population(main_kromosom, population_size, K_max, np_rng, encoding='label', ukuran=None,
+                          kapasitas=None, rng=random):
+    # populasi disimpan sebagai matriks (population_size x jumlah_barang)
+    population     = np.empty((population_size, len(main_kromosom)), dtype=np.int32)
+    population[0]  = main_kromosom
+    if encoding == 'grouping' and len(main_kromosom) > 0:
+        residual_index = BestFitIndex(kapasitas)
+        for slot in range(1, population_size):
+            population[slot] = random_grouping(len(main_kromosom), ukuran, kapasitas, rng, residual_index)
+    else:
+        population[1:] = np_rng.integers(1, K_max + 3, size=(population_size - 1, len(main_kromosom)))
+    return population
 
-def tournament_selection(population, barang, kapasitas, tournament_size):
-    tournament = random.sample(population, min(tournament_size, len(population)))
+def evolve_generation(population, fitness_scores, best_kromosom, barang, kapasitas, params, rng, np_rng, ukuran=None):
+    new_population    = np.empty_like(population)
+    new_population[0] = best_kromosom
+    
+    decoded        = {}   # grouping: hasil decode_groups per individu, karena parent yang sama sering terpilih lagi
+    residual_index = BestFitIndex(kapasitas)   # grouping: satu index untuk semua anak
+    
+    for slot in range(1, len(population)):
+        index1  = tournament_selection(fitness_scores, params['tournament_size'], rng)
+        index2  = tournament_selection(fitness_scores, params['tournament_size'], rng)
+        parent1 = population[index1]
+        parent2 = population[index2]
+        
+        if params['encoding'] == 'grouping' and len(parent1) > 0:
+            for index in (index1, index2):
+                if index not in decoded:
+                    decoded[index] = decode_groups(population[index], ukuran)
+            new_population[slot] = group_crossover(decoded[index1], decoded[index2], ukuran, kapasitas,
+                                                   params['mutation_rate'], rng, residual_index)
+            continue
+        
+        offspring = parent_crossover(parent1, parent2, rng)
+        offspring = mutate_offspring(offspring, params['mutation_rate'], np_rng)
+        offspring = repair_offspring(offspring, barang, kapasitas)  
+        
+        new_population[slot] = offspring
     
-    best = tournament[0]
-    best_fitness, _, _, _ = calculate_objective_function(best, barang, kapasitas)
+    return new_population
+
+def solve(instance, params=None, should_stop=None, on_generation=None):
+    # on_generation(iteration, population, fitness_scores) dipanggil tiap generasi setelah evaluasi;
+    # return True kalau populasi diubah (mis. migrasi island) supaya fitness dihitung ulang
+    params              = {**DEFAULT_PARAMS, **(params or {})}
+    if params['encoding'] not in ENCODINGS:
+        raise ValueError(f"Unknown encoding '{params['encoding']}', choose one of {ENCODINGS}")
     
-    for individual in tournament[1:]:
-        fitness, _, _, _ = calculate_objective_function(individual, barang, kapasitas)
-        if fitness < best_fitness:
-            best = individual
-            best_fitness = fitness
+    rng                 = random.Random(params['seed'])
+    np_rng              = np.random.default_rng(params['seed'])
+    verbose             = params['verbose']
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+    barang_unrandomized = instance['barang']
     
-    return best.copy()
-
-best_kromosom = None
-best_fitness = float('inf')
-
-iterations  = []
-history_POF = []
-improvement_count = 0
-
-print("\n" + "="*60)
-print("GENETIC ALGORITHM - STARTING")
-print("="*60)
-
-start_time = time.time()
-
-for iteration in range(MAX_ITERATIONS):
-    fitness_scores = []
-    for individual in population:
-        fitness, _, _, _ = calculate_objective_function(individual, barang_unrandomized, kapasitas_kontainer)
-        fitness_scores.append(fitness)
-    
-    min_fitness_idx = fitness_scores.index(min(fitness_scores))
-    current_best_fitness = fitness_scores[min_fitness_idx]
-    
-    avg_fitness = sum(fitness_scores) / len(fitness_scores)
-    worst_fitness = max(fitness_scores)
-    
-    if current_best_fitness < best_fitness:
-        best_fitness = current_best_fitness
-        best_kromosom = population[min_fitness_idx].copy()
-        improvement_count += 1
+    # state awal: random spawn (default), ffd, atau bfd
+    kontainer = create_initial_solution(barang_unrandomized, kapasitas_kontainer, params['initial_strategy'], rng=rng)
+    
+    # variabel untuk GA
+    main_solution = BinPackingSolution.from_kontainer(kontainer, kapasitas_kontainer, barang_unrandomized)
+    main_kromosom = main_solution.to_kromosom()
+    
+    if verbose:
+        print_kontainer(kontainer, kapasitas_kontainer, "SPAWN BARANG DALAM KONTAINER")
         
-        best_cost, best_K, best_overflow, best_density = calculate_objective_function(
-            best_kromosom, barang_unrandomized, kapasitas_kontainer
-        )
+        print("\n" + "="*60)
+        print("GENETIC SEQUENCE (KROMOSOM)")
+        print("="*60)
         
-        print(f"[IMPROVEMENT #{improvement_count}] Iter {iteration+1}: fitness={best_fitness:.2f}, K={best_K}, overflow={best_overflow}")
+        for i, item_unrandomized in enumerate(barang_unrandomized):
+            print(f"{item_unrandomized['id']} (item {i+1}) -> Kontainer {main_kromosom[i]}")
+        
+        print(f"\nKromosom: {main_kromosom}")
+        print("="*60)
+    
+    ukuran_barang = np.array([item['ukuran'] for item in barang_unrandomized], dtype=np.int64)
+    K_max         = len(kontainer) if barang_unrandomized else 1
+    ukuran_list   = ukuran_barang.tolist()
+    population    = initialize_population(main_kromosom, params['population_size'], K_max, np_rng,
+                                          params['encoding'], ukuran_list, kapasitas_kontainer, rng)
+    fitness_cache = FitnessCache()
+    
+    best_kromosom = None
+    best_fitness = float('inf')
+    best_used_bins = None
     
-    iterations.append(iteration + 1)
-    history_POF.append(best_fitness)
+    iterations  = []
+    history_POF = []
+    improvement_count = 0
+    stopped_early = False
+    reached_lower_bound = False
+    lower_bound = resolve_lower_bound(instance, params['lower_bound'])
     
-    new_population = []
+    if verbose:
+        print("\n" + "="*60)
+        print("GENETIC ALGORITHM - STARTING")
+        print("="*60)
     
-    new_population.append(best_kromosom.copy())
+    start_time = time.time()
     
-    while len(new_population) < POPULATION_SIZE:
-        parent1 = tournament_selection(population, barang_unrandomized, kapasitas_kontainer, TOURNAMENT_SIZE)
-        parent2 = tournament_selection(population, barang_unrandomized, kapasitas_kontainer, TOURNAMENT_SIZE)
+    for iteration in range(params['max_iterations']):
+        if should_stop is not None and should_stop():
+            stopped_early = True
+            break
         
-        offspring = parent_crossover(parent1, parent2)
-        offspring = mutate_offspring(offspring, MUTATION_RATE)
-        offspring = repair_offspring(offspring, barang_unrandomized, kapasitas_kontainer)  
+        fitness_scores = fitness_cache.evaluate(population, ukuran_barang, kapasitas_kontainer)
         
-        new_population.append(offspring)
+        if on_generation is not None and on_generation(iteration, population, fitness_scores):
+            fitness_scores = fitness_cache.evaluate(population, ukuran_barang, kapasitas_kontainer)
+        
+        min_fitness_idx = int(np.argmin(fitness_scores))
+        current_best_fitness = fitness_scores[min_fitness_idx]
+        
+        if current_best_fitness < best_fitness:
+            best_fitness = current_best_fitness
+            best_kromosom = population[min_fitness_idx].copy()
+            improvement_count += 1
+            
+            best_cost, best_K, best_overflow, best_density = calculate_objective_function(
+                best_kromosom, barang_unrandomized, kapasitas_kontainer
+            )
+            best_used_bins = len(np.unique(best_kromosom))
+            
+            if verbose:
+                print(f"[IMPROVEMENT #{improvement_count}] Iter {iteration+1}: fitness={best_fitness:.2f}, K={best_K}, overflow={best_overflow}")
+        
+        iterations.append(iteration + 1)
+        history_POF.append(best_fitness)
+        
+        if lower_bound is not None and best_overflow == 0 and best_used_bins <= lower_bound:
+            reached_lower_bound = True
+            break
+        
+        population = evolve_generation(population, fitness_scores, best_kromosom, barang_unrandomized,
+                                       kapasitas_kontainer, params, rng, np_rng, ukuran_list)
     
-    population = new_population
-
-end_time = time.time()
-execution_time = end_time - start_time
-
-print("\n" + "="*60)
-print("GENETIC ALGORITHM - COMPLETED")
-print(f"Execution Time: {execution_time:.4f} seconds ({execution_time*1000:.2f} ms)")
-print(f"Total Improvements: {improvement_count}")
-print("="*60)
-
-print("\n" + "="*60)
-print("FINAL RESULT")
-print("="*60)
-print(f"Best Fitness: {best_fitness:.2f}")
-print(f"Jumlah iterasi: {MAX_ITERATIONS}")
-print(f"Jumlah populasi: {len(population)}")
-print(f"Final Kromosom: {best_kromosom}")
-print("="*60)
-
-plt.ioff()
+    end_time = time.time()
+    execution_time = end_time - start_time
+    
+    best_solution = BinPackingSolution.from_kromosom(best_kromosom, barang_unrandomized, kapasitas_kontainer)
+    
+    return Result(
+        algorithm      = 'Genetic Algorithm',
+        kontainer      = [container for container in best_solution.to_kontainer() if container],
+        objective      = float(best_fitness),
+        K              = best_solution.used_bins,
+        execution_time = execution_time,
+        iterations     = len(iterations),
+        evaluations    = fitness_cache.hits + fitness_cache.misses,
+        history        = history_POF,
+        lower_bound    = lower_bound,
+        extra          = {
+            'encoding'            : params['encoding'],
+            'best_kromosom'       : best_kromosom.tolist(),
+            'history_iterations'  : iterations,
+            'improvement_count'   : improvement_count,
+            'population_size'     : len(population),
+            'cache_hits'          : fitness_cache.hits,
+            'cache_misses'        : fitness_cache.misses,
+            'cache_hit_rate'      : fitness_cache.hit_rate(),
+            'stopped_early'       : stopped_early,
+            'reached_lower_bound' : reached_lower_bound,
+        },
+    )
+
+def plot_result(result):
+    import matplotlib.pyplot as plt
+    
+    plt.ioff()
+    
+    # plot 1: objective function over iterations
+    plt.figure(figsize=(10, 5))
+    plt.plot(result.extra['history_iterations'], result.history, 'b-', linewidth=2, label='Best Fitness')
+    plt.xlabel('Iteration', fontsize=12)
+    plt.ylabel('Fitness (Lower is Better)', fontsize=12)
+    plt.title('Genetic Algorithm - Fitness Evolution', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    
+    plt.tight_layout()
+    plt.show()
 
-# plot 1: objective function over iterations
-plt.figure(figsize=(10, 5))
-plt.plot(iterations, history_POF, 'b-', linewidth=2, label='Best Fitness')
-plt.xlabel('Iteration', fontsize=12)
-plt.ylabel('Fitness (Lower is Better)', fontsize=12)
-plt.title('Genetic Algorithm - Fitness Evolution', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-plt.legend()
+def main():
+    show_plot = not pop_flag(sys.argv, '--no-plot')
+    
+    if len(sys.argv) > 1:
+        json_filename = sys.argv[1]
+    else:
+        json_filename = 'case6.json'
+    
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+    encoding         = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_PARAMS['encoding']
+    
+    instance = load_instance(json_filename, 'GeneticAlgorithm.py')
+    print_instance(instance)
+    
+    try:
+        result = solve(instance, {'initial_strategy': initial_strategy, 'encoding': encoding})
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    extra  = result.extra
+    
+    print("\n" + "="*60)
+    print("GENETIC ALGORITHM - COMPLETED")
+    print(f"Execution Time: {result.execution_time:.4f} seconds ({result.execution_time*1000:.2f} ms)")
+    print(f"Total Improvements: {extra['improvement_count']}")
+    print(f"Fitness Cache Hit Rate: {extra['cache_hit_rate']*100:.2f}% ({extra['cache_hits']} hit, {extra['cache_misses']} miss)")
+    print_gap(result)
+    print("="*60)
+    
+    print("\n" + "="*60)
+    print("FINAL RESULT")
+    print("="*60)
+    print(f"Best Fitness: {result.objective:.2f}")
+    print(f"Jumlah iterasi: {result.iterations}")
+    print(f"Jumlah populasi: {extra['population_size']}")
+    print(f"Final Kromosom: {extra['best_kromosom']}")
+    print("="*60)
+    
+    if show_plot:
+        plot_result(result)
 
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
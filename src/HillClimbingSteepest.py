@@ -1,86 +1,23 @@
 import random
-import json
 import sys
-import os
 import time
-import copy
-import matplotlib.pyplot as plt
-
-script_dir = os.path.dirname(os.path.abspath(__file__))
-if len(sys.argv) > 1:
-    json_filename = sys.argv[1]
-else:
-    json_filename = 'case1.json'  
-
-json_path = os.path.join(script_dir, json_filename)
-
-try:
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-    print(f"Using JSON file: {json_filename}")
-except FileNotFoundError:
-    print(f"Error: {json_filename} not found!")
-    print("Usage: python3 HillClimbingSteepest.py [json_filename]")
-    print("Example: python3 HillClimbingSteepest.py case2.json")
-    sys.exit(1)
-
-# variabel global
-kapasitas_kontainer   = data['kapasitas_kontainer']  # kapasitas kontainer
-barang                = data['barang'].copy()         # id barang 
-jumlah_barang         = len(barang)                   # jumlah barang
-kontainer             = []                            # kontainer
-kontainer_id          = 0                             # id kontainer
-
-print(f"Loaded data from JSON file:")
-print(f"Kapasitas kontainer: {kapasitas_kontainer} kg/m³")
-print(f"Jumlah barang: {jumlah_barang}")
-items_str = [f"{item['id']}({item['ukuran']})" for item in barang]
-print(f"Barang: {items_str}")
-
-kontainer.append([])
-kontainer_space_left = kapasitas_kontainer
-
-while True:
-    if len(barang) == 0:
-        break
-        
-    random_index   = random.randint(0, len(barang) - 1)
-    random_barang  = barang[random_index]
-    
-    if random_barang['ukuran'] <= kontainer_space_left:
-        kontainer[kontainer_id].append({
-            'barang': random_barang
-        })
-        
-        kontainer_space_left -= random_barang['ukuran']
-        barang.pop(random_index)
-
-    else:
-        kontainer_id += 1
-        kontainer.append([])
-        kontainer_space_left = kapasitas_kontainer
-
-print("\n" + "="*60)
-print("SPAWN BARANG DALAM KONTAINER (STATE AWAL)")
-print("="*60)
-
-for idx, container in enumerate(kontainer):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_tempnfo = item['barang']
-        print(f"  - ID: {barang_i_tempnfo['id']}, Ukuran: {barang_i_tempnfo['ukuran']} kg/m³")
-        total_ukuran += barang_i_tempnfo['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
-
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(kontainer)}")
-print("="*60)
+from Initializer import create_initial_solution
+from Solver import (Result, count_used_bins, load_instance, pop_flag, print_gap, print_instance, print_kontainer,
+                    resolve_lower_bound)
+
+MODES = ('steepest', 'first')
+
+DEFAULT_PARAMS = {
+    'initial_strategy'   : 'random',   # random | ffd | bfd
+    'mode'               : 'steepest', # steepest (semua swap dinilai per langkah) | first (loop lama)
+    'max_iterations'     : 3,          # mode first: batas percobaan swap per kontainer i tanpa perbaikan
+    'max_steps'          : None,       # mode steepest: batas langkah (None = sampai local optimum)
+    'chunk_elements'     : 1 << 20,    # mode steepest: ukuran blok matriks delta numpy per langkah
+    'lower_bound'        : 'auto',     # berhenti jika jumlah kontainer terpakai sudah <= lower bound ('auto' = Bounds, None = mati)
+    'seed'               : None,
+    'verbose'            : True,
+    'keep_initial_state' : False,      # simpan snapshot state awal di result.extra (untuk plot)
+}
 
 def calculate_kontainer_total(kontainer):
     total = 0
@@ -105,126 +42,269 @@ def calculate_waste_squared(kontainer_list, kapasitas):
         total += unused * unused
     return total
 
-initial_state = copy.deepcopy(kontainer)
-
-# inisialisasi variabel
-obj_history = [calculate_waste_squared(kontainer, kapasitas_kontainer)]
-total_attempts = 0         # jumlah percobaan swap (evaluasi)
-total_accepted_swaps = 0   # jumlah swap yang diterima (perbaikan)
-start_time = time.time()
-
-initial_objective = obj_history[0]
-
-current_iteration = 0
-max_iterations    = 3
-best_case_unused  = calculate_unused(kontainer, kapasitas_kontainer)
-improvement_found = True
-
-while improvement_found and current_iteration < max_iterations:
-    improvement_found  = False
-
-    for i in range(len(kontainer)):
-        current_iteration = 0 
-        
-        for j in range (i + 1, len(kontainer)):
+# mode 'first': loop asli, swap diterima begitu objective global membaik (first-improvement),
+# dibatasi max_iterations percobaan per kontainer i
+def run_first_improvement(kontainer, kapasitas_kontainer, obj_history, params, should_stop, verbose):
+    total_attempts = 0         # jumlah percobaan swap (evaluasi)
+    total_accepted_swaps = 0   # jumlah swap yang diterima (perbaikan)
+    
+    current_iteration = 0
+    max_iterations    = params['max_iterations']
+    improvement_found = True
+    stopped_early     = False
+    
+    while improvement_found and current_iteration < max_iterations:
+        improvement_found  = False
+    
+        for i in range(len(kontainer)):
+            current_iteration = 0 
             
-            for index_i in range(len(kontainer[i])):
-                for index_j in range(len(kontainer[j])):
-                    current_total_i = calculate_kontainer_total(kontainer[i]) 
-                    
-                    if current_total_i < kapasitas_kontainer and current_iteration < max_iterations:
-                        current_iteration += 1
-                        total_attempts += 1
-                        print(f"Iteration {current_iteration}")
-                        
-                        current_total_j = calculate_kontainer_total(kontainer[j])
+            if should_stop is not None and should_stop():
+                stopped_early = True
+                break
+            
+            for j in range (i + 1, len(kontainer)):
+                
+                for index_i in range(len(kontainer[i])):
+                    for index_j in range(len(kontainer[j])):
+                        current_total_i = calculate_kontainer_total(kontainer[i]) 
                         
-                        barang_i_temp   = kontainer[i][index_i]['barang']
-                        barang_j_temp   = kontainer[j][index_j]['barang']
-                                        
-                        new_total_i     = current_total_i - barang_i_temp['ukuran'] + barang_j_temp['ukuran']
-                        new_total_j     = current_total_j - barang_j_temp['ukuran'] + barang_i_temp['ukuran']
+                        if current_total_i < kapasitas_kontainer and current_iteration < max_iterations:
+                            current_iteration += 1
+                            total_attempts += 1
+                            if verbose:
+                                print(f"Iteration {current_iteration}")
+                            
+                            current_total_j = calculate_kontainer_total(kontainer[j])
+                            
+                            barang_i_temp   = kontainer[i][index_i]['barang']
+                            barang_j_temp   = kontainer[j][index_j]['barang']
                                             
-                        if new_total_i <= kapasitas_kontainer and new_total_j <= kapasitas_kontainer:
-                            # hitung objective sebelum dan setelah swap, terima hanya jika after < before
-                            before_obj = calculate_waste_squared(kontainer, kapasitas_kontainer)
-
-                            # lakukan swap sementara
-                            kontainer[i][index_i]['barang'] = barang_j_temp
-                            kontainer[j][index_j]['barang'] = barang_i_temp
-
-                            after_obj = calculate_waste_squared(kontainer, kapasitas_kontainer)
-
-                            if after_obj < before_obj:
-                                # terima swap secara permanen 
-                                improvement_found = True
-                                total_accepted_swaps += 1
-                                obj_history.append(after_obj)
-                                print(f"[!!!Swap Accepted!!!]: Swapped {barang_i_temp['id']} ↔ {barang_j_temp['id']} (Obj {before_obj} → {after_obj})")
-                                current_iteration = 0
+                            new_total_i     = current_total_i - barang_i_temp['ukuran'] + barang_j_temp['ukuran']
+                            new_total_j     = current_total_j - barang_j_temp['ukuran'] + barang_i_temp['ukuran']
+                                                
+                            if new_total_i <= kapasitas_kontainer and new_total_j <= kapasitas_kontainer:
+                                # hitung objective sebelum dan setelah swap, terima hanya jika after < before
+                                before_obj = calculate_waste_squared(kontainer, kapasitas_kontainer)
+    
+                                # lakukan swap sementara
+                                kontainer[i][index_i]['barang'] = barang_j_temp
+                                kontainer[j][index_j]['barang'] = barang_i_temp
+    
+                                after_obj = calculate_waste_squared(kontainer, kapasitas_kontainer)
+    
+                                if after_obj < before_obj:
+                                    # terima swap secara permanen 
+                                    improvement_found = True
+                                    total_accepted_swaps += 1
+                                    obj_history.append(after_obj)
+                                    if verbose:
+                                        print(f"[!!!Swap Accepted!!!]: Swapped {barang_i_temp['id']} ↔ {barang_j_temp['id']} (Obj {before_obj} → {after_obj})")
+                                    current_iteration = 0
+                                else:
+                                    # revert swap karena objektif global tidak membaik
+                                    kontainer[i][index_i]['barang'] = barang_i_temp
+                                    kontainer[j][index_j]['barang'] = barang_j_temp
                             else:
-                                # revert swap karena objektif global tidak membaik
-                                kontainer[i][index_i]['barang'] = barang_i_temp
-                                kontainer[j][index_j]['barang'] = barang_j_temp
+                                break
                         else:
                             break
-                    else:
-                        break
-
-#hitung waktu
-end_time = time.time()
-duration_seconds = end_time - start_time
-
-final_state = copy.deepcopy(kontainer)
-final_objective = obj_history[-1] if len(obj_history) > 0 else calculate_waste_squared(final_state, kapasitas_kontainer)
-iterations_until_stop = total_attempts  # jumlah percobaan evaluasi dilakukan
-swaps_accepted = total_accepted_swaps
-
-print("\n" + "="*60)
-print("HASIL PENYIMPANAN BARANG DALAM KONTAINER (STATE AKHIR)")
-print("="*60)
-
-for idx, container in enumerate(final_state):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_tempnfo = item['barang']
-        print(f"  - ID: {barang_i_tempnfo['id']}, Ukuran: {barang_i_tempnfo['ukuran']} kg/m³")
-        total_ukuran += barang_i_tempnfo['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
-
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(final_state)}")
-print("="*60)
-
-# summary
-print(f"Durasi proses pencarian: {duration_seconds:.4f} detik")
-print(f"Jumlah percobaan swap (evaluasi): {iterations_until_stop}")
-print(f"Jumlah swap diterima (perbaikan): {swaps_accepted}")
-print(f"Nilai objective awal (sum unused^2): {initial_objective}")
-print(f"Nilai objective akhir (sum unused^2): {final_objective}")
-print(f"Jumlah langkah perbaikan yang tercatat (history length - 1): {len(obj_history)-1}")
+        
+        if stopped_early:
+            break
+    
+    return total_attempts, total_attempts, total_accepted_swaps, stopped_early
+
+# mode 'steepest': setiap langkah mencari swap antar kontainer terbaik secara global. Barang
+# diratakan menjadi slot (kontainer, indeks) dan swap hanya menukar isi dua slot, jadi kontainer
+# tiap slot tidak pernah berubah. Dengan u = sisa kapasitas dan d = s_a - s_b, swap slot a
+# (kontainer p) dengan slot b (kontainer q) mengubah sum(unused^2) sebesar
+#     delta = 2d(u_p - u_q + d),   feasible jika u_p + d >= 0 dan u_q - d >= 0.
+# Untuk a tetap dan ukuran s_b tetap, delta linear terhadap u_q: kalau d > 0 yang terbaik adalah
+# u_q terbesar, kalau d < 0 u_q terkecil (dan feasibility-nya juga paling longgar di situ). Jadi
+# cukup broadcast (u_p, s_a) unik terhadap tiap ukuran barang yang berbeda beserta u_q max/min-nya,
+# dan argmin matriks itu sama dengan argmin semua pasangan swap. Pasangan dalam kontainer yang sama
+# (u_q = u_p) selalu delta = 2d^2 >= 0, sehingga tidak pernah terpilih. Kontainer overflow (hanya
+# berisi satu barang oversized) tidak pernah bisa swap secara feasible, jadi diabaikan.
+def find_best_swap(ukuran, slot_bin, unused, chunk_elements):
+    import numpy as np
+    
+    slot_u = unused[slot_bin]
+    valid  = np.flatnonzero(slot_u >= 0)
+    if len(valid) < 2:
+        return 0, None, 0
+    size_v = ukuran[valid]
+    u_v    = slot_u[valid]
+    
+    # kolom: tiap ukuran berbeda, dengan slot ber-u terkecil dan terbesar
+    order      = np.lexsort((u_v, size_v))
+    size_sort  = size_v[order]
+    starts     = np.flatnonzero(np.r_[True, size_sort[1:] != size_sort[:-1]])
+    ends       = np.r_[starts[1:], len(order)] - 1
+    col_size   = size_sort[starts]
+    col_min_u  = u_v[order[starts]]
+    col_max_u  = u_v[order[ends]]
+    col_min_at = valid[order[starts]]
+    col_max_at = valid[order[ends]]
+    
+    # baris: pasangan (u_p, s_a) unik
+    row_key, row_first = np.unique(u_v.astype(np.int64) * (int(col_size[-1]) + 1) + size_v, return_index=True)
+    row_size = size_v[row_first]
+    row_u    = u_v[row_first]
+    row_at   = valid[row_first]
+    
+    best_delta = 0
+    best_pair  = None
+    columns    = len(col_size)
+    rows       = max(1, chunk_elements // columns)
+    
+    for row_start in range(0, len(row_size), rows):
+        r_size = row_size[row_start:row_start + rows, None]
+        r_u    = row_u[row_start:row_start + rows, None]
+        
+        d        = r_size - col_size[None, :]
+        u_q      = np.where(d > 0, col_max_u[None, :], col_min_u[None, :])
+        delta    = 2 * d * (r_u - u_q + d)
+        feasible = (r_u + d >= 0) & (u_q - d >= 0)
+        delta[~feasible] = 0
+        
+        flat = int(np.argmin(delta))
+        if delta.flat[flat] < best_delta:
+            best_delta = int(delta.flat[flat])
+            row, col   = divmod(flat, columns)
+            partner    = col_max_at[col] if d[row, col] > 0 else col_min_at[col]
+            best_pair  = (int(row_at[row_start + row]), int(partner))
+    
+    return best_delta, best_pair, len(row_size) * columns
 
-# plot obj value terhadap langkah swap/perbaikan
-plt.figure(figsize=(8,4))
-steps = list(range(len(obj_history)))
-plt.plot(steps, obj_history, marker='o')
-plt.title("Objective (sum of squared unused capacity) per improvement step")
-plt.xlabel("Improvement step (0 = awal)")
-plt.ylabel("Objective = sum(unused^2)")
-plt.grid(True)
+def run_steepest(kontainer, kapasitas_kontainer, obj_history, params, should_stop, verbose):
+    import numpy as np
+    
+    slots    = [(b, idx) for b, container in enumerate(kontainer) for idx in range(len(container))]
+    slot_bin = np.fromiter((b for b, _ in slots), dtype=np.int64, count=len(slots))
+    
+    # int32 cukup selama |delta| <= 6 * kapasitas^2 muat; kalau tidak pakai int64
+    dtype    = np.int32 if 6 * kapasitas_kontainer ** 2 < 2 ** 31 else np.int64
+    ukuran   = np.fromiter((kontainer[b][idx]['barang']['ukuran'] for b, idx in slots), dtype=dtype, count=len(slots))
+    unused   = np.array([kapasitas_kontainer - calculate_kontainer_total(container) for container in kontainer], dtype=dtype)
+    
+    max_steps      = params['max_steps']
+    chunk_elements = params['chunk_elements']
+    total_steps    = 0
+    total_attempts = 0
+    stopped_early  = False
+    
+    while max_steps is None or total_steps < max_steps:
+        if should_stop is not None and should_stop():
+            stopped_early = True
+            break
+        
+        best_delta, best_pair, evaluated = find_best_swap(ukuran, slot_bin, unused, chunk_elements)
+        total_attempts += evaluated
+        if best_pair is None:   # tidak ada swap yang menurunkan objective: local optimum
+            break
+        
+        a, b           = best_pair
+        (p, idx_a)     = slots[a]
+        (q, idx_b)     = slots[b]
+        d              = ukuran[a] - ukuran[b]
+        unused[p]     += d
+        unused[q]     -= d
+        ukuran[a], ukuran[b] = ukuran[b], ukuran[a]
+        
+        barang_a = kontainer[p][idx_a]['barang']
+        barang_b = kontainer[q][idx_b]['barang']
+        kontainer[p][idx_a]['barang'] = barang_b
+        kontainer[q][idx_b]['barang'] = barang_a
+        
+        total_steps += 1
+        obj_history.append(obj_history[-1] + best_delta)
+        if verbose:
+            print(f"[Step {total_steps}]: Swapped {barang_a['id']} ↔ {barang_b['id']} (Obj {obj_history[-2]} → {obj_history[-1]})")
+    
+    return total_steps, total_attempts, total_steps, stopped_early
 
-plt.tight_layout()
-plt.show()
-plt.close()
+def solve(instance, params=None, should_stop=None):
+    params              = {**DEFAULT_PARAMS, **(params or {})}
+    rng                 = random.Random(params['seed'])
+    verbose             = params['verbose']
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+    
+    if params['mode'] not in MODES:
+        raise ValueError(f"Unknown mode '{params['mode']}', choose one of {MODES}")
+    
+    # state awal: random spawn (default), ffd, atau bfd
+    kontainer = create_initial_solution(instance['barang'], kapasitas_kontainer, params['initial_strategy'], rng=rng)
+    
+    if verbose:
+        print_kontainer(kontainer, kapasitas_kontainer, "SPAWN BARANG DALAM KONTAINER (STATE AWAL)")
+    
+    # snapshot state awal dalam bentuk array (tanpa deepcopy dict per barang), hanya kalau diminta
+    # karena BinPackingSolution butuh numpy
+    initial_state = None
+    if params['keep_initial_state']:
+        from Solution import BinPackingSolution
+        initial_state = BinPackingSolution.from_kontainer(kontainer, kapasitas_kontainer)
+    
+    # inisialisasi variabel
+    obj_history = [calculate_waste_squared(kontainer, kapasitas_kontainer)]
+    start_time = time.time()
+    
+    # swap 1-1 tidak mengubah jumlah kontainer, jadi cukup dicek sekali di awal
+    lower_bound         = resolve_lower_bound(instance, params['lower_bound'])
+    reached_lower_bound = lower_bound is not None and count_used_bins(kontainer) <= lower_bound
+    
+    if reached_lower_bound:
+        iterations, total_attempts, total_accepted_swaps, stopped_early = 0, 0, 0, False
+    elif params['mode'] == 'steepest':
+        iterations, total_attempts, total_accepted_swaps, stopped_early = run_steepest(
+            kontainer, kapasitas_kontainer, obj_history, params, should_stop, verbose)
+    else:
+        iterations, total_attempts, total_accepted_swaps, stopped_early = run_first_improvement(
+            kontainer, kapasitas_kontainer, obj_history, params, should_stop, verbose)
+    
+    #hitung waktu
+    end_time = time.time()
+    duration_seconds = end_time - start_time
+    
+    return Result(
+        algorithm      = 'Steepest Ascent Hill-Climbing',
+        kontainer      = kontainer,
+        objective      = obj_history[-1],
+        K              = count_used_bins(kontainer),
+        execution_time = duration_seconds,
+        iterations     = iterations,
+        evaluations    = total_attempts,
+        history        = obj_history,
+        lower_bound    = lower_bound,
+        extra          = {
+            'initial_state'       : initial_state,
+            'accepted_swaps'      : total_accepted_swaps,
+            'stopped_early'       : stopped_early,
+            'reached_lower_bound' : reached_lower_bound,
+        },
+    )
+
+def plot_history(obj_history):
+    import matplotlib.pyplot as plt
+    
+    # plot obj value terhadap langkah swap/perbaikan
+    plt.figure(figsize=(8,4))
+    steps = list(range(len(obj_history)))
+    plt.plot(steps, obj_history, marker='o')
+    plt.title("Objective (sum of squared unused capacity) per improvement step")
+    plt.xlabel("Improvement step (0 = awal)")
+    plt.ylabel("Objective = sum(unused^2)")
+    plt.grid(True)
+    
+    plt.tight_layout()
+    plt.show()
+    plt.close()
 
 # visual obj func
 def plot_state(kontainer_state, kapas, title):
+    import matplotlib.pyplot as plt
+    
     fig = plt.figure(figsize=(10,5))
     ax = fig.add_subplot(1,1,1)
 
@@ -258,5 +338,42 @@ def plot_state(kontainer_state, kapas, title):
     plt.show()
     plt.close()
 
-plot_state(initial_state, kapasitas_kontainer, "State Awal: Penyebaran Barang per Kontainer (Random Spawn)")
-plot_state(final_state, kapasitas_kontainer, "State Akhir: Setelah Hill-Climbing (Final)")
+def main():
+    show_plot = not pop_flag(sys.argv, '--no-plot')
+    
+    if len(sys.argv) > 1:
+        json_filename = sys.argv[1]
+    else:
+        json_filename = 'case1.json'  
+    
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+    mode             = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_PARAMS['mode']
+    
+    instance = load_instance(json_filename, 'HillClimbingSteepest.py')
+    print_instance(instance)
+    
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+    result              = solve(instance, {'initial_strategy': initial_strategy, 'mode': mode, 'keep_initial_state': show_plot})
+    obj_history         = result.history
+    
+    print_kontainer(result.kontainer, kapasitas_kontainer, "HASIL PENYIMPANAN BARANG DALAM KONTAINER (STATE AKHIR)")
+    
+    # summary
+    print(f"Durasi proses pencarian: {result.execution_time:.4f} detik")
+    print(f"Mode: {mode}")
+    print(f"Jumlah percobaan swap (evaluasi): {result.evaluations}")
+    print(f"Jumlah swap diterima (perbaikan): {result.extra['accepted_swaps']}")
+    print(f"Nilai objective awal (sum unused^2): {obj_history[0]}")
+    print(f"Nilai objective akhir (sum unused^2): {result.objective}")
+    print(f"Jumlah langkah perbaikan yang tercatat (history length - 1): {len(obj_history)-1}")
+    print_gap(result)
+    
+    if not show_plot:
+        return
+    
+    plot_history(obj_history)
+    plot_state(result.extra['initial_state'].to_kontainer(), kapasitas_kontainer, "State Awal: Penyebaran Barang per Kontainer (Random Spawn)")
+    plot_state(result.kontainer, kapasitas_kontainer, "State Akhir: Setelah Hill-Climbing (Final)")
+
+if __name__ == "__main__":
+    main()
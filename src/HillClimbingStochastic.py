@@ -1,83 +1,25 @@
 import random
-import json
 import sys
+import time
+from Anytime import BestSoFar
+from Moves import MoveGenerator
+from Neighborhood import SwapNeighborhood
+from Initializer import create_initial_solution
+from Solver import (Result, count_used_bins, load_instance, pop_flag, pop_option, print_gap, print_instance, print_kontainer,
+                    resolve_lower_bound)
 
-import os
-script_dir = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PARAMS = {
+    'initial_strategy' : 'random',   # random | ffd | bfd
+    'max_iterations'   : 10,         # batas percobaan neighbor berturut-turut tanpa perbaikan
+    'moves'            : None,       # None = swap 1-1 lama; atau tuple jenis move dari Moves.MOVE_TYPES
+    'time_limit'       : None,       # detik; kalau diisi: mode anytime (lihat solve)
+    'kick_size'        : 5,          # mode anytime: jumlah swap acak untuk keluar dari local optimum
+    'lower_bound'      : 'auto',     # berhenti jika jumlah kontainer terpakai sudah <= lower bound ('auto' = Bounds, None = mati)
+    'seed'             : None,
+    'verbose'          : True,
+}
 
-if len(sys.argv) > 1:
-    json_filename = sys.argv[1]
-else:
-    json_filename = 'case1.json'    
-
-json_path = os.path.join(script_dir, json_filename)
-
-try:
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-    print(f"Using JSON file: {json_filename}")
-except FileNotFoundError:
-    print(f"Error: {json_filename} not found!")
-    print("Usage: python3 HillClimbingStochastic.py [json_filename]")
-    print("Example: python3 HillClimbingStochastic.py case2.json")
-    sys.exit(1)
-
-# Variable Library
-kapasitas_kontainer   = data['kapasitas_kontainer']  # kapasitas kontainer
-barang                = data['barang'].copy()         # ID Barang 
-jumlah_barang         = len(barang)                   # Jumlah Barang 
-kontainer             = []                            # Kontainer 
-kontainer_id          = 0                             # ID Kontainer 
-
-print(f"Loaded data from JSON file:")
-print(f"Kapasitas kontainer: {kapasitas_kontainer} kg/m³")
-print(f"Jumlah barang: {jumlah_barang}")
-print(f"Barang: {[f"{item['id']}({item['ukuran']})" for item in barang]}")
-
-kontainer.append([])
-kontainer_space_left = kapasitas_kontainer
-
-while True:
-    if len(barang) == 0:
-        break
-        
-    random_index   = random.randint(0, len(barang) - 1)
-    random_barang  = barang[random_index]
-
-    if random_barang['ukuran'] <= kontainer_space_left:
-        kontainer[kontainer_id].append({
-            'barang': random_barang
-        })
-        
-        kontainer_space_left -= random_barang['ukuran']
-        barang.pop(random_index)
-
-    else:
-        kontainer_id += 1
-        kontainer.append([])
-        kontainer_space_left = kapasitas_kontainer
-
-print("\n" + "="*60)
-print("SPAWN BARANG DALAM KONTAINER")
-print("="*60)
-
-for idx, container in enumerate(kontainer):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_tempnfo = item['barang']
-        print(f"  - ID: {barang_i_tempnfo['id']}, Ukuran: {barang_i_tempnfo['ukuran']} kg/m³")
-        total_ukuran += barang_i_tempnfo['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
-
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(kontainer)}")
-print("="*60)
+STOP_CHECK_INTERVAL = 16   # should_stop() / deadline dicek tiap sekian kandidat
 
 # Helper function untuk Hill Climbing Algorithm
 def calculate_kontainer_total(kontainer):
@@ -94,78 +36,273 @@ def calculate_unused(kontainer, kapasitas):
         total_unused += unused
     return total_unused
 
-current_iteration = 0
-max_iterations    = 10
-improvement_found   = True
+def calculate_waste_squared(kontainer, kapasitas):
+    total = 0
+    for container in kontainer:
+        unused = kapasitas - calculate_kontainer_total(container)
+        total += unused ** 2
+    return total
 
-while improvement_found and current_iteration < max_iterations:
-    improvement_found  = False
+# swap acak (tanpa cek perbaikan) yang tidak membuat kontainer overflow; versi "reheat" untuk hill
+# climbing. Generator: setiap swap di-yield tepat setelah diterapkan, supaya pemanggil bisa mencatatnya
+# (BestSoFar) sebelum swap berikutnya mengubah state.
+def kick(kontainer, kapasitas, neighborhood, kick_size, rng):
+    applied = 0
+    for _ in range(kick_size * 10):   # kandidat yang overflow dilewati, jadi beri jatah percobaan
+        if applied >= kick_size:
+            break
+        i, j, index_i, index_j = neighborhood.sample(rng)
+        barang_i = kontainer[i][index_i]['barang']
+        barang_j = kontainer[j][index_j]['barang']
+        if (calculate_kontainer_total(kontainer[i]) - barang_i['ukuran'] + barang_j['ukuran'] <= kapasitas and
+                calculate_kontainer_total(kontainer[j]) - barang_j['ukuran'] + barang_i['ukuran'] <= kapasitas):
+            kontainer[i][index_i]['barang'] = barang_j
+            kontainer[j][index_j]['barang'] = barang_i
+            applied += 1
+            yield i, index_i, j, index_j
 
-    possible_swaps = []
-    for i in range(len(kontainer)):
-        for j in range (i + 1, len(kontainer)):
-            for index_i in range(len(kontainer[i])):
-                for index_j in range(len(kontainer[j])):
-                    possible_swaps.append((i, j, index_i, index_j))
-                    
-    random.shuffle(possible_swaps) # pemilihan neighbor random
+def calculate_move_delta(move, kapasitas):
+    # delta waste² O(1) dari total lama/baru; kontainer yang dihapus tidak lagi menyumbang waste
+    delta = 0
+    for b, old_total, new_total in zip(move.bins, move.old_totals, move.new_totals):
+        new_waste = 0 if b in move.emptied else (kapasitas - new_total) ** 2
+        delta    += new_waste - (kapasitas - old_total) ** 2
+    return delta
+
+# Hill climbing dengan move dari Moves (param `moves`): move acak diterima kalau waste² turun, dan
+# search berhenti setelah max_iterations usulan berturut-turut tanpa perbaikan. Kontainer yang kosong
+# langsung dihapus, jadi jumlah kontainer bisa turun. Di mode anytime kick memakai move acak yang sama.
+def run_compound(kontainer, kapasitas, generator, params, rng, should_stop, deadline, best, obj_history,
+                 lower_bound, verbose):
+    max_iterations    = params['max_iterations']
     current_iteration = 0
+    total_attempts    = 0
+    accepted_moves    = 0
+    kicks             = 0
+    stopped_early     = False
+    reached_lower_bound = lower_bound is not None and count_used_bins(kontainer) <= lower_bound
     
-    for current_swap in possible_swaps:
-        if current_iteration >= max_iterations: 
-            break
+    while not reached_lower_bound and len(kontainer) > 1:
+        if current_iteration >= max_iterations:
+            if deadline is None:
+                break
+            # local optimum sebelum deadline: kick lalu lanjut hill climbing
+            applied = 0
+            for _ in range(params['kick_size'] * 10):   # sampel yang tidak feasible dilewati, jadi beri jatah percobaan
+                if applied >= params['kick_size']:
+                    break
+                move = generator.propose()
+                if move is None:
+                    continue
+                obj_history.append(obj_history[-1] + calculate_move_delta(move, kapasitas))
+                best.record_move(kontainer, generator.apply(move, keep_undo=True), obj_history[-1])
+                applied += 1
+            kicks += 1
+            current_iteration = 0
+            if verbose:
+                print(f"[KICK] {kicks}: waste² {obj_history[-1]} (terbaik {best.objective})")
         
-        i, j, index_i, index_j = current_swap
-              
-        current_total_i = calculate_kontainer_total(kontainer[i])
+        if total_attempts % STOP_CHECK_INTERVAL == 0:
+            if should_stop is not None and should_stop():
+                stopped_early = True
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        
+        current_iteration += 1
+        total_attempts    += 1
+        move = generator.propose()
+        if move is None:   # overflow / barang kurang
+            continue
+        
+        delta = calculate_move_delta(move, kapasitas)
+        if delta >= 0:
+            continue
+        
+        undo = generator.apply(move, keep_undo=deadline is not None)
+        accepted_moves += 1
+        obj_history.append(obj_history[-1] + delta)
+        if deadline is not None:
+            best.record_move(kontainer, undo, obj_history[-1])
+        if move.emptied and lower_bound is not None:
+            reached_lower_bound = count_used_bins(kontainer) <= lower_bound
+        if verbose:
+            print(f"[!!!{move.kind}!!!]: {len(move.transfers)} barang dipindah, {len(move.emptied)} kontainer dihapus (Waste² berubah {delta})")
+        current_iteration = 0
+    
+    return total_attempts, accepted_moves, kicks, stopped_early, reached_lower_bound
+
+# Mode anytime (time_limit diisi): begitu search berhenti di local optimum (max_iterations percobaan
+# tanpa perbaikan), state di-kick dengan beberapa swap acak lalu hill climbing dilanjutkan sampai
+# deadline yang dihitung sejak solve() dipanggil. Yang dikembalikan selalu state terbaik (waste²
+# terkecil) yang pernah ditemui.
+def solve(instance, params=None, should_stop=None):
+    solve_start         = time.perf_counter()
+    params              = {**DEFAULT_PARAMS, **(params or {})}
+    rng                 = random.Random(params['seed'])
+    verbose             = params['verbose']
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+    
+    # state awal: random spawn (default), ffd, atau bfd
+    kontainer = create_initial_solution(instance['barang'], kapasitas_kontainer, params['initial_strategy'], rng=rng)
+    
+    if verbose:
+        print_kontainer(kontainer, kapasitas_kontainer, "SPAWN BARANG DALAM KONTAINER")
+    
+    start_time        = time.time()
+    current_iteration = 0
+    max_iterations    = params['max_iterations']
+    improvement_found = True
+    neighborhood      = SwapNeighborhood(kontainer)
+    total_attempts    = 0
+    accepted_swaps    = 0
+    stopped_early     = False
+    obj_history       = [calculate_waste_squared(kontainer, kapasitas_kontainer)]
+    
+    # swap 1-1 tidak mengubah jumlah kontainer, jadi cukup dicek sekali di awal
+    lower_bound         = resolve_lower_bound(instance, params['lower_bound'])
+    reached_lower_bound = lower_bound is not None and count_used_bins(kontainer) <= lower_bound
+    
+    # mode anytime
+    deadline            = solve_start + params['time_limit'] if params['time_limit'] is not None else None
+    best                = BestSoFar(kontainer, obj_history[-1])
+    kicks               = 0
+    timed_out           = False
+    
+    if params['moves'] is not None:
+        generator         = MoveGenerator(kontainer, kapasitas_kontainer, params['moves'], rng=rng)
+        total_attempts, accepted_swaps, kicks, stopped_early, reached_lower_bound = run_compound(
+            kontainer, kapasitas_kontainer, generator, params, rng, should_stop, deadline, best, obj_history,
+            lower_bound, verbose)
+        improvement_found = False   # loop swap di bawah dilewati
+    
+    while not reached_lower_bound and improvement_found and current_iteration < max_iterations:
+        improvement_found  = False
+    
+        current_iteration = 0
         
-        if current_total_i < kapasitas_kontainer:
-            current_iteration += 1
-            print(f"Iteration {current_iteration}")
+        for candidate, current_swap in enumerate(neighborhood.permutation(rng)): # pemilihan neighbor random
+            if current_iteration >= max_iterations: 
+                break
             
-            current_total_j = calculate_kontainer_total(kontainer[j])
+            if candidate % STOP_CHECK_INTERVAL == 0:
+                if should_stop is not None and should_stop():
+                    stopped_early = True
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    timed_out = True
+                    break
             
-            barang_i_temp   = kontainer[i][index_i]['barang']
-            barang_j_temp   = kontainer[j][index_j]['barang']
-                             
-            new_total_i     = current_total_i - barang_i_temp['ukuran'] + barang_j_temp['ukuran']
-            new_total_j     = current_total_j - barang_j_temp['ukuran'] + barang_i_temp['ukuran']
-
-            if new_total_i <= kapasitas_kontainer and new_total_j <= kapasitas_kontainer: # Overflow countermeassure
-                if (kapasitas_kontainer - new_total_i) < (kapasitas_kontainer - current_total_i): # Change Here untuk Sideways Modifcation, Current Algorithm is Steepest (Neighbor [>]BETTER[>] Current)
-                    kontainer[i][index_i]['barang'] = barang_j_temp
-                    kontainer[j][index_j]['barang'] = barang_i_temp
-                    improvement_found = True
-                    print(f"[!!!Swap!!!]: Swapped {barang_i_temp['id']} ↔ {barang_j_temp['id']} (Waste reduced by {new_total_i - current_total_i})")
-                    current_iteration = 0
+            i, j, index_i, index_j = current_swap
+                  
+            current_total_i = calculate_kontainer_total(kontainer[i])
+            
+            if current_total_i < kapasitas_kontainer:
+                current_iteration += 1
+                total_attempts    += 1
+                if verbose:
+                    print(f"Iteration {current_iteration}")
+                
+                current_total_j = calculate_kontainer_total(kontainer[j])
                 
-                else: # local maxima break
+                barang_i_temp   = kontainer[i][index_i]['barang']
+                barang_j_temp   = kontainer[j][index_j]['barang']
+                                 
+                new_total_i     = current_total_i - barang_i_temp['ukuran'] + barang_j_temp['ukuran']
+                new_total_j     = current_total_j - barang_j_temp['ukuran'] + barang_i_temp['ukuran']
+    
+                if new_total_i <= kapasitas_kontainer and new_total_j <= kapasitas_kontainer: # Overflow countermeassure
+                    if (kapasitas_kontainer - new_total_i) < (kapasitas_kontainer - current_total_i): # Change Here untuk Sideways Modifcation, Current Algorithm is Steepest (Neighbor [>]BETTER[>] Current)
+                        kontainer[i][index_i]['barang'] = barang_j_temp
+                        kontainer[j][index_j]['barang'] = barang_i_temp
+                        improvement_found = True
+                        accepted_swaps   += 1
+                        obj_history.append(obj_history[-1]
+                                           + (kapasitas_kontainer - new_total_i) ** 2 + (kapasitas_kontainer - new_total_j) ** 2
+                                           - (kapasitas_kontainer - current_total_i) ** 2 - (kapasitas_kontainer - current_total_j) ** 2)
+                        if deadline is not None:
+                            best.record_swap(kontainer, i, index_i, j, index_j, obj_history[-1])
+                        if verbose:
+                            print(f"[!!!Swap!!!]: Swapped {barang_i_temp['id']} ↔ {barang_j_temp['id']} (Waste reduced by {new_total_i - current_total_i})")
+                        current_iteration = 0
+                    
+                    else: # local maxima break
+                        continue
+                    
+                else: # overflow break
                     continue
                 
-            else: # overflow break
+            else: # full break
                 continue
-            
-        else: # full break
-            continue
-
-print("\n" + "="*60)
-print("HASIL PENYIMPANAN BARANG DALAM KONTAINER")
-print("="*60)
+        
+        if stopped_early or timed_out:
+            break
+        
+        # local optimum sebelum deadline: kick lalu lanjut hill climbing
+        local_optimum = not improvement_found or current_iteration >= max_iterations
+        if deadline is not None and local_optimum and len(neighborhood) > 0:
+            for i, index_i, j, index_j in kick(kontainer, kapasitas_kontainer, neighborhood, params['kick_size'], rng):
+                obj_history.append(calculate_waste_squared(kontainer, kapasitas_kontainer))
+                best.record_swap(kontainer, i, index_i, j, index_j, obj_history[-1])
+            kicks             += 1
+            improvement_found  = True
+            current_iteration  = 0
+            if verbose:
+                print(f"[KICK] {kicks}: waste² {obj_history[-1]} (terbaik {best.objective})")
+    
+    end_time  = time.time()
+    objective = obj_history[-1]
+    if deadline is not None and best.objective < objective:
+        kontainer = best.restore(kontainer)
+        objective = best.objective
+    
+    return Result(
+        algorithm      = 'Stochastic Hill-Climbing',
+        kontainer      = kontainer,
+        objective      = objective,
+        K              = count_used_bins(kontainer),
+        execution_time = end_time - start_time,
+        iterations     = total_attempts,
+        evaluations    = total_attempts,
+        history        = obj_history,
+        lower_bound    = lower_bound,
+        extra          = {
+            'accepted_swaps'      : accepted_swaps,   # dengan `moves`: jumlah move yang diterima
+            'moves'               : params['moves'],
+            'time_limit'          : params['time_limit'],
+            'kicks'               : kicks,
+            'stopped_early'       : stopped_early,
+            'reached_lower_bound' : reached_lower_bound,
+        },
+    )
 
-for idx, container in enumerate(kontainer):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_tempnfo = item['barang']
-        print(f"  - ID: {barang_i_tempnfo['id']}, Ukuran: {barang_i_tempnfo['ukuran']} kg/m³")
-        total_ukuran += barang_i_tempnfo['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
+def main():
+    pop_flag(sys.argv, '--no-plot')   # tidak ada grafik, flag diterima supaya seragam dengan CLI lain
+    time_limit = pop_option(sys.argv, '--time-limit')   # mis. --time-limit 0.2 (detik, mode anytime)
+    moves      = pop_option(sys.argv, '--moves')        # mis. --moves swap,relocate,empty_bin
+    
+    if len(sys.argv) > 1:
+        json_filename = sys.argv[1]
+    else:
+        json_filename = 'case1.json'    
+    
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+    
+    instance = load_instance(json_filename, 'HillClimbingStochastic.py')
+    print_instance(instance)
+    
+    try:
+        result = solve(instance, {'initial_strategy': initial_strategy,
+                                  'time_limit': float(time_limit) if time_limit is not None else None,
+                                  'moves': tuple(moves.split(',')) if moves is not None else None})
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    
+    print_kontainer(result.kontainer, instance['kapasitas_kontainer'], "HASIL PENYIMPANAN BARANG DALAM KONTAINER")
+    print_gap(result)
+    if result.extra['time_limit'] is not None:
+        print(f"Kicks: {result.extra['kicks']} (time limit {result.extra['time_limit']} s, waste² terbaik {result.objective})")
 
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(kontainer)}")
-print("="*60)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,48 @@
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import numpy as np
 import json
+import math
 import random
 import sys
 import os
 import time
+from Neighborhood import SwapNeighborhood
+from Initializer import create_initial_solution
+from Solver import Result, count_used_bins, pop_flag, pop_option, resolve_lower_bound
+from Trace import DEFAULT_KEYFRAME_INTERVAL, SnapshotTrace
+
+DEFAULT_PARAMS = {
+    'initial_strategy'  : 'random',   # random | ffd | bfd
+    'seed'              : None,
+    'verbose'           : True,
+    'keyframe_interval' : DEFAULT_KEYFRAME_INTERVAL,   # jarak keyframe di trace snapshot
+    'lower_bound'       : 'auto',     # hanya untuk laporan gap; visualizer selalu menjalankan search penuh
+}
+
+MAX_BAR_LABELS = 60   # di atas jumlah kontainer ini teks per bar saling tumpuk dan hanya memperlambat render
 
 class HillClimbingStochasticVisualizer:
-    def __init__(self, json_filename='case1.json'):
+    # instance (dict hasil load JSON) boleh langsung diberikan supaya bisa dipakai tanpa file
+    def __init__(self, json_filename='case1.json', initial_strategy='random', instance=None, seed=None, verbose=True,
+                 keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
         self.json_filename = json_filename
-        self.snapshots = []
+        self.initial_strategy = initial_strategy
+        self.rng = random.Random(seed)
+        self.verbose = verbose
+        self.keyframe_interval = keyframe_interval
+        self.trace = None   # SnapshotTrace: state awal + move yang diterima
         self.objective_values = []
         self.iteration_count = 0
+        self.total_improvements = 0
+        self.evaluations = 0
+        
+        if instance is not None:
+            self.kapasitas = instance['kapasitas_kontainer']
+            self.barang = instance['barang'].copy()
+        else:
+            self.load_data()
         
-        self.load_data()
-        self.run_hill_climbing_stochastic()
+        start_time = time.time()
+        self.final_kontainer = self.run_hill_climbing_stochastic()
+        self.execution_time = time.time() - start_time
         
     def load_data(self):
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -40,27 +67,7 @@ class HillClimbingStochasticVisualizer:
             sys.exit(1)
     
     def create_initial_solution(self):
-        kontainer = []
-        kontainer_id = 0
-        barang_copy = self.barang.copy()
-        
-        kontainer.append([])
-        sisa_kapasitas = self.kapasitas
-        
-        while barang_copy:
-            random_index = random.randint(0, len(barang_copy) - 1)
-            barang_terpilih = barang_copy[random_index]
-            
-            if barang_terpilih['ukuran'] <= sisa_kapasitas:
-                kontainer[kontainer_id].append(barang_terpilih)
-                sisa_kapasitas -= barang_terpilih['ukuran']
-                barang_copy.pop(random_index)
-            else:
-                kontainer_id += 1
-                kontainer.append([])
-                sisa_kapasitas = self.kapasitas
-        
-        return kontainer
+        return create_initial_solution(self.barang, self.kapasitas, self.initial_strategy, wrap=False, rng=self.rng)
     
     def calculate_objective(self, kontainer):
         if not kontainer:
@@ -87,38 +94,16 @@ class HillClimbingStochasticVisualizer:
         
         return objective
     
-    def get_neighbors(self, kontainer):
-        neighbors = []
-        
-        for i in range(len(kontainer)):
-            for j in range(i + 1, len(kontainer)):
-                for idx_i in range(len(kontainer[i])):
-                    for idx_j in range(len(kontainer[j])):
-                        neighbor = [container.copy() for container in kontainer]
-                        
-                        item_i = neighbor[i][idx_i]
-                        item_j = neighbor[j][idx_j]
-                        
-                        used_i = sum(item['ukuran'] for item in neighbor[i])
-                        used_j = sum(item['ukuran'] for item in neighbor[j])
-                        
-                        new_used_i = used_i - item_i['ukuran'] + item_j['ukuran']
-                        new_used_j = used_j - item_j['ukuran'] + item_i['ukuran']
-                        
-                        if new_used_i <= self.kapasitas and new_used_j <= self.kapasitas:
-                            neighbor[i][idx_i] = item_j
-                            neighbor[j][idx_j] = item_i
-                            neighbors.append(neighbor)
-        
-        return neighbors
+    def calculate_loads(self, kontainer):
+        return [self.calculate_kontainer_total(container) for container in kontainer]
     
-    def save_snapshot(self, kontainer, iteration, objective):
-        snapshot = {
-            'iteration': iteration,
-            'kontainer': [container.copy() for container in kontainer],
-            'objective': objective
-        }
-        self.snapshots.append(snapshot)
+    # snapshot disimpan sebagai move (delta), bukan copy semua kontainer; frame dibangun ulang
+    # dari trace saat visualisasi
+    def save_snapshot(self, kontainer, iteration, objective, move=None):
+        if move is None:
+            self.trace = SnapshotTrace(kontainer, objective, iteration, self.keyframe_interval)
+        else:
+            self.trace.record_move(*move, objective, iteration)
         self.objective_values.append(objective)
     
     def calculate_kontainer_total(self, kontainer):
@@ -128,76 +113,72 @@ class HillClimbingStochasticVisualizer:
         return total
     
     def calculate_objective_function(self, kontainer, kapasitas):
+        loads = self.calculate_loads(kontainer)
+        
+        total_overflow    = sum(load - kapasitas for load in loads if load > kapasitas)  # penalty overflow
+        sum_squared_loads = sum(load * load for load in loads)   # kontainer kosong menyumbang 0
+        
+        return self.calculate_objective_from_loads(len(kontainer), total_overflow, sum_squared_loads, kapasitas)
+    
+    # POF dari komponen yang di-cache (K = banyak container, Σ load²), sehingga snapshot setelah swap
+    # tidak perlu menjumlah ulang semua kontainer; Σ (load/C)² = Σ load² / C²
+    def calculate_objective_from_loads(self, K, total_overflow, sum_squared_loads, kapasitas):
         P_OVERFLOW = 1000
         P_BINS     = 1.0
         P_DENSITY  = 0.1
         
-        K = len(kontainer)  # banyak container
-        
-        total_overflow          = 0
-        sum_squared_fill_ratios = 0
-        
-        for container in kontainer:
-            total_size = self.calculate_kontainer_total(container)
-            
-            if total_size > kapasitas:  # penalty overflow
-                overflow        = total_size - kapasitas
-                total_overflow += overflow
-            
-            if len(container) > 0:  
-                fill_ratio               = total_size / kapasitas
-                sum_squared_fill_ratios += fill_ratio ** 2
-        
+        sum_squared_fill_ratios = sum_squared_loads / (kapasitas * kapasitas)
         cost = (P_OVERFLOW * total_overflow) + (P_BINS * K) - (P_DENSITY * sum_squared_fill_ratios)
         
         return cost
-
+    
+    def log(self, message):
+        if self.verbose:
+            print(message)
     
     def run_hill_climbing_stochastic(self):
-        print("\n" + "="*50)
-        print("HILL CLIMBING STOCHASTIC")
-        print("="*50)
+        self.log("\n" + "="*50)
+        self.log("HILL CLIMBING STOCHASTIC")
+        self.log("="*50)
         
         kontainer_awal = self.create_initial_solution()
         
         initial_tersisa = self.calculate_objective_function(kontainer_awal, self.kapasitas)
         self.save_snapshot(kontainer_awal, 0, initial_tersisa)
         
-        print(f"Jumlah kontainer: {len(kontainer_awal)}")
+        self.log(f"Jumlah kontainer: {len(kontainer_awal)}")
        
         current_iteration = 0
         max_iterations = 10
         improvement_found = True
         total_improvements = 0
+        neighborhood = SwapNeighborhood(kontainer_awal)
+        # load per kontainer + komponen objective, di-update saat swap diterima
+        loads             = self.calculate_loads(kontainer_awal)
+        total_overflow    = sum(load - self.kapasitas for load in loads if load > self.kapasitas)
+        sum_squared_loads = sum(load * load for load in loads)
         
         while improvement_found and current_iteration < max_iterations:
             improvement_found = False
         
-            possible_swaps = []
-            for i in range(len(kontainer_awal)):
-                for j in range(i + 1, len(kontainer_awal)):
-                    for index_i in range(len(kontainer_awal[i])):
-                        for index_j in range(len(kontainer_awal[j])):
-                            possible_swaps.append((i, j, index_i, index_j))
-            
-            if not possible_swaps:
+            if len(neighborhood) == 0:
                 break
             
-            random.shuffle(possible_swaps) 
             current_iteration = 0
             
-            for current_swap in possible_swaps:
+            for current_swap in neighborhood.permutation(self.rng):
                 if current_iteration >= max_iterations: 
                     break
                 
                 i, j, index_i, index_j = current_swap
                 
-                current_total_i = self.calculate_kontainer_total(kontainer_awal[i])  
+                current_total_i = loads[i]
                 if current_total_i < self.kapasitas:  
                     current_iteration += 1
-                    print(f"Iteration {current_iteration}")
+                    self.evaluations += 1
+                    self.log(f"Iteration {current_iteration}")
                     
-                    current_total_j = self.calculate_kontainer_total(kontainer_awal[j])
+                    current_total_j = loads[j]
                   
                     barang_i_temp = kontainer_awal[i][index_i]
                     barang_j_temp = kontainer_awal[j][index_j]
@@ -209,14 +190,21 @@ class HillClimbingStochasticVisualizer:
                         if (self.kapasitas - new_total_i) < (self.kapasitas - current_total_i): 
                             kontainer_awal[i][index_i] = barang_j_temp
                             kontainer_awal[j][index_j] = barang_i_temp
+                            # swap diterima hanya kalau kedua kontainer tidak overflow sesudahnya
+                            total_overflow    -= max(current_total_i - self.kapasitas, 0) + max(current_total_j - self.kapasitas, 0)
+                            sum_squared_loads += (new_total_i * new_total_i + new_total_j * new_total_j
+                                                  - current_total_i * current_total_i - current_total_j * current_total_j)
+                            loads[i] = new_total_i
+                            loads[j] = new_total_j
                             improvement_found = True
                             total_improvements += 1
                             
                             tersisa_reduction = current_total_i - new_total_i
-                            print(f"[!!!Swap!!!]: Swapped {barang_i_temp['id']} ↔ {barang_j_temp['id']} (tersisa reduced by {tersisa_reduction})")
+                            self.log(f"[!!!Swap!!!]: Swapped {barang_i_temp['id']} ↔ {barang_j_temp['id']} (tersisa reduced by {tersisa_reduction})")
                             
-                            current_tersisa = self.calculate_objective_function(kontainer_awal, self.kapasitas)
-                            self.save_snapshot(kontainer_awal, current_iteration, current_tersisa)
+                            current_tersisa = self.calculate_objective_from_loads(len(kontainer_awal), total_overflow,
+                                                                                  sum_squared_loads, self.kapasitas)
+                            self.save_snapshot(kontainer_awal, current_iteration, current_tersisa, (i, index_i, j, index_j))
                             
                             current_iteration = 0
                         
@@ -230,101 +218,270 @@ class HillClimbingStochasticVisualizer:
                     continue
         
         self.iteration_count = current_iteration
-        print(f"\nTotal Iterations: {current_iteration}")
-        print(f"Total Improvements: {total_improvements}")
+        self.total_improvements = total_improvements
+        self.log(f"\nTotal Iterations: {current_iteration}")
+        self.log(f"Total Improvements: {total_improvements}")
         
         return kontainer_awal
     
-    def create_visualization(self):
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6), num=f'Hill Climbing Stochastic - {self.json_filename}')
+    def efficiency_color(self, efficiency):
+        if efficiency >= 0.9:
+            return '#2ecc71'
+        elif efficiency >= 0.7:
+            return '#f39c12'
+        elif efficiency >= 0.5:
+            return '#e67e22'
+        return '#e74c3c'
+    
+    # semua artist (line, bar, text) dibuat sekali; tiap frame hanya nilai/warna/teksnya yang diubah
+    def build_artists(self, ax1, ax2):
+        from matplotlib.ticker import FuncFormatter
+        
+        objectives = self.objective_values
+        kontainer  = self.trace.frame(0)
+        
+        ax1.set_title(f'Hill Climbing Stochastic - {self.json_filename}', fontsize=10)
+        ax1.set_xlabel('Iterasi', fontsize=9)
+        ax1.set_ylabel('Objective Function: ', fontsize=9)
+        ax1.grid(True, alpha=0.3)
+        ax1.tick_params(axis='both', which='major', labelsize=8)
+        ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{int(x)}'))
+        
+        # batas sumbu tetap (wajib untuk blitting, sumbu tidak di-autoscale per frame)
+        low, high = min(objectives), max(objectives)
+        padding   = (high - low) * 0.1 or max(abs(high) * 0.01, 1)
+        ax1.set_xlim(-0.5, max(1, len(objectives) - 1) + 0.5)
+        ax1.set_ylim(low - padding, high + padding)
+        
+        line,     = ax1.plot([], [], 'b-', linewidth=2, marker='o')
+        improved  = ax1.scatter([], [], color='green', s=60, zorder=5)
+        info      = ax1.text(0.02, 0.98, '', transform=ax1.transAxes, fontsize=9, va='top',
+                             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
+        
+        positions = range(1, len(kontainer) + 1)
+        bars      = ax2.bar(positions, [0] * len(kontainer), alpha=0.8)
+        capacity  = ax2.axhline(y=self.kapasitas, color='red', linestyle='--', linewidth=2, 
+                                label=f'Kapasitas ({self.kapasitas})')
+        labeled     = positions if len(kontainer) <= MAX_BAR_LABELS else []
+        fill_texts  = [ax2.text(position, 0, '', ha='center', va='bottom', fontweight='bold', fontsize=6)
+                       for position in labeled]
+        label_texts = [ax2.text(position, 0, '', ha='center', va='center', fontsize=6,
+                                color='white', fontweight='bold')
+                       for position in labeled]
+        
+        ax2.set_title(f'Status Kontainer (Total: {len(kontainer)})', fontsize=10)
+        ax2.set_xlabel('ID Kontainer', fontsize=9)
+        ax2.set_ylabel('Kapasitas Terpakai', fontsize=9)
+        ax2.set_ylim(0, self.kapasitas * 1.10)
+        legend = ax2.legend(fontsize=8, loc='upper right')   # loc tetap: 'best' memindai semua bar tiap draw
+        ax2.grid(True, alpha=0.3)
+        ax2.tick_params(axis='both', which='major', labelsize=8)
+        
+        improvement_frames = [i for i in range(1, len(objectives)) if objectives[i] < objectives[i - 1]]
+        
+        return {
+            'line'               : line,
+            'improved'           : improved,
+            'info'               : info,
+            'bars'               : list(bars),
+            'capacity'           : capacity,
+            'fill_texts'         : fill_texts,
+            'label_texts'        : label_texts,
+            'improvement_frames' : improvement_frames,
+            # garis kapasitas statis, jadi tidak ikut di-blit (animated) dan tetap di bawah legend
+            'all'                : [line, improved, info, *bars, *fill_texts, *label_texts],
+            # urutan gambar ulang per area di export: bar bisa menimpa garis kapasitas/legend, jadi
+            # keduanya digambar lagi setelah bar sesuai zorder
+            'layers'             : [line, improved, info, *bars, capacity, *fill_texts, *label_texts, legend],
+            'overlays'           : [capacity, legend],
+        }
+    
+    def update_history(self, artists, frame, snapshot):
+        objectives = self.objective_values
         
-        fig.canvas.manager.set_window_title(f'Visualisasi Hill Climbing Stochastic')
+        artists['line'].set_data(range(frame + 1), objectives[:frame + 1])
+        artists['improved'].set_offsets([(i, objectives[i]) for i in artists['improvement_frames'] if i <= frame]
+                                        or [(float('nan'), float('nan'))])
+        artists['info'].set_text(f"Iterasi: {snapshot['iteration']} | Objective Function: {snapshot['objective']:.2f}")
+    
+    def update_bin(self, artists, b, container):
+        used       = self.calculate_kontainer_total(container)
+        efficiency = used / self.kapasitas
+        bar        = artists['bars'][b]
+        bar.set_height(used)
+        bar.set_color(self.efficiency_color(efficiency))
+        
+        if not artists['fill_texts']:
+            return
+        
+        fill_text  = artists['fill_texts'][b]
+        label_text = artists['label_texts'][b]
+        fill_text.set_y(used + self.kapasitas * 0.005)
+        fill_text.set_text(f'{efficiency * 100:.0f}%\n(tersisa:{self.kapasitas - used:.0f})' if used > 0 else '')
+        
+        item_ids = [item['id'] for item in container]
+        label_text.set_y(used / 2)
+        label_text.set_text(('\n'.join(item_ids) if len(item_ids) <= 3 else f'{len(item_ids)} items')
+                            if used > self.kapasitas * 0.15 else '')
+    
+    def bin_artists(self, artists, b):
+        if not artists['fill_texts']:
+            return [artists['bars'][b]]
+        return [artists['bars'][b], artists['fill_texts'][b], artists['label_texts'][b]]
+    
+    def update_artists(self, artists, frame):
+        snapshot = self.trace.snapshot(frame)
+        self.update_history(artists, frame, snapshot)
+        for b, container in enumerate(snapshot['kontainer']):
+            self.update_bin(artists, b, container)
         
-        def animate(frame):
-            if frame >= len(self.snapshots):
-                return
+        return artists['all']
+    
+    # output=None: jendela interaktif (blitting). output='run.gif' / 'run.mp4': render offscreen dengan
+    # Agg langsung ke file, tanpa display
+    def create_visualization(self, output=None, fps=2, dpi=100):
+        # matplotlib hanya di-import saat visualisasi benar-benar diminta
+        if output is not None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
             
-            snapshot = self.snapshots[frame]
-            kontainer = snapshot['kontainer']
-            objective = snapshot['objective']
-            iteration = snapshot['iteration']
+            fig = Figure(figsize=(8, 6), dpi=dpi)
+            FigureCanvasAgg(fig)
+            ax1, ax2 = fig.subplots(2, 1)
+        else:
+            import matplotlib.pyplot as plt
+            import matplotlib.animation as animation
             
-            ax1.clear()
-            ax2.clear()
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 6), num=f'Hill Climbing Stochastic - {self.json_filename}')
+            fig.canvas.manager.set_window_title(f'Visualisasi Hill Climbing Stochastic')
+        
+        artists = self.build_artists(ax1, ax2)
+        fig.tight_layout(pad=1.5)
+        fig.subplots_adjust(hspace=0.4)
+        
+        if output is not None:
+            self.export_animation(fig, artists, output, fps)
+            return None
+        
+        ani = animation.FuncAnimation(fig, lambda frame: self.update_artists(artists, frame),
+                                      frames=len(self.trace), init_func=lambda: artists['all'],
+                                      interval=800, repeat=True, blit=True)
+        plt.show()
+        
+        return ani
+    
+    # blitting manual di canvas Agg: bagian statis (sumbu, tick, grid) dirender sekali sebagai
+    # background. Satu move hanya mengubah dua kontainer, jadi tiap frame cukup memulihkan background
+    # di area yang berubah (extent lama + baru artist kontainer tsb) lalu menggambar ulang artist yang
+    # beririsan dengan area itu, di-clip ke area tsb. Garis kapasitas + legend tidak ikut background
+    # dan digambar setelah bar di area tsb. Grafik objective (ax1) selalu digambar ulang.
+    def render_frames(self, fig, artists):
+        from matplotlib.transforms import Bbox
+        
+        canvas = fig.canvas
+        for artist in artists['all']:
+            artist.set_animated(True)
+        # overlay tidak masuk background supaya tidak tergambar dua kali (antialiasing/alpha menumpuk)
+        for artist in artists['overlays']:
+            artist.set_visible(False)
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        for artist in artists['overlays']:
+            artist.set_visible(True)
+        renderer   = canvas.get_renderer()
+        height     = fig.bbox.height
+        
+        def snap(bbox):
+            # bulatkan ke grid pixel supaya area restore dan area clip persis sama
+            return Bbox.from_extents(math.floor(bbox.x0), math.floor(bbox.y0), math.ceil(bbox.x1), math.ceil(bbox.y1))
+        
+        def restore(bbox):
+            # restore_region memakai koordinat pixel (inklusif) dengan origin di kiri atas; xy = posisi
+            # pojok region background (seluruh figure) sehingga area di-restore di tempat yang sama
+            extents = (int(bbox.x0), int(height - bbox.y1), int(bbox.x1) - 1, int(height - bbox.y0) - 1)
+            canvas.restore_region(background, extents, (0, 0))
+        
+        def draw_clipped(artist, bbox):
+            clip_box, clip_on = artist.get_clip_box(), artist.get_clip_on()
+            clip = Bbox.intersection(bbox, clip_box) if clip_on and clip_box is not None else bbox
+            if clip is None:
+                return
+            artist.set_clip_box(clip)
+            artist.set_clip_on(True)
+            fig.draw_artist(artist)
+            artist.set_clip_box(clip_box)
+            artist.set_clip_on(clip_on)
+        
+        history_axes = artists['line'].axes.bbox
+        history      = [artists['line'], artists['improved'], artists['info']]
+        for frame in range(len(self.trace)):
+            snapshot = self.trace.snapshot(frame)
             
-            ax1.plot(range(frame + 1), self.objective_values[:frame + 1], 'b-', linewidth=2, marker='o')
-            ax1.set_title(f'Hill Climbing Stochastic - {self.json_filename}', fontsize=10)
-            ax1.set_xlabel('Iterasi', fontsize=9)
-            ax1.set_ylabel('Objective Function: ', fontsize=9)
-            ax1.grid(True, alpha=0.3)
-            ax1.tick_params(axis='both', which='major', labelsize=8)
+            if frame == 0:
+                self.update_artists(artists, frame)
+                canvas.restore_region(background)
+                for artist in artists['layers']:
+                    fig.draw_artist(artist)
+                yield canvas.buffer_rgba()
+                continue
             
-            ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x)}'))
+            # kotak info (bbox round) bisa menonjol sedikit di atas sumbu
+            info_before = artists['info'].get_window_extent(renderer)
+            self.update_history(artists, frame, snapshot)
+            info_after  = artists['info'].get_window_extent(renderer)
+            dirty       = [snap(Bbox.union([history_axes, info_before.padded(10), info_after.padded(10)]))]
             
-            ax1.text(0.02, 0.98, f'Iterasi: {iteration} | Objective Function: {objective:.2f}', 
-                    transform=ax1.transAxes, fontsize=9, va='top',
-                    bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.7))
+            bin_i, _, bin_j, _ = self.trace.move(frame)
+            for b in {bin_i, bin_j}:
+                before = [artist.get_window_extent(renderer) for artist in self.bin_artists(artists, b)]
+                self.update_bin(artists, b, snapshot['kontainer'][b])
+                after  = [artist.get_window_extent(renderer) for artist in self.bin_artists(artists, b)]
+                dirty.append(snap(Bbox.union(before + after).padded(2)))
             
-            if frame > 0:
-                for i in range(1, frame + 1):
-                    if self.objective_values[i] < self.objective_values[i-1]:
-                        ax1.scatter(i, self.objective_values[i], color='green', s=60, zorder=5)
+            # extent scatter tidak memperhitungkan ukuran marker, jadi artist grafik objective digambar
+            # di setiap area yang menyentuh area grafik (label kontainer overflow bisa menjorok ke ax1);
+            # artist lain hanya kalau beririsan (diberi margin untuk garis tepi + antialiasing)
+            for bbox in dirty:
+                restore(bbox)
+                touches_history = bbox.overlaps(dirty[0])
+                for artist in artists['layers']:
+                    if any(artist is h for h in history):
+                        if touches_history:
+                            draw_clipped(artist, bbox)
+                    elif artist.get_window_extent(renderer).padded(2).overlaps(bbox):
+                        draw_clipped(artist, bbox)
             
-            if kontainer:
-                fills = []
-                labels = []
-                colors = []
-                
-                for i, container in enumerate(kontainer):
-                    used = self.calculate_kontainer_total(container)
-                    fills.append(used)
-                    
-                    item_ids = [item['id'] for item in container]
-                    labels.append('\n'.join(item_ids) if len(item_ids) <= 3 else f'{len(item_ids)} items')
-                    
-                    efficiency = used / self.kapasitas
-                    if efficiency >= 0.9:
-                        colors.append('#2ecc71') 
-                    elif efficiency >= 0.7:
-                        colors.append('#f39c12') 
-                    elif efficiency >= 0.5:
-                        colors.append('#e67e22')  
-                    else:
-                        colors.append('#e74c3c')  
-                
-                bars = ax2.bar(range(1, len(fills) + 1), fills, color=colors, alpha=0.8)
-                ax2.axhline(y=self.kapasitas, color='red', linestyle='--', linewidth=2, 
-                           label=f'Kapasitas ({self.kapasitas})')
-                
-                for i, bar in enumerate(bars):
-                    efficiency = (fills[i] / self.kapasitas) * 100
-                    tersisa = self.kapasitas - fills[i]
-                    if efficiency > 0:
-                        ax2.text(bar.get_x() + bar.get_width()/2, fills[i] + self.kapasitas*0.005,
-                                f'{efficiency:.0f}%\n(tersisa:{tersisa:.0f})', ha='center', va='bottom', 
-                                fontweight='bold', fontsize=6)
-                
-                    if fills[i] > self.kapasitas * 0.15:
-                        ax2.text(bar.get_x() + bar.get_width()/2, fills[i]/2,
-                                labels[i], ha='center', va='center', fontsize=6, 
-                                color='white', fontweight='bold')
+            yield canvas.buffer_rgba()
+    
+    def export_animation(self, fig, artists, output, fps):
+        width, height = fig.canvas.get_width_height()
+        extension     = os.path.splitext(output)[1].lower()
+        
+        if extension == '.gif':
+            from PIL import Image
             
-            ax2.set_title(f'Status Kontainer (Total: {len(kontainer)})', fontsize=10)
-            ax2.set_xlabel('ID Kontainer', fontsize=9)
-            ax2.set_ylabel('Kapasitas Terpakai', fontsize=9)
-            ax2.set_ylim(0, self.kapasitas * 1.10)
-            ax2.legend(fontsize=8)
-            ax2.grid(True, alpha=0.3)
-            ax2.tick_params(axis='both', which='major', labelsize=8)
-        
-        ani = animation.FuncAnimation(fig, animate, frames=len(self.snapshots), 
-                                     interval=800, repeat=True, blit=False)
-        
-        plt.tight_layout(pad=1.5)
-        plt.subplots_adjust(hspace=0.4)
-        plt.show()
+            images = [Image.frombuffer('RGBA', (width, height), bytes(buffer), 'raw', 'RGBA', 0, 1).convert('RGB')
+                      for buffer in self.render_frames(fig, artists)]
+            images[0].save(output, save_all=True, append_images=images[1:], duration=int(1000 / fps), loop=0)
+        elif extension == '.mp4':
+            import shutil
+            import subprocess
+            
+            if shutil.which('ffmpeg') is None:
+                raise RuntimeError("Export mp4 butuh ffmpeg; pakai output .gif atau install ffmpeg")
+            command = ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                       '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                       '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', output]
+            with subprocess.Popen(command, stdin=subprocess.PIPE) as process:
+                for buffer in self.render_frames(fig, artists):
+                    process.stdin.write(buffer)
+                process.stdin.close()
+                if process.wait() != 0:
+                    raise RuntimeError(f"ffmpeg gagal menulis {output}")
+        else:
+            raise ValueError(f"Unknown video format '{extension}', use .gif or .mp4")
         
-        return ani
+        self.log(f"Animation saved: {output} ({len(self.trace)} frames)")
     
     def print_summary(self):
         print("\n" + "="*60)
@@ -333,7 +490,7 @@ class HillClimbingStochasticVisualizer:
         print(f"File: {self.json_filename}")
         print(f"Kapasitas kontainer: {self.kapasitas}")
         print(f"Total iterasi: {self.iteration_count}")
-        print(f"Total snapshots: {len(self.snapshots)}")
+        print(f"Total snapshots: {len(self.trace)} ({self.trace.nbytes / 1024:.1f} KB trace)")
         
         if self.objective_values:
             initial_tersisa = self.objective_values[0]
@@ -346,7 +503,7 @@ class HillClimbingStochasticVisualizer:
             print(f"Objective terbaik: {best_tersisa:.2f} (iterasi {best_iteration})")
             print(f"Total improvement: {initial_tersisa - final_tersisa:.2f}")
         
-        final_solution = self.snapshots[-1]['kontainer']
+        final_solution = self.trace.frame(-1)
         efficiencies = []
         for container in final_solution:
             used = self.calculate_kontainer_total(container)
@@ -354,20 +511,55 @@ class HillClimbingStochasticVisualizer:
             efficiencies.append(efficiency)
         
         print(f"\nJumlah kontainer: {len(final_solution)}")
-        print(f"Efisiensi rata-rata: {np.mean(efficiencies):.1f}%")
+        print(f"Efisiensi rata-rata: {sum(efficiencies) / len(efficiencies):.1f}%")
         print(f"Efisiensi tertinggi: {max(efficiencies):.1f}%")
         print(f"Efisiensi terendah: {min(efficiencies):.1f}%")
         print("="*60)
 
+def solve(instance, params=None, should_stop=None):
+    params     = {**DEFAULT_PARAMS, **(params or {})}
+    visualizer = HillClimbingStochasticVisualizer(initial_strategy=params['initial_strategy'], instance=instance,
+                                                  seed=params['seed'], verbose=params['verbose'],
+                                                  keyframe_interval=params['keyframe_interval'])
+    kontainer  = [[{'barang': item} for item in container] for container in visualizer.final_kontainer]
+    
+    return Result(
+        algorithm      = 'Stochastic Hill-Climbing (Visual)',
+        kontainer      = kontainer,
+        objective      = visualizer.objective_values[-1],
+        K              = count_used_bins(kontainer),
+        execution_time = visualizer.execution_time,
+        iterations     = visualizer.iteration_count,
+        evaluations    = visualizer.evaluations,
+        history        = visualizer.objective_values,
+        lower_bound    = resolve_lower_bound(instance, params['lower_bound']),
+        extra          = {
+            'trace'          : visualizer.trace,
+            'accepted_swaps' : visualizer.total_improvements,
+        },
+    )
+
 def main():
+    show_plot = not pop_flag(sys.argv, '--no-plot')
+    output    = pop_option(sys.argv, '--export')   # mis. --export run.gif (render offscreen, tanpa display)
+    
     if len(sys.argv) > 1:
         json_filename = sys.argv[1]
     else:
         json_filename = 'case1.json'
     
-    visualizer = HillClimbingStochasticVisualizer(json_filename)
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+    
+    visualizer = HillClimbingStochasticVisualizer(json_filename, initial_strategy)
     visualizer.print_summary()  
-    ani = visualizer.create_visualization()
+    if output is not None:
+        try:
+            visualizer.create_visualization(output)
+        except (ValueError, RuntimeError) as error:
+            print(f"Error: {error}")
+            sys.exit(1)
+    elif show_plot:
+        ani = visualizer.create_visualization()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import random
+
+from ResidualIndex import FirstFitTree, BestFitIndex
+
+# Strategi state awal yang bisa dipilih oleh semua algoritma:
+#   random : spawn random seperti sebelumnya (barang acak, buka kontainer baru kalau tidak muat)
+#   ffd    : First-Fit-Decreasing, O(n log n) dengan FirstFitTree
+#   bfd    : Best-Fit-Decreasing dengan BestFitIndex (bucket per residual + bisect atas residual yang ada),
+#            biaya tidak bergantung kapasitas
+#
+# Hasilnya memakai layout kontainer lama: list kontainer berisi {'barang': {...}},
+# atau langsung {...} kalau wrap=False (layout visualizer).
+
+STRATEGIES = ('random', 'ffd', 'bfd')
+
+def create_initial_solution(barang, kapasitas, strategy='random', wrap=True, rng=random):
+    if strategy == 'random':
+        groups = random_spawn(barang, kapasitas, rng)
+    elif strategy == 'ffd':
+        groups = first_fit_decreasing(barang, kapasitas)
+    elif strategy == 'bfd':
+        groups = best_fit_decreasing(barang, kapasitas)
+    else:
+        raise ValueError(f"Unknown initial strategy '{strategy}', choose one of {STRATEGIES}")
+
+    if wrap:
+        return [[{'barang': item} for item in group] for group in groups]
+    return groups
+
+def random_spawn(barang, kapasitas, rng=random):
+    kontainer            = [[]]
+    kontainer_space_left = kapasitas
+    barang_copy          = list(barang)
+
+    while barang_copy:
+        random_index  = rng.randint(0, len(barang_copy) - 1)
+        random_barang = barang_copy[random_index]
+
+        # barang yang lebih besar dari kapasitas tetap dimasukkan ke kontainer kosong
+        if random_barang['ukuran'] <= kontainer_space_left or not kontainer[-1]:
+            kontainer[-1].append(random_barang)
+            kontainer_space_left -= random_barang['ukuran']
+
+            # hapus O(1): timpa dengan elemen terakhir lalu pop
+            barang_copy[random_index] = barang_copy[-1]
+            barang_copy.pop()
+        else:
+            kontainer.append([])
+            kontainer_space_left = kapasitas
+
+    return kontainer
+
+def first_fit_decreasing(barang, kapasitas):
+    kontainer      = []
+    residual_index = FirstFitTree([], reserve=len(barang))
+
+    for item in sorted(barang, key=lambda item: item['ukuran'], reverse=True):
+        b = residual_index.first_fit(item['ukuran'])
+        if b == -1:
+            b = residual_index.append(kapasitas - item['ukuran'])
+            kontainer.append([])
+        else:
+            residual_index.update(b, residual_index.residual(b) - item['ukuran'])
+        kontainer[b].append(item)
+
+    return kontainer
+
+def best_fit_decreasing(barang, kapasitas):
+    kontainer      = []
+    residual_index = BestFitIndex(kapasitas)
+
+    for item in sorted(barang, key=lambda item: item['ukuran'], reverse=True):
+        b, residual = residual_index.pop_best_fit(item['ukuran'])
+        if b is None:
+            b        = len(kontainer)
+            residual = kapasitas
+            kontainer.append([])
+        kontainer[b].append(item)
+        residual_index.add(b, residual - item['ukuran'])
+
+    return kontainer
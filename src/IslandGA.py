@@ -0,0 +1,160 @@
+import multiprocessing as mp
+import queue
+import sys
+import time
+
+import numpy as np
+
+import Bounds
+from Solver import load_instance, pop_flag, receive_from_workers
+
+# Island model GA: beberapa populasi GeneticAlgorithm berevolusi di proses terpisah dengan
+# operator yang sama (parent_crossover, mutate_offspring, repair_offspring). Setiap
+# `migration_interval` generasi, individu elite dikirim ke island tetangga sesuai topologi dan
+# menggantikan individu terburuk di island tujuan. Migrasi asinkron: island tidak menunggu
+# tetangganya, migran yang sudah sampai langsung dipakai pada generasi berikutnya.
+
+DEFAULT_ISLAND_PARAMS = {
+    'islands'            : 4,
+    'migration_interval' : 10,
+    'migrants'           : 2,        # jumlah elite yang dikirim ke tiap tetangga
+    'topology'           : 'ring',   # ring | bidirectional | complete
+}
+
+TOPOLOGIES = ('ring', 'bidirectional', 'complete')
+
+def island_neighbors(island, islands, topology):
+    if islands < 2:
+        return []
+    if topology == 'ring':
+        return [(island + 1) % islands]
+    if topology == 'bidirectional':
+        return sorted({(island + 1) % islands, (island - 1) % islands})
+    if topology == 'complete':
+        return [other for other in range(islands) if other != island]
+    raise ValueError(f"Unknown topology '{topology}', choose one of {TOPOLOGIES}")
+
+def run_island(island, instance, ga_params, island_params, inboxes, result_queue, stop_event):
+    import GeneticAlgorithm
+
+    inbox     = inboxes[island]
+    outboxes  = [inboxes[neighbor] for neighbor in
+                 island_neighbors(island, island_params['islands'], island_params['topology'])]
+    migrants  = island_params['migrants']
+    interval  = island_params['migration_interval']
+    sent      = 0
+    received  = 0
+
+    # jangan tahan proses saat exit hanya karena migran terakhir belum dibaca tetangga
+    for outbox in outboxes:
+        outbox.cancel_join_thread()
+
+    def migrate(iteration, population, fitness_scores):
+        nonlocal sent, received
+        if iteration == 0 or iteration % interval != 0:
+            return False
+
+        elite = population[np.argsort(fitness_scores, kind='stable')[:migrants]].copy()
+        for outbox in outboxes:
+            outbox.put(elite)
+            sent += len(elite)
+
+        arrivals = []
+        while True:
+            try:
+                arrivals.append(inbox.get_nowait())
+            except queue.Empty:
+                break
+        if not arrivals:
+            return False
+
+        # migran menggantikan individu terburuk (elite lokal di baris 0 tidak pernah diganti)
+        immigrants = np.concatenate(arrivals)[:len(population) - 1]
+        worst      = np.argsort(fitness_scores, kind='stable')[::-1]
+        worst      = worst[worst != 0][:len(immigrants)]
+        population[worst] = immigrants
+        received += len(immigrants)
+        return True
+
+    result = GeneticAlgorithm.solve(instance, ga_params, should_stop=stop_event.is_set, on_generation=migrate)
+    if result.extra['reached_lower_bound']:
+        stop_event.set()
+
+    result.extra['island']             = island
+    result.extra['migrants_sent']      = sent
+    result.extra['migrants_received']  = received
+    result_queue.put(result)
+
+def run_island_model(instance, params=None, island_params=None, base_seed=0):
+    island_params = {**DEFAULT_ISLAND_PARAMS, **(island_params or {})}
+    islands       = island_params['islands']
+    island_neighbors(0, islands, island_params['topology'])   # validasi topologi lebih awal
+
+    lower_bound  = Bounds.lower_bound(instance)
+
+    start_time   = time.time()
+    inboxes      = [mp.Queue() for _ in range(islands)]
+    result_queue = mp.Queue()
+    stop_event   = mp.Event()
+
+    processes = []
+    for island in range(islands):
+        ga_params = {'lower_bound': lower_bound, **(params or {}), 'seed': base_seed + island, 'verbose': False}
+        process   = mp.Process(target=run_island,
+                               args=(island, instance, ga_params, island_params, inboxes, result_queue, stop_event))
+        process.start()
+        processes.append(process)
+
+    # ambil semua hasil dulu sebelum join, supaya tidak deadlock pada queue yang penuh
+    results = [receive_from_workers(result_queue, processes) for _ in range(islands)]
+    for process in processes:
+        process.join()
+
+    results.sort(key=lambda result: result.extra['island'])
+    best = min(results, key=lambda result: (result.objective, result.K))
+
+    return {
+        'islands'         : islands,
+        'topology'        : island_params['topology'],
+        'lower_bound'     : lower_bound,
+        'best_result'     : best,
+        'island_results'  : results,
+        'wall_time'       : time.time() - start_time,
+    }
+
+def main():
+    pop_flag(sys.argv, '--no-plot')   # tidak ada grafik, flag diterima supaya seragam dengan CLI lain
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 IslandGA.py [json_filename] [islands] [migration_interval] [ring|bidirectional|complete] [random|ffd|bfd]")
+        print("Example: python3 IslandGA.py case6.json 8 10 ring")
+        sys.exit(1)
+
+    json_filename = sys.argv[1]
+    island_params = {
+        'islands'            : int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ISLAND_PARAMS['islands'],
+        'migration_interval' : int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_ISLAND_PARAMS['migration_interval'],
+        'topology'           : sys.argv[4] if len(sys.argv) > 4 else DEFAULT_ISLAND_PARAMS['topology'],
+    }
+    initial_strategy = sys.argv[5] if len(sys.argv) > 5 else 'random'
+
+    instance = load_instance(json_filename)
+    try:
+        summary = run_island_model(instance, {'initial_strategy': initial_strategy}, island_params)
+    except (ValueError, RuntimeError) as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    best = summary['best_result']
+
+    print("\n" + "="*60)
+    print(f"ISLAND MODEL GA - {summary['islands']} island, topologi {summary['topology']}")
+    print("="*60)
+    for result in summary['island_results']:
+        print(f"Island {result.extra['island']}: fitness={result.objective:.2f}, K={result.K}, "
+              f"generasi={result.iterations}, migran kirim/terima={result.extra['migrants_sent']}/{result.extra['migrants_received']}")
+    print(f"\nBest Fitness: {best.objective:.2f} (island {best.extra['island']}, K={best.K}, lower bound={summary['lower_bound']})")
+    print(f"Wall time: {summary['wall_time']:.4f} seconds")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+import random
+from itertools import islice
+
+from BinFiller import fill_bin
+from PairSumIndex import PairSumIndex
+
+# Move generator untuk local search yang bisa mengubah jumlah kontainer. Swap 1-1 saja tidak pernah
+# mengubah len(kontainer), jadi K tidak bisa turun. Move yang tersedia:
+#
+#   swap      : 1 barang kontainer a <-> 1 barang kontainer b (sama dengan swap lama)
+#   relocate  : 1 barang dipindah dari a ke b
+#   swap21    : 2 barang dari a <-> 1 barang dari b
+#   swap12    : 1 barang dari a <-> 2 barang dari b
+#   empty_bin : semua barang kontainer yang paling kosong (dari beberapa sampel) dipindah ke kontainer
+#               lain yang muat; move hanya dibuat kalau semua barang dapat tempat
+#   pair21    : 1 barang dari kontainer a ditukar dengan pasangan barang dari kontainer lain yang jumlahnya
+#               paling mendekati (ukuran barang + sisa kapasitas a), dicari lewat PairSumIndex
+#   pair22    : sama dengan pair21, tapi yang dilepas kontainer a juga sepasang barang
+#   fill_bin  : sisa kapasitas kontainer acak diisi seoptimal mungkin (subset-sum exact, BinFiller)
+#               dengan barang dari beberapa kontainer donor acak
+#
+# Setiap move hanya berisi daftar perpindahan barang dan total baru kontainer yang tersentuh, jadi
+# delta objective bisa dihitung O(1) dari total lama (lihat delta_* di SimulatedAnnealing /
+# HillClimbingStochastic). Move yang membuat kontainer overflow tidak pernah diusulkan. Kontainer
+# yang kosong setelah move langsung dihapus (ditimpa kontainer terakhir lalu pop, O(1)), sehingga
+# urutan kontainer bisa berubah.
+
+MOVE_TYPES = ('swap', 'relocate', 'swap21', 'swap12', 'empty_bin', 'pair21', 'pair22', 'fill_bin')
+PAIR_TYPES = ('pair21', 'pair22')   # butuh PairSumIndex
+
+EMPTY_BIN_SAMPLES = 3   # empty_bin: jumlah kontainer acak yang dibandingkan untuk memilih yang paling kosong
+EMPTY_BIN_TRIES   = 8   # empty_bin: jumlah kontainer tujuan acak yang dicoba per barang
+PAIR_CANDIDATES   = 16  # pair21/pair22: jumlah pasangan kandidat yang diperiksa per lookup
+FILL_DONORS       = 3   # fill_bin: jumlah kontainer donor acak
+
+class Move:
+    __slots__ = ('kind', 'transfers', 'bins', 'old_totals', 'new_totals', 'emptied')
+
+    def __init__(self, kind, transfers, bins, old_totals, new_totals, emptied):
+        self.kind       = kind
+        self.transfers  = transfers    # [(kontainer asal, index barang, kontainer tujuan)]
+        self.bins       = bins         # kontainer yang tersentuh (unik)
+        self.old_totals = old_totals   # total per kontainer di `bins` sebelum move
+        self.new_totals = new_totals   # total per kontainer di `bins` setelah move
+        self.emptied    = emptied      # kontainer di `bins` yang kosong (lalu dihapus) setelah move
+
+class UndoRecord:
+    # cukup untuk membatalkan satu move di list kontainer (totals / PairSumIndex tidak ikut dikembalikan): isi lama
+    # kontainer yang tersentuh + urutan penghapusan kontainer
+    __slots__ = ('saved', 'removed')
+
+    def __init__(self, saved, removed):
+        self.saved   = saved     # [(index, list barang lama)], index sebelum ada kontainer yang dihapus
+        self.removed = removed   # [(index, panjang list kontainer saat dihapus)], urut penghapusan
+
+    def undo(self, kontainer):
+        for index, length in reversed(self.removed):
+            if index == length - 1:
+                kontainer.append(None)
+            else:
+                kontainer.append(kontainer[index])
+        for index, items in self.saved:
+            kontainer[index] = items
+        return kontainer
+
+class MoveGenerator:
+    def __init__(self, kontainer, kapasitas, move_types, totals=None, rng=random):
+        unknown = [kind for kind in move_types if kind not in MOVE_TYPES]
+        if unknown or not move_types:
+            raise ValueError(f"Unknown move type(s) {unknown}, choose from {MOVE_TYPES}")
+
+        self.kontainer  = kontainer
+        self.kapasitas  = kapasitas
+        self.move_types = tuple(move_types)
+        self.rng        = rng
+        # totals boleh dibagi dengan cache objective pemanggil; apply() ikut meng-update-nya
+        self.totals     = totals if totals is not None else \
+                          [sum(entry['barang']['ukuran'] for entry in container) for container in kontainer]
+        # index pasangan hanya dibangun kalau move pair dipakai (biaya O(jumlah pasangan per kontainer))
+        self.pair_index = PairSumIndex(kontainer) if any(kind in PAIR_TYPES for kind in move_types) else None
+
+    def size(self, b, index):
+        return self.kontainer[b][index]['barang']['ukuran']
+
+    def random_bins(self):
+        K = len(self.kontainer)
+        if K < 2:
+            return None
+        a = self.rng.randrange(K)
+        b = self.rng.randrange(K - 1)
+        return a, b + (b >= a)
+
+    def propose(self):
+        # move acak yang feasible, atau None kalau sampel kali ini tidak menghasilkan move
+        kind = self.rng.choice(self.move_types)
+        return getattr(self, 'propose_' + kind)()
+
+    def propose_swap(self):
+        pair = self.random_bins()
+        if pair is None:
+            return None
+        a, b = pair
+        if not self.kontainer[a] or not self.kontainer[b]:
+            return None
+        ia, ib = self.rng.randrange(len(self.kontainer[a])), self.rng.randrange(len(self.kontainer[b]))
+        d      = self.size(b, ib) - self.size(a, ia)
+        return self.build('swap', [(a, ia, b), (b, ib, a)], {a: d, b: -d})
+
+    def propose_relocate(self):
+        pair = self.random_bins()
+        if pair is None or not self.kontainer[pair[0]]:
+            return None
+        a, b = pair
+        ia   = self.rng.randrange(len(self.kontainer[a]))
+        s    = self.size(a, ia)
+        return self.build('relocate', [(a, ia, b)], {a: -s, b: s})
+
+    def propose_swap21(self):
+        pair = self.random_bins()
+        if pair is None:
+            return None
+        a, b = pair
+        if len(self.kontainer[a]) < 2 or not self.kontainer[b]:
+            return None
+        ia1, ia2 = self.rng.sample(range(len(self.kontainer[a])), 2)
+        ib       = self.rng.randrange(len(self.kontainer[b]))
+        d        = self.size(a, ia1) + self.size(a, ia2) - self.size(b, ib)
+        return self.build('swap21', [(a, ia1, b), (a, ia2, b), (b, ib, a)], {a: -d, b: d})
+
+    def propose_swap12(self):
+        pair = self.random_bins()
+        if pair is None:
+            return None
+        b, a = pair   # cermin swap21: 1 barang dari kontainer pertama, 2 dari kontainer kedua
+        if len(self.kontainer[a]) < 2 or not self.kontainer[b]:
+            return None
+        ia1, ia2 = self.rng.sample(range(len(self.kontainer[a])), 2)
+        ib       = self.rng.randrange(len(self.kontainer[b]))
+        d        = self.size(a, ia1) + self.size(a, ia2) - self.size(b, ib)
+        return self.build('swap12', [(b, ib, a), (a, ia1, b), (a, ia2, b)], {a: -d, b: d})
+
+    def propose_empty_bin(self):
+        K = len(self.kontainer)
+        if K < 2:
+            return None
+        source = min((self.rng.randrange(K) for _ in range(EMPTY_BIN_SAMPLES)), key=self.totals.__getitem__)
+        if not self.kontainer[source]:
+            return None
+
+        # barang besar dulu (paling susah dapat tempat), tujuan first-fit dari kontainer acak
+        deltas    = {}
+        transfers = []
+        order     = sorted(range(len(self.kontainer[source])), key=lambda index: -self.size(source, index))
+        for index in order:
+            s = self.size(source, index)
+            for _ in range(EMPTY_BIN_TRIES):
+                target = self.rng.randrange(K)
+                if target != source and self.totals[target] + deltas.get(target, 0) + s <= self.kapasitas:
+                    deltas[target] = deltas.get(target, 0) + s
+                    transfers.append((source, index, target))
+                    break
+            else:
+                return None
+
+        deltas[source] = -self.totals[source]
+        return self.build('empty_bin', transfers, deltas)
+
+    def propose_pair21(self):
+        a = self.rng.randrange(len(self.kontainer))
+        if not self.kontainer[a]:
+            return None
+        ia = self.rng.randrange(len(self.kontainer[a]))
+        return self.propose_pair('pair21', a, [ia])
+
+    def propose_pair22(self):
+        a = self.rng.randrange(len(self.kontainer))
+        if len(self.kontainer[a]) < 2:
+            return None
+        return self.propose_pair('pair22', a, self.rng.sample(range(len(self.kontainer[a])), 2))
+
+    def propose_pair(self, kind, a, given):
+        # pasangan dari kontainer lain dengan jumlah di (ukuran yang dilepas, ukuran yang dilepas + sisa a]:
+        # kontainer a jadi lebih penuh tanpa overflow, dan kontainer asal pasangan pasti tidak overflow
+        released = sum(self.size(a, index) for index in given)
+        residual = self.kapasitas - self.totals[a]
+        if residual <= 0:
+            return None
+
+        candidates = list(islice(self.pair_index.candidates(released + 1, released + residual, exclude=a),
+                                 PAIR_CANDIDATES))
+        if not candidates:
+            return None
+        # jumlah terbesar (paling pas) diutamakan; kalau ada beberapa yang sama, pilih acak
+        best_size  = candidates[0][0]
+        size, b, entry, other = self.rng.choice([candidate for candidate in candidates if candidate[0] == best_size])
+
+        transfers = [(a, index, b) for index in given] + [(b, self.position(b, entry), a), (b, self.position(b, other), a)]
+        return self.build(kind, transfers, {a: size - released, b: released - size})
+
+    def propose_fill_bin(self):
+        K = len(self.kontainer)
+        if K < 2:
+            return None
+        a = self.rng.randrange(K)
+        if self.totals[a] >= self.kapasitas:
+            return None
+        donors = self.rng.sample(range(K - 1), min(FILL_DONORS, K - 1))
+        donors = [b + (b >= a) for b in donors]
+
+        filled, chosen = fill_bin(self.kontainer, self.kapasitas, a, donors, self.totals)
+        if filled == 0:
+            return None
+
+        deltas = {a: filled}
+        for b, index in chosen:
+            deltas[b] = deltas.get(b, 0) - self.size(b, index)
+        return self.build('fill_bin', [(b, index, a) for b, index in chosen], deltas)
+
+    def position(self, b, entry):
+        for index, candidate in enumerate(self.kontainer[b]):
+            if candidate is entry:
+                return index
+        raise ValueError(f"entry not found in kontainer {b}")
+
+    def build(self, kind, transfers, deltas):
+        bins       = list(deltas)
+        old_totals = [self.totals[b] for b in bins]
+        new_totals = [total + deltas[b] for total, b in zip(old_totals, bins)]
+        if any(new > self.kapasitas for new, old in zip(new_totals, old_totals) if new > old):
+            return None
+
+        # kontainer kosong setelah move: semua barangnya keluar dan tidak ada yang masuk
+        leaving   = {}
+        receiving = set()
+        for source, _, target in transfers:
+            leaving[source] = leaving.get(source, 0) + 1
+            receiving.add(target)
+        emptied = [b for b in bins if b not in receiving and leaving.get(b, 0) == len(self.kontainer[b])]
+        return Move(kind, transfers, bins, old_totals, new_totals, emptied)
+
+    def apply(self, move, keep_undo=False):
+        kontainer = self.kontainer
+        totals    = self.totals
+        saved     = [(b, kontainer[b][:]) for b in move.bins] if keep_undo else None
+
+        # ambil semua barang dulu, baru dihapus dari kontainer asal (index menurun, swap-with-last pop)
+        # supaya index di transfers tetap valid
+        entries  = [kontainer[source][index] for source, index, _ in move.transfers]
+        removals = sorted(((source, index) for source, index, _ in move.transfers), reverse=True)
+        for source, index in removals:
+            container        = kontainer[source]
+            container[index] = container[-1]
+            container.pop()
+        for entry, (_, _, target) in zip(entries, move.transfers):
+            kontainer[target].append(entry)
+        for b, total in zip(move.bins, move.new_totals):
+            totals[b] = total
+        if self.pair_index is not None:
+            for entry in entries:
+                self.pair_index.remove(entry)
+            for entry, (_, _, target) in zip(entries, move.transfers):
+                self.pair_index.add(entry, target)
+
+        # hapus kontainer yang kosong, index terbesar dulu supaya index kontainer lain di move tidak bergeser
+        removed = []
+        for b in sorted(move.emptied, reverse=True):
+            removed.append((b, len(kontainer)))
+            kontainer[b] = kontainer[-1]
+            totals[b]    = totals[-1]
+            kontainer.pop()
+            totals.pop()
+            if self.pair_index is not None and b < len(kontainer):
+                self.pair_index.relocate(b)
+
+        return UndoRecord(saved, removed) if keep_undo else None
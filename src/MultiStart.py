@@ -0,0 +1,107 @@
+import importlib
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Manager
+
+import Bounds
+from Solver import load_instance, pop_flag
+
+# Multi-start: N run independen (seed berbeda) dari satu algoritma dijalankan paralel di
+# process pool. Begitu ada worker yang mencapai lower bound (jumlah kontainer terpakai sudah
+# optimal), worker lain diberi sinyal berhenti dan run yang belum mulai dibatalkan.
+
+ALGORITHMS = {
+    'sa'         : 'SimulatedAnnealing',
+    'steepest'   : 'HillClimbingSteepest',
+    'stochastic' : 'HillClimbingStochastic',
+}
+
+def run_worker(algorithm, instance, params, seed, stop_event):
+    solver = importlib.import_module(ALGORITHMS[algorithm])
+    result = solver.solve(instance, {**params, 'seed': seed, 'verbose': False}, should_stop=stop_event.is_set)
+
+    lower_bound = params.get('lower_bound')
+    if lower_bound is not None and result.K <= lower_bound:
+        stop_event.set()
+
+    return seed, result
+
+def run_multi_start(instance, algorithm='sa', runs=8, workers=None, params=None, base_seed=0):
+    params      = dict(params or {})
+    lower_bound = Bounds.lower_bound(instance)
+    params.setdefault('lower_bound', lower_bound)
+
+    start_time = time.time()
+    results    = []
+    cancelled  = 0
+
+    with Manager() as manager, ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        stop_event = manager.Event()
+        futures    = [pool.submit(run_worker, algorithm, instance, params, base_seed + run, stop_event)
+                      for run in range(runs)]
+
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            results.append(future.result())
+
+            # lower bound tercapai: batalkan run yang belum sempat mulai (cukup sekali)
+            if stop_event.is_set() and cancelled == 0:
+                cancelled = sum(1 for pending in futures if not pending.done() and pending.cancel())
+
+    objectives = sorted(result.objective for _, result in results)
+    best_seed, best_result = min(results, key=lambda entry: (entry[1].K, entry[1].objective))
+
+    return {
+        'algorithm'           : algorithm,
+        'runs_completed'      : len(results),
+        'runs_cancelled'      : cancelled,
+        'lower_bound'         : lower_bound,
+        'reached_lower_bound' : best_result.K <= lower_bound,
+        'best_objective'      : objectives[0],
+        'median_objective'    : statistics.median(objectives),
+        'worst_objective'     : objectives[-1],
+        'best_K'              : best_result.K,
+        'best_seed'           : best_seed,
+        'best_result'         : best_result,
+        'wall_time'           : time.time() - start_time,
+    }
+
+def main():
+    pop_flag(sys.argv, '--no-plot')   # tidak ada grafik, flag diterima supaya seragam dengan CLI lain
+
+    if len(sys.argv) < 2:
+        print("Usage: python3 MultiStart.py [json_filename] [sa|steepest|stochastic] [runs] [workers] [random|ffd|bfd]")
+        print("Example: python3 MultiStart.py case6.json sa 32 8")
+        sys.exit(1)
+
+    json_filename    = sys.argv[1]
+    algorithm        = sys.argv[2] if len(sys.argv) > 2 else 'sa'
+    runs             = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    workers          = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    initial_strategy = sys.argv[5] if len(sys.argv) > 5 else 'random'
+
+    if algorithm not in ALGORITHMS:
+        print(f"Error: algoritma '{algorithm}' tidak dikenal, pilih salah satu dari {list(ALGORITHMS)}")
+        sys.exit(1)
+
+    instance = load_instance(json_filename)
+    summary  = run_multi_start(instance, algorithm, runs, workers, {'initial_strategy': initial_strategy})
+
+    print("\n" + "="*60)
+    print(f"MULTI-START {ALGORITHMS[algorithm].upper()}")
+    print("="*60)
+    print(f"Run selesai / dibatalkan: {summary['runs_completed']} / {summary['runs_cancelled']}")
+    print(f"Lower bound (L1/L2/L3): {summary['lower_bound']} kontainer")
+    print(f"Objective terbaik / median / terburuk: "
+          f"{summary['best_objective']:.2f} / {summary['median_objective']:.2f} / {summary['worst_objective']:.2f}")
+    print(f"Kontainer terbaik: {summary['best_K']} (seed {summary['best_seed']})"
+          f"{' - optimal (lower bound tercapai)' if summary['reached_lower_bound'] else ''}")
+    print(f"Wall time: {summary['wall_time']:.4f} seconds")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
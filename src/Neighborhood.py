@@ -0,0 +1,91 @@
+import random
+from bisect import bisect_right
+
+# Neighborhood swap 1-1 (i, j, index_i, index_j) dengan i < j yang TIDAK di-materialize.
+#
+# Setiap swap punya rank integer di [0, len(neighborhood)). Rank dipetakan ke swap lewat
+# prefix sum jumlah barang per kontainer, sehingga cukup O(K) memori dan O(log K) per lookup.
+# Karena swap 1-1 tidak mengubah jumlah barang per kontainer, index ini tetap valid selama
+# search hanya melakukan swap; panggil refresh() kalau isi kontainer berubah jumlahnya.
+
+class SwapNeighborhood:
+    def __init__(self, kontainer):
+        self.refresh(kontainer)
+
+    def refresh(self, kontainer):
+        sizes = [len(container) for container in kontainer]
+
+        # cum_sizes[i] = jumlah barang di kontainer 0..i-1
+        self.cum_sizes = [0]
+        for size in sizes:
+            self.cum_sizes.append(self.cum_sizes[-1] + size)
+        total_items = self.cum_sizes[-1]
+
+        # swap dengan kontainer pertama i = sizes[i] * (jumlah barang di kontainer setelah i)
+        self.cum_swaps = [0]
+        for i, size in enumerate(sizes):
+            self.cum_swaps.append(self.cum_swaps[-1] + size * (total_items - self.cum_sizes[i + 1]))
+
+        self.arrays = None   # versi numpy cum_sizes / cum_swaps, dibuat saat sample_batch() pertama
+
+    def __len__(self):
+        return self.cum_swaps[-1]
+
+    def swap_at(self, rank):
+        i = bisect_right(self.cum_swaps, rank) - 1
+
+        suffix_items     = self.cum_sizes[-1] - self.cum_sizes[i + 1]
+        index_i, offset  = divmod(rank - self.cum_swaps[i], suffix_items)
+
+        flat_j  = self.cum_sizes[i + 1] + offset
+        j       = bisect_right(self.cum_sizes, flat_j) - 1
+        index_j = flat_j - self.cum_sizes[j]
+
+        return i, j, index_i, index_j
+
+    def sample(self, rng=random):
+        return self.swap_at(rng.randrange(len(self)))
+
+    def sample_batch(self, np_rng, count):
+        # versi vektor dari swap_at untuk `count` rank acak sekaligus (np_rng: numpy Generator);
+        # hasil berupa array i, j, index_i, index_j
+        import numpy as np
+
+        if self.arrays is None:
+            self.arrays = (np.asarray(self.cum_sizes, dtype=np.int64), np.asarray(self.cum_swaps, dtype=np.int64))
+        cum_sizes, cum_swaps = self.arrays
+
+        rank = np_rng.integers(0, len(self), size=count, dtype=np.int64)
+        i    = np.searchsorted(cum_swaps, rank, side='right') - 1
+
+        suffix_items    = cum_sizes[-1] - cum_sizes[i + 1]
+        index_i, offset = np.divmod(rank - cum_swaps[i], suffix_items)
+
+        flat_j  = cum_sizes[i + 1] + offset
+        j       = np.searchsorted(cum_sizes, flat_j, side='right') - 1
+        index_j = flat_j - cum_sizes[j]
+
+        return i, j, index_i, index_j
+
+    def permutation(self, rng=random):
+        # urutan acak seluruh swap tanpa membuat list: rank di-enkripsi dengan Feistel network
+        # kecil di domain 2^bits lalu "cycle walking" sampai hasilnya < jumlah swap
+        total = len(self)
+        if total == 0:
+            return
+
+        half_bits = max(1, ((total - 1).bit_length() + 1) // 2)
+        mask      = (1 << half_bits) - 1
+        keys      = [rng.getrandbits(32) for _ in range(4)]
+
+        def encrypt(value):
+            left, right = value >> half_bits, value & mask
+            for key in keys:
+                left, right = right, left ^ ((((right ^ key) * 0x9E3779B1) >> 7) & mask)
+            return (left << half_bits) | right
+
+        for rank in range(total):
+            permuted = encrypt(rank)
+            while permuted >= total:
+                permuted = encrypt(permuted)
+            yield self.swap_at(permuted)
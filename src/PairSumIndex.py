@@ -0,0 +1,88 @@
+from bisect import bisect_left, bisect_right, insort
+
+# Index jumlah ukuran setiap pasangan barang di dalam kontainer yang sama, untuk mencari exchange
+# 2-1 / 2-2 tanpa brute force O(n⁴) antar kontainer.
+#
+#   buckets : jumlah pasangan -> {key pasangan: (entry1, entry2)}   (lookup exact, hash)
+#   sums    : jumlah pasangan yang ada, terurut                      (lookup "hampir pas", bisect)
+#
+# Barang dikenali lewat identitas entry {'barang': ...} di list kontainer, bukan index-nya, karena
+# index bergeser setiap ada barang yang keluar (swap-with-last pop). Index di-update per barang yang
+# pindah dalam O(m) (m = jumlah barang di kontainer asal/tujuan), jadi hanya valid untuk search yang
+# memindah entry (Moves.MoveGenerator), bukan swap lama yang menukar entry['barang'] in place.
+
+class PairSumIndex:
+    def __init__(self, kontainer):
+        self.kontainer = kontainer
+        self.buckets   = {}
+        self.sums      = []
+        self.location  = {}   # id(entry) -> index kontainer
+        self.pairs_of  = {}   # id(entry) -> key pasangan yang memuat entry tsb
+
+        for b, container in enumerate(kontainer):
+            for position, entry in enumerate(container):
+                self.location[id(entry)] = b
+                self.pairs_of[id(entry)] = set()
+                for other in container[:position]:
+                    self.add_pair(entry, other)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.buckets.values())
+
+    def add_pair(self, entry, other):
+        key  = (id(entry), id(other)) if id(entry) < id(other) else (id(other), id(entry))
+        size = entry['barang']['ukuran'] + other['barang']['ukuran']
+
+        bucket = self.buckets.get(size)
+        if bucket is None:
+            bucket = self.buckets[size] = {}
+            insort(self.sums, size)
+        bucket[key] = (entry, other)
+        self.pairs_of[id(entry)].add((key, size))
+        self.pairs_of[id(other)].add((key, size))
+
+    def remove(self, entry):
+        # dipanggil saat entry keluar dari kontainernya (sebelum add() di kontainer tujuan)
+        for key, size in self.pairs_of[id(entry)]:
+            partner = key[0] if key[1] == id(entry) else key[1]
+            self.pairs_of[partner].discard((key, size))
+
+            bucket = self.buckets[size]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[size]
+                del self.sums[bisect_left(self.sums, size)]
+        self.pairs_of[id(entry)] = set()
+
+    def add(self, entry, b):
+        # dipanggil setelah entry masuk ke kontainer[b]; dipasangkan dengan semua isi kontainer tsb
+        self.location[id(entry)] = b
+        self.pairs_of.setdefault(id(entry), set())
+        for other in self.kontainer[b]:
+            if other is not entry:
+                self.add_pair(entry, other)
+
+    def relocate(self, b):
+        # kontainer[b] sekarang berisi kontainer lain (kontainer kosong ditimpa kontainer terakhir)
+        for entry in self.kontainer[b]:
+            self.location[id(entry)] = b
+
+    def bin_of(self, entry):
+        return self.location[id(entry)]
+
+    def candidates(self, low, high, exclude=None):
+        # pasangan dengan low <= jumlah <= high dari jumlah terbesar (paling mendekati `high`, yaitu
+        # mengisi kontainer paling penuh), melewati pasangan di kontainer `exclude`.
+        # Menghasilkan (jumlah, kontainer, entry1, entry2).
+        position = bisect_right(self.sums, high) - 1
+        while position >= 0 and self.sums[position] >= low:
+            size = self.sums[position]
+            for entry, other in self.buckets[size].values():
+                b = self.location[id(entry)]
+                if b != exclude:
+                    yield size, b, entry, other
+            position -= 1
+
+    def exact(self, size, exclude=None):
+        # lookup hash: satu pasangan dengan jumlah tepat `size`, atau None
+        return next(self.candidates(size, size, exclude), None)
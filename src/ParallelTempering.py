@@ -0,0 +1,252 @@
+import math
+import multiprocessing as mp
+import random
+import sys
+import time
+
+from Initializer import create_initial_solution
+from Neighborhood import SwapNeighborhood
+from SimulatedAnnealing import (apply_swap_to_cache, calculate_objective_from_cache, calculate_swap_delta,
+                                create_objective_cache)
+from Solver import (Result, copy_kontainer, count_used_bins, load_instance, pop_flag, print_gap, print_instance,
+                    print_kontainer, receive_from_workers, resolve_lower_bound)
+
+# Parallel tempering (replica exchange): M replika Simulated Annealing berjalan di proses terpisah,
+# masing-masing pada suhu tetap dari tangga geometrik [min_temperature, max_temperature]. Setiap
+# `exchange_interval` langkah Metropolis, proses koordinator mengusulkan pertukaran antara pasangan
+# suhu yang bertetangga dengan peluang min(1, exp((E_a - E_b) * (1/T_a - 1/T_b))). Yang ditukar
+# adalah suhunya (bukan state), jadi yang lewat antar proses hanya beberapa angka per ronde.
+#
+# Energi = POF Simulated Annealing (calculate_objective_from_cache) dan move = swap 1-1 yang tidak
+# membuat kontainer overflow, sehingga replika di suhu rendah berperilaku seperti SA yang sudah
+# dingin sementara replika di suhu tinggi terus menjelajah dan bisa turun membawa state baru.
+
+DEFAULT_PARAMS = {
+    'initial_strategy'   : 'random',   # random | ffd | bfd
+    'replicas'           : 8,          # satu proses per replika
+    'min_temperature'    : 1e-3,       # suhu replika terdingin (dalam satuan POF)
+    'max_temperature'    : 0.02,       # suhu replika terpanas
+    'exchange_interval'  : 500,        # langkah Metropolis per replika di antara dua pertukaran
+    'rounds'             : 200,        # jumlah ronde pertukaran
+    'lower_bound'        : 'auto',     # berhenti jika jumlah kontainer terpakai sudah <= lower bound ('auto' = Bounds, None = mati)
+    'seed'               : None,
+    'verbose'            : True,
+}
+
+def temperature_ladder(replicas, min_temperature, max_temperature):
+    # tangga geometrik: rasio suhu antar tetangga konstan, sehingga peluang tukar kira-kira merata
+    if replicas == 1:
+        return [min_temperature]
+    ratio = (max_temperature / min_temperature) ** (1 / (replicas - 1))
+    return [min_temperature * ratio ** rung for rung in range(replicas)]
+
+def exchange_probability(energy_a, temperature_a, energy_b, temperature_b):
+    exponent = (energy_a - energy_b) * (1 / temperature_a - 1 / temperature_b)
+    return 1.0 if exponent >= 0 else math.exp(exponent)
+
+def run_replica(replica, instance, params, seed, inbox, outbox):
+    rng                 = random.Random(seed)
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+    kontainer           = create_initial_solution(instance['barang'], kapasitas_kontainer, params['initial_strategy'], rng=rng)
+
+    objective_cache = create_objective_cache(kontainer, kapasitas_kontainer)
+    neighborhood    = SwapNeighborhood(kontainer)
+    energy          = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+    best_energy     = energy
+    best_kontainer  = copy_kontainer(kontainer)
+    evaluations     = 0
+    accepted        = 0
+
+    # suhu dikirim koordinator di awal tiap ronde; None berarti selesai
+    temperature = inbox.get()
+    while temperature is not None:
+        for _ in range(params['exchange_interval'] if len(neighborhood) > 0 else 0):
+            i, j, index_i, index_j = neighborhood.sample(rng)
+            barang_i = kontainer[i][index_i]['barang']
+            barang_j = kontainer[j][index_j]['barang']
+            evaluations += 1
+
+            new_total_i = objective_cache['totals'][i] - barang_i['ukuran'] + barang_j['ukuran']
+            new_total_j = objective_cache['totals'][j] - barang_j['ukuran'] + barang_i['ukuran']
+            if new_total_i > kapasitas_kontainer or new_total_j > kapasitas_kontainer:
+                continue
+
+            delta = calculate_swap_delta(objective_cache, i, j, barang_i['ukuran'], barang_j['ukuran'], kapasitas_kontainer)[0]
+            if delta > 0 and rng.random() >= math.exp(-delta / temperature):
+                continue
+
+            kontainer[i][index_i]['barang'] = barang_j
+            kontainer[j][index_j]['barang'] = barang_i
+            apply_swap_to_cache(objective_cache, i, j, barang_i['ukuran'], barang_j['ukuran'], kapasitas_kontainer)
+            energy   += delta
+            accepted += 1
+
+            if energy < best_energy - 1e-12:
+                best_energy    = energy
+                best_kontainer = copy_kontainer(kontainer)
+
+        # hitung ulang dari cache supaya galat floating point dari akumulasi delta tidak menumpuk
+        energy = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+        outbox.put((replica, energy, best_energy, count_used_bins(best_kontainer)))
+        temperature = inbox.get()
+
+    outbox.put((replica, best_kontainer, best_energy, evaluations, accepted))
+
+def solve(instance, params=None, should_stop=None):
+    params   = {**DEFAULT_PARAMS, **(params or {})}
+    replicas = params['replicas']
+    verbose  = params['verbose']
+    if replicas < 1:
+        raise ValueError(f"replicas must be at least 1, got {replicas}")
+
+    base_seed   = params['seed'] if params['seed'] is not None else random.randrange(1 << 30)
+    rng         = random.Random(base_seed)
+    ladder      = temperature_ladder(replicas, params['min_temperature'], params['max_temperature'])
+    lower_bound = resolve_lower_bound(instance, params['lower_bound'])
+
+    start_time = time.time()
+    inboxes    = [mp.Queue() for _ in range(replicas)]
+    outbox     = mp.Queue()
+    processes  = []
+    for replica in range(replicas):
+        process = mp.Process(target=run_replica,
+                             args=(replica, instance, params, base_seed + replica, inboxes[replica], outbox))
+        process.start()
+        processes.append(process)
+
+    # rung_of[replica] = posisi replika di tangga suhu; replica_at[rung] kebalikannya
+    rung_of            = list(range(replicas))
+    replica_at         = list(range(replicas))
+    exchange_attempts  = [0] * max(replicas - 1, 0)
+    exchange_accepted  = [0] * max(replicas - 1, 0)
+    history_best       = []
+    rounds             = 0
+    stopped_early      = False
+
+    for rung, replica in enumerate(replica_at):
+        inboxes[replica].put(ladder[rung])
+
+    while True:
+        energies = [0.0] * replicas
+        best     = float('inf')
+        best_K   = None
+        for _ in range(replicas):
+            replica, energy, best_energy, used_bins = receive_from_workers(outbox, processes)
+            energies[replica] = energy
+            if best_energy < best:
+                best, best_K = best_energy, used_bins
+        if verbose and (not history_best or best < history_best[-1]):
+            print(f"Round {rounds + 1}: best POF={best:.4f} | replika terdingin {replica_at[0]} E={energies[replica_at[0]]:.4f}")
+        history_best.append(best)
+        rounds += 1
+
+        if rounds >= params['rounds']:
+            break
+        # K dari replika dengan best POF, yaitu solusi yang nanti dikembalikan
+        if lower_bound is not None and best_K <= lower_bound:
+            break
+        if should_stop is not None and should_stop():
+            stopped_early = True
+            break
+
+        # pasangan genap/ganjil bergantian supaya setiap pasangan tetangga dapat giliran
+        for rung in range(rounds % 2, replicas - 1, 2):
+            a, b = replica_at[rung], replica_at[rung + 1]
+            exchange_attempts[rung] += 1
+            if rng.random() < exchange_probability(energies[a], ladder[rung], energies[b], ladder[rung + 1]):
+                exchange_accepted[rung] += 1
+                replica_at[rung], replica_at[rung + 1] = b, a
+                rung_of[a], rung_of[b] = rung + 1, rung
+
+        for replica in range(replicas):
+            inboxes[replica].put(ladder[rung_of[replica]])
+
+    for inbox in inboxes:
+        inbox.put(None)
+
+    # ambil semua hasil dulu sebelum join, supaya tidak deadlock pada queue yang penuh
+    finals = sorted((receive_from_workers(outbox, processes) for _ in range(replicas)), key=lambda final: final[0])
+    for process in processes:
+        process.join()
+
+    _, best_kontainer, best_energy, _, _ = min(finals, key=lambda final: final[2])
+    execution_time = time.time() - start_time
+    K              = count_used_bins(best_kontainer)
+
+    return Result(
+        algorithm      = 'Parallel Tempering',
+        kontainer      = best_kontainer,
+        objective      = best_energy,
+        K              = K,
+        execution_time = execution_time,
+        iterations     = rounds,
+        evaluations    = sum(final[3] for final in finals),
+        history        = history_best,
+        lower_bound    = lower_bound,
+        extra          = {
+            'temperatures'          : ladder,
+            'exchange_attempts'     : exchange_attempts,
+            'exchange_accepted'     : exchange_accepted,
+            'exchange_rates'        : [accepted / attempts if attempts else 0.0
+                                       for accepted, attempts in zip(exchange_accepted, exchange_attempts)],
+            'replica_best'          : [final[2] for final in finals],
+            'replica_accept_rates'  : [final[4] / final[3] if final[3] else 0.0 for final in finals],
+            'stopped_early'         : stopped_early,
+            'reached_lower_bound'   : lower_bound is not None and K <= lower_bound,
+        },
+    )
+
+def plot_result(result):
+    # matplotlib baru di-import saat plot diminta, supaya solve() headless tetap ringan
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 5))
+    plt.plot(range(1, len(result.history) + 1), result.history, 'r-', linewidth=2, label='Best POF')
+    plt.xlabel('Exchange Round', fontsize=12)
+    plt.ylabel('Objective Function Value', fontsize=12)
+    plt.title('Parallel Tempering - Best Objective over Rounds', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+def main():
+    show_plot = not pop_flag(sys.argv, '--no-plot')
+
+    if len(sys.argv) > 1:
+        json_filename = sys.argv[1]
+    else:
+        json_filename = 'case6.json'
+
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+    replicas         = int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_PARAMS['replicas']
+    rounds           = int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_PARAMS['rounds']
+
+    instance = load_instance(json_filename, 'ParallelTempering.py')
+    print_instance(instance)
+
+    try:
+        result = solve(instance, {'initial_strategy': initial_strategy, 'replicas': replicas, 'rounds': rounds})
+    except (ValueError, RuntimeError) as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+
+    print_kontainer(result.kontainer, instance['kapasitas_kontainer'], "HASIL PENYIMPANAN BARANG DALAM KONTAINER")
+
+    print("\n" + "="*60)
+    print(f"PARALLEL TEMPERING - {replicas} replika, {result.iterations} ronde")
+    print("="*60)
+    for rung, temperature in enumerate(result.extra['temperatures']):
+        rate = f", tukar ke atas {result.extra['exchange_rates'][rung]:.0%}" if rung < replicas - 1 else ""
+        print(f"T[{rung}] = {temperature:.5f}{rate}")
+    print(f"\nBest POF: {result.objective:.4f} (K={result.K})")
+    print(f"Evaluations: {result.evaluations}")
+    print(f"Execution Time: {result.execution_time:.4f} seconds")
+    print_gap(result)
+    print("="*60)
+
+    if show_plot:
+        plot_result(result)
+
+if __name__ == "__main__":
+    main()
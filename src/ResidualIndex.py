@@ -0,0 +1,111 @@
+from bisect import bisect_left, insort
+
+# Index sisa kapasitas (residual) per kontainer untuk pencarian kontainer tujuan yang cepat.
+#
+# FirstFitTree adalah segment tree "max residual": query first-fit (kontainer paling kiri
+# yang masih muat) dan update sisa kapasitas satu kontainer sama-sama O(log K).
+
+EMPTY_SLOT = -(1 << 62)   # residual untuk slot yang belum dipakai, tidak pernah muat
+
+class FirstFitTree:
+    def __init__(self, residuals, reserve=0):
+        self.count = len(residuals)
+        self.size  = 1
+        while self.size < max(1, self.count + reserve):
+            self.size *= 2
+
+        self.tree = [EMPTY_SLOT] * (2 * self.size)
+        self.tree[self.size:self.size + self.count] = residuals
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def __len__(self):
+        return self.count
+
+    def residual(self, b):
+        return self.tree[self.size + b]
+
+    def update(self, b, residual):
+        node = self.size + b
+        self.tree[node] = residual
+        node //= 2
+        while node >= 1:
+            best = max(self.tree[2 * node], self.tree[2 * node + 1])
+            if self.tree[node] == best:
+                break
+            self.tree[node] = best
+            node //= 2
+
+    def first_fit(self, ukuran): # indeks kontainer paling kiri dengan residual >= ukuran, -1 jika tidak ada
+        if self.tree[1] < ukuran:
+            return -1
+
+        node = 1
+        while node < self.size:
+            node = 2 * node if self.tree[2 * node] >= ukuran else 2 * node + 1
+        return node - self.size
+
+    def append(self, residual): # buka kontainer baru, return indeksnya
+        if self.count == self.size:
+            self._grow()
+
+        b = self.count
+        self.count += 1
+        self.update(b, residual)
+        return b
+
+    def _grow(self):
+        residuals = self.tree[self.size:self.size + self.count]
+        self.__init__(residuals, reserve=self.count)
+
+
+# BestFitIndex: kontainer terbuka dikelompokkan per nilai residual (dict residual -> list kontainer),
+# dan nilai residual yang sedang terpakai disimpan terurut sehingga residual terkecil yang masih
+# >= ukuran barang ditemukan dengan bisect. Memori sebanding dengan jumlah kontainer, bukan kapasitas,
+# dan list terurut paling panjang min(jumlah kontainer, kapasitas + 1).
+
+class BestFitIndex:
+    def __init__(self, kapasitas):
+        self.kapasitas = kapasitas
+        self.buckets   = {}   # residual -> kontainer dengan residual tsb
+        self.residuals = []   # key buckets, terurut
+        self.count     = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.buckets.clear()
+        self.residuals.clear()
+        self.count = 0
+
+    def add(self, b, residual):
+        if residual < 0:
+            return
+        bucket = self.buckets.get(residual)
+        if bucket is None:
+            bucket = self.buckets[residual] = []
+            insort(self.residuals, residual)
+        bucket.append(b)
+        self.count += 1
+
+    def add_many(self, residuals): # residuals: list residual, index = nomor kontainer
+        for b, residual in enumerate(residuals):
+            if residual >= 0:
+                self.buckets.setdefault(residual, []).append(b)
+                self.count += 1
+        self.residuals = sorted(self.buckets)
+
+    def pop_best_fit(self, ukuran): # ambil kontainer dengan residual terkecil >= ukuran, (None, None) jika tidak ada
+        position = bisect_left(self.residuals, ukuran)
+        if position == len(self.residuals):
+            return None, None
+
+        residual = self.residuals[position]
+        bucket   = self.buckets[residual]
+        b        = bucket.pop()
+        if not bucket:
+            del self.buckets[residual]
+            del self.residuals[position]
+        self.count -= 1
+        return b, residual
@@ -1,88 +1,41 @@
 import random
 import math
-import json
 import sys
-import os
-import matplotlib.pyplot as plt
-import numpy as np
 import time
-
-import os
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-if len(sys.argv) > 1:
-    json_filename = sys.argv[1]
-else:
-    json_filename = 'case6.json'  
-
-json_path = os.path.join(script_dir, json_filename)
-
-try:
-    with open(json_path, 'r') as f:
-        data = json.load(f)
-    print(f"Using JSON file: {json_filename}")
-except FileNotFoundError:
-    print(f"Error: {json_filename} not found!")
-    print("Usage: python3 SimulatedAnnealing.py [json_filename]")
-    print("Example: python3 SimulatedAnnealing.py case2.json")
-    sys.exit(1)
-
-# Variable Library
-kapasitas_kontainer   = data['kapasitas_kontainer']   # Kapasitas Kontainer
-barang                = data['barang'].copy()         # ID Barang
-jumlah_barang         = len(barang)                   # Jumlah Barang
-kontainer             = []                            # Kontainer
-kontainer_id          = 0                             # ID Kontainer
-
-print(f"Loaded data from JSON file:")
-print(f"Kapasitas kontainer: {kapasitas_kontainer} kg/m³")
-print(f"Jumlah barang: {jumlah_barang}")
-print(f"Barang: {[f"{item['id']}({item['ukuran']})" for item in barang]}")
-
-kontainer.append([])
-kontainer_space_left = kapasitas_kontainer
-
-while True:
-    if len(barang) == 0:
-        break
-        
-    random_index   = random.randint(0, len(barang) - 1)
-    random_barang  = barang[random_index]
-    
-    if random_barang['ukuran'] <= kontainer_space_left:
-        kontainer[kontainer_id].append({
-            'barang': random_barang
-        })
-        
-        kontainer_space_left -= random_barang['ukuran']
-        barang.pop(random_index)
-
-    else:
-        kontainer_id += 1
-        kontainer.append([])
-        kontainer_space_left = kapasitas_kontainer
-
-print("\n" + "="*60)
-print("SPAWN BARANG DALAM KONTAINER")
-print("="*60)
-
-for idx, container in enumerate(kontainer):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_tempnfo = item['barang']
-        print(f"  - ID: {barang_i_tempnfo['id']}, Ukuran: {barang_i_tempnfo['ukuran']} kg/m³")
-        total_ukuran += barang_i_tempnfo['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
-
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(kontainer)}")
-print("="*60)
+from Anytime import CALIBRATION_INTERVAL, BestSoFar, calibrate_alpha
+from Moves import MoveGenerator
+from Neighborhood import SwapNeighborhood
+from Initializer import create_initial_solution
+from Solver import (Result, count_used_bins, load_instance, pop_flag, pop_option, print_gap, print_instance,
+                    print_kontainer, resolve_lower_bound)
+
+MODES = ('sequential', 'batched')
+
+DEFAULT_PARAMS = {
+    'initial_strategy'   : 'random',   # random | ffd | bfd
+    'mode'               : 'sequential', # sequential (satu kandidat per iterasi) | batched (numpy)
+    'moves'              : None,       # None = swap 1-1 lama; atau tuple jenis move dari Moves.MOVE_TYPES (hanya sequential)
+    'batch_size'         : 256,        # mode batched: jumlah kandidat swap yang dinilai sekaligus
+    'alpha'              : 0.985,      # cooling rate
+    'initial_temperature': 'auto',     # auto | exhaustive | sampled | angka (T₀ langsung)
+    't0_samples'         : 1000,       # sampled: jumlah swap acak yang dinilai
+    't0_acceptance'      : 0.8,        # sampled: target peluang terima move memburuk di awal
+    'min_temperature'    : 0.01,
+    'max_iterations'     : 1000,
+    'sideways_threshold' : 5,
+    'time_limit'         : None,       # detik; kalau diisi: mode anytime (lihat solve), max_iterations diabaikan
+    'reheat_after'       : 500,        # mode anytime: reheat setelah sekian kali local_stucked tanpa perbaikan
+    'reheat_ratio'       : 0.1,        # mode anytime: suhu reheat = reheat_ratio * T0
+    'lower_bound'        : 'auto',     # berhenti jika jumlah kontainer terpakai sudah <= lower bound ('auto' = Bounds, None = mati)
+    'seed'               : None,
+    'verbose'            : True,
+}
+
+STOP_CHECK_INTERVAL = 100   # should_stop() dicek tiap sekian iterasi (bisa berupa panggilan antar-proses)
+MIN_BATCH_SIZE      = 16    # mode batched: batas bawah ukuran batch adaptif
+EXHAUSTIVE_T0_PAIRS = 10000 # initial_temperature 'auto': di bawah ini T₀ dihitung exhaustive
+
+T0_METHODS = ('auto', 'exhaustive', 'sampled')
 
 def calculate_kontainer_total(kontainer):
     total = 0
@@ -98,15 +51,15 @@ def calculate_unused(kontainer, kapasitas):
         total_unused += unused
     return total_unused
 
+P_OVERFLOW = 1000
+P_BINS     = 1.0
+P_DENSITY  = 0.1
+
 def calculate_objective_function(kontainer, kapasitas):
-    P_OVERFLOW = 1000
-    P_BINS     = 1.0
-    P_DENSITY  = 0.1
-    
     K = len(kontainer)  
     
-    total_overflow          = 0
-    sum_squared_fill_ratios = 0
+    total_overflow     = 0
+    sum_squared_totals = 0
     
     for container in kontainer:
         total_size = calculate_kontainer_total(container)
@@ -115,14 +68,97 @@ def calculate_objective_function(kontainer, kapasitas):
             overflow        = total_size - kapasitas
             total_overflow += overflow
         
-        if len(container) > 0: 
-            fill_ratio               = total_size / kapasitas
-            sum_squared_fill_ratios += fill_ratio ** 2
+        sum_squared_totals += total_size * total_size   # kontainer kosong menyumbang 0
+    
+    # Σ total² dibagi kapasitas² sekali di akhir, ekspresi yang sama dengan calculate_objective_from_cache,
+    # supaya objective hasil hitung ulang penuh dan dari cache sama persis (bukan hanya sampai pembulatan)
+    sum_squared_fill_ratios = sum_squared_totals / (kapasitas * kapasitas)
+    
+    cost = (P_OVERFLOW * total_overflow) + (P_BINS * K) - (P_DENSITY * sum_squared_fill_ratios)
+    
+    return cost, K, total_overflow, sum_squared_fill_ratios
+
+# cache total per kontainer + komponen objective, supaya swap cukup di-update O(1)
+def create_objective_cache(kontainer, kapasitas):
+    totals = [calculate_kontainer_total(container) for container in kontainer]
+    
+    return {
+        'totals'             : totals,
+        'K'                  : len(kontainer),
+        'total_overflow'     : sum(total - kapasitas for total in totals if total > kapasitas),
+        'sum_squared_totals' : sum(total * total for total in totals),   # kontainer kosong menyumbang 0
+    }
+
+def calculate_objective_from_cache(cache, kapasitas):
+    K                       = cache['K']
+    total_overflow          = cache['total_overflow']
+    sum_squared_fill_ratios = cache['sum_squared_totals'] / (kapasitas * kapasitas)
     
     cost = (P_OVERFLOW * total_overflow) + (P_BINS * K) - (P_DENSITY * sum_squared_fill_ratios)
     
     return cost, K, total_overflow, sum_squared_fill_ratios
 
+def calculate_swap_totals(cache, i, j, ukuran_i, ukuran_j, kapasitas):
+    current_total_i = cache['totals'][i]
+    current_total_j = cache['totals'][j]
+    new_total_i     = current_total_i - ukuran_i + ukuran_j
+    new_total_j     = current_total_j - ukuran_j + ukuran_i
+    
+    delta_overflow = (max(new_total_i - kapasitas, 0) + max(new_total_j - kapasitas, 0)) \
+                   - (max(current_total_i - kapasitas, 0) + max(current_total_j - kapasitas, 0))
+    delta_squared  = (new_total_i * new_total_i + new_total_j * new_total_j) \
+                   - (current_total_i * current_total_i + current_total_j * current_total_j)
+    
+    return new_total_i, new_total_j, delta_overflow, delta_squared
+
+def calculate_swap_delta(cache, i, j, ukuran_i, ukuran_j, kapasitas):
+    # swap 1-1 tidak mengubah jumlah barang per kontainer, jadi delta K selalu 0
+    _, _, delta_overflow, delta_squared = calculate_swap_totals(cache, i, j, ukuran_i, ukuran_j, kapasitas)
+    delta_density = delta_squared / (kapasitas * kapasitas)
+    
+    delta_cost = (P_OVERFLOW * delta_overflow) - (P_DENSITY * delta_density)
+    
+    return delta_cost, 0, delta_overflow, delta_density
+
+def apply_swap_to_cache(cache, i, j, ukuran_i, ukuran_j, kapasitas):
+    new_total_i, new_total_j, delta_overflow, delta_squared = calculate_swap_totals(cache, i, j, ukuran_i, ukuran_j, kapasitas)
+    
+    cache['totals'][i]          = new_total_i
+    cache['totals'][j]          = new_total_j
+    cache['total_overflow']     += delta_overflow
+    cache['sum_squared_totals'] += delta_squared
+
+# move dari Moves (param `moves`) bisa memindah barang dan menghapus kontainer, jadi delta K ikut dihitung.
+# Kontainer yang dihapus menyumbang total 0, sehingga suku overflow/kuadratnya otomatis hilang.
+def calculate_move_delta(move, kapasitas):
+    delta_K        = -len(move.emptied)
+    delta_overflow = 0
+    delta_squared  = 0
+    for old_total, new_total in zip(move.old_totals, move.new_totals):
+        delta_overflow += max(new_total - kapasitas, 0) - max(old_total - kapasitas, 0)
+        delta_squared  += new_total * new_total - old_total * old_total
+    
+    delta_cost = (P_OVERFLOW * delta_overflow) + (P_BINS * delta_K) - (P_DENSITY * delta_squared / (kapasitas * kapasitas))
+    
+    return delta_cost, delta_K, delta_overflow, delta_squared
+
+def apply_move_to_cache(cache, delta_K, delta_overflow, delta_squared):
+    # totals sudah di-update oleh MoveGenerator.apply (list yang sama dengan cache['totals'])
+    cache['K']                  += delta_K
+    cache['total_overflow']     += delta_overflow
+    cache['sum_squared_totals'] += delta_squared
+
+# ΔE move dinyatakan dalam satuan ukuran barang seperti ΔE swap, supaya T₀ tetap berlaku: untuk kontainer
+# yang hampir penuh, suku densitas berubah 2 * P_DENSITY / kapasitas per satuan ukuran yang masuk
+def move_energy(delta_cost, kapasitas):
+    return -delta_cost * kapasitas / (2 * P_DENSITY)
+
+def metropolis(delta_E, temperature, rng):
+    if delta_E >= 0:
+        return True, 1.0
+    probability = math.exp(delta_E / temperature)
+    return rng.random() < probability, probability
+
 def calculate_initial_temperature(kontainer, kapasitas):
 
     max_delta_E = 0
@@ -130,11 +166,12 @@ def calculate_initial_temperature(kontainer, kapasitas):
     for i in range(len(kontainer) - 1):
         j = i + 1 
         
+        # total kontainer tidak berubah selama loop, cukup dihitung sekali per pasangan
+        current_total_i = calculate_kontainer_total(kontainer[i])
+        current_total_j = calculate_kontainer_total(kontainer[j])
+        
         for index_i in range(len(kontainer[i])):
             for index_j in range(len(kontainer[j])):
-                current_total_i = calculate_kontainer_total(kontainer[i])
-                current_total_j = calculate_kontainer_total(kontainer[j])
-                
                 barang_i_temp = kontainer[i][index_i]['barang']
                 barang_j_temp = kontainer[j][index_j]['barang']
                 
@@ -151,157 +188,505 @@ def calculate_initial_temperature(kontainer, kapasitas):
     
     return max_delta_E
 
-acceptance_probability  = []
-iterations              = []
-history_POF             = []
-
-start_time        = time.time()
-temperature       = calculate_initial_temperature(kontainer, kapasitas_kontainer)
-alpha             = 0.985
-min_temperature   = 0.01
-max_iterations    = 1000
-current_iteration = 0
-
-# var untuk local optimum
-local_stucked       = 0
-sideways_counter    = 0
-SIDEWAYS_THRESHOLD  = 5
-last_changed_POF    = float('-inf')
-
-print(f"\nInitial Temperature (T₀): {temperature:.2f}")
-print(f"Alpha (cooling rate): {alpha}")
-print(f"Min Temperature: {min_temperature}")
-print(f"Max Iterations: {max_iterations}")
-print("="*60)
-
-while temperature > min_temperature and current_iteration < max_iterations:
-    # Objective Function Data Logging
-    current_POF, _, _, _ = calculate_objective_function(kontainer, kapasitas_kontainer)
-    history_POF.append(current_POF)
+# T₀ dari sampel: `samples` swap acak yang feasible dinilai terhadap total kontainer di cache, lalu
+# T₀ dipilih supaya move memburuk rata-rata diterima dengan peluang `acceptance`
+# (exp(-mean|ΔE| / T₀) = acceptance). Biaya O(samples), tidak bergantung pada ukuran instance.
+def estimate_initial_temperature(kontainer, kapasitas, objective_cache, neighborhood, samples, acceptance, rng):
+    if len(neighborhood) == 0:
+        return 0
     
-    if last_changed_POF != current_POF:
-        last_changed_POF = current_POF
-        sideways_counter = 0
+    totals      = objective_cache['totals']
+    worsening   = []
+    max_delta_E = 0
     
-    else:
-        sideways_counter += 1
+    # kandidat yang overflow dilewati, jadi beri jatah percobaan lebih
+    for _ in range(samples * 10):
+        if len(worsening) >= samples:
+            break
+        i, j, index_i, index_j = neighborhood.sample(rng)
+        ukuran_i = kontainer[i][index_i]['barang']['ukuran']
+        ukuran_j = kontainer[j][index_j]['barang']['ukuran']
         
-    if sideways_counter >= SIDEWAYS_THRESHOLD:
-        local_stucked += 1
-        sideways_counter = 0
+        if totals[i] - ukuran_i + ukuran_j > kapasitas or totals[j] - ukuran_j + ukuran_i > kapasitas:
+            continue
+        
+        delta_E     = ukuran_i - ukuran_j   # new_unused_i - current_unused_i
+        max_delta_E = max(max_delta_E, abs(delta_E))
+        if delta_E < 0:
+            worsening.append(-delta_E)
     
-    possible_swaps = []
-    for i in range(len(kontainer)):
-        for j in range(i + 1, len(kontainer)):
-            for index_i in range(len(kontainer[i])):
-                for index_j in range(len(kontainer[j])):
-                    possible_swaps.append((i, j, index_i, index_j))
+    # tidak ada move memburuk yang feasible: pakai |ΔE| terbesar seperti metode exhaustive
+    if not worsening:
+        return max_delta_E
+    return (sum(worsening) / len(worsening)) / -math.log(acceptance)
+
+def choose_initial_temperature(kontainer, kapasitas, objective_cache, neighborhood, params, rng):
+    method = params['initial_temperature']
+    if not isinstance(method, str):
+        return float(method)
+    if method not in T0_METHODS:
+        raise ValueError(f"Unknown initial_temperature '{method}', choose one of {T0_METHODS} or a number")
     
-    if not possible_swaps: 
-        print("No possible swaps available. Stopping.")
-        break
+    if method == 'auto':
+        pairs  = sum(len(kontainer[i]) * len(kontainer[i + 1]) for i in range(len(kontainer) - 1))
+        method = 'exhaustive' if pairs <= EXHAUSTIVE_T0_PAIRS else 'sampled'
     
-    i, j, index_i, index_j = random.choice(possible_swaps)
+    if method == 'exhaustive':
+        return calculate_initial_temperature(kontainer, kapasitas)
+    return estimate_initial_temperature(kontainer, kapasitas, objective_cache, neighborhood,
+                                        params['t0_samples'], params['t0_acceptance'], rng)
+
+# mode 'batched': `batch_size` kandidat swap diambil sekaligus sebagai array numpy dan delta-nya
+# dihitung dalam satu pass terhadap vektor total per kontainer. Kandidat ke-k memakai suhu
+# T * alpha^k dan aturan penerimaan yang sama dengan mode sequential, jadi satu kandidat tetap
+# setara satu iterasi. Kandidat diproses berurutan: move yang diterima langsung diterapkan, lalu
+# batch dipotong di kandidat pertama yang menyentuh kontainer yang baru berubah (delta-nya basi);
+# kandidat sisanya dibuang dan diambil ulang di batch berikutnya.
+def run_batched(kontainer, kapasitas_kontainer, objective_cache, neighborhood, temperature, params, rng,
+                should_stop, history_POF, iterations, acceptance_probability, verbose):
+    import numpy as np
     
-    current_total_i = calculate_kontainer_total(kontainer[i])
-    current_total_j = calculate_kontainer_total(kontainer[j])
+    np_rng          = np.random.default_rng(rng.getrandbits(64))
+    alpha           = params['alpha']
+    min_temperature = params['min_temperature']
+    max_iterations  = params['max_iterations']
+    batch_size      = params['batch_size']
+    batch           = batch_size
     
-    barang_i_temp = kontainer[i][index_i]['barang']
-    barang_j_temp = kontainer[j][index_j]['barang']
-
-    new_total_i = current_total_i - barang_i_temp['ukuran'] + barang_j_temp['ukuran']
-    new_total_j = current_total_j - barang_j_temp['ukuran'] + barang_i_temp['ukuran']
-
-    if new_total_i <= kapasitas_kontainer and new_total_j <= kapasitas_kontainer:
-        current_unused = (kapasitas_kontainer - current_total_i)
-        new_unused = (kapasitas_kontainer - new_total_i)
+    # ukuran barang per slot (urutan kontainer lalu index) dan total per kontainer
+    cum_sizes = np.asarray(neighborhood.cum_sizes, dtype=np.int64)
+    ukuran    = np.array([entry['barang']['ukuran'] for container in kontainer for entry in container], dtype=np.int64)
+    totals    = np.array(objective_cache['totals'], dtype=np.int64)
+    
+    current_iteration = 0
+    stopped_early     = False
+    discarded         = 0
+    last_stop_check   = -STOP_CHECK_INTERVAL
+    
+    # var untuk local optimum, sama seperti mode sequential tapi dihitung per segmen POF konstan
+    local_stucked     = 0
+    sideways_counter  = 0
+    last_changed_POF  = float('-inf')
+    
+    def log_POF(POF, count):
+        nonlocal local_stucked, sideways_counter, last_changed_POF
+        if count <= 0:
+            return
+        history_POF.extend([POF] * count)
+        
+        if last_changed_POF != POF:
+            last_changed_POF = POF
+            sideways_counter = 0
+            count           -= 1
+        sideways_counter += count
+        local_stucked    += sideways_counter // params['sideways_threshold']
+        sideways_counter %= params['sideways_threshold']
+    
+    if len(neighborhood) == 0:
+        if verbose:
+            print("No possible swaps available. Stopping.")
+        return temperature, current_iteration, local_stucked, stopped_early, discarded
+    
+    while temperature > min_temperature and current_iteration < max_iterations:
+        if should_stop is not None and current_iteration - last_stop_check >= STOP_CHECK_INTERVAL:
+            last_stop_check = current_iteration
+            if should_stop():
+                stopped_early = True
+                break
+        
+        count        = min(batch, max_iterations - current_iteration)
+        temperatures = temperature * alpha ** np.arange(count)
+        count        = max(1, int(np.count_nonzero(temperatures > min_temperature)))
+        temperatures = temperatures[:count]
+        
+        bin_i, bin_j, index_i, index_j = neighborhood.sample_batch(np_rng, count)
+        slot_i   = cum_sizes[bin_i] + index_i
+        slot_j   = cum_sizes[bin_j] + index_j
+        size_i   = ukuran[slot_i]
+        size_j   = ukuran[slot_j]
+        feasible = (totals[bin_i] - size_i + size_j <= kapasitas_kontainer) & \
+                   (totals[bin_j] - size_j + size_i <= kapasitas_kontainer)
+        
+        # delta_E = new_unused_i - current_unused_i, P = exp(delta_E / T) untuk delta_E < 0
+        delta_E     = (size_i - size_j).astype(np.float64)
+        probability = np.where(delta_E >= 0, 1.0, np.exp(np.minimum(delta_E, 0.0) / temperatures))
+        accept      = feasible & (np_rng.random(count) < probability)
         
-        delta_E = new_unused - current_unused
+        # next_conflict[k] = kandidat pertama setelah k yang menyentuh kontainer i atau j milik k
+        slot_bins     = np.stack((bin_i, bin_j), axis=1).ravel()
+        order         = np.lexsort((np.arange(2 * count), slot_bins))
+        same_bin      = slot_bins[order[1:]] == slot_bins[order[:-1]]
+        next_slot     = np.full(2 * count, 2 * count, dtype=np.int64)
+        next_slot[order[:-1][same_bin]] = order[1:][same_bin]
+        next_conflict = (np.minimum(next_slot[0::2], next_slot[1::2]) // 2).tolist()
         
-        if delta_E >= 0: 
-            accept = True
-            probability = 1.0
+        accepted     = np.flatnonzero(accept).tolist()
+        moves        = zip(bin_i[accepted].tolist(), bin_j[accepted].tolist(),
+                           index_i[accepted].tolist(), index_j[accepted].tolist())
+        consumed     = count
+        previous     = 0
+        current_POF  = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+        
+        for k, (i, j, idx_i, idx_j) in zip(accepted, moves):
+            if k >= consumed:
+                break
+            
+            barang_i_temp = kontainer[i][idx_i]['barang']
+            barang_j_temp = kontainer[j][idx_j]['barang']
+            kontainer[i][idx_i]['barang'] = barang_j_temp
+            kontainer[j][idx_j]['barang'] = barang_i_temp
+            apply_swap_to_cache(objective_cache, i, j, barang_i_temp['ukuran'], barang_j_temp['ukuran'], kapasitas_kontainer)
+            
+            ukuran[slot_i[k]], ukuran[slot_j[k]] = barang_j_temp['ukuran'], barang_i_temp['ukuran']
+            totals[i], totals[j] = objective_cache['totals'][i], objective_cache['totals'][j]
+            
+            if verbose and delta_E[k] >= 0:
+                print(f"Iter {current_iteration+k+1}: [ACCEPT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E[k]:.2f} | T={temperatures[k]:.2f}")
+            elif verbose:
+                print(f"Iter {current_iteration+k+1}: [PROB-ACCEPT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E[k]:.2f} | P={probability[k]:.4f} | T={temperatures[k]:.2f}")
             
-        else:
-            probability = math.exp(delta_E / temperature)  
-            accept      = random.random() < probability
+            # iterasi previous..k masih melihat POF lama
+            log_POF(current_POF, k + 1 - previous)
+            previous    = k + 1
+            current_POF = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+            consumed    = min(consumed, next_conflict[k])
         
-        iterations.append(current_iteration)
-        acceptance_probability.append(probability)
+        log_POF(current_POF, consumed - previous)
         
-        if accept:
-            kontainer[i][index_i]['barang'] = barang_j_temp
-            kontainer[j][index_j]['barang'] = barang_i_temp
+        evaluated = np.flatnonzero(feasible[:consumed])
+        iterations.extend((current_iteration + evaluated).tolist())
+        acceptance_probability.extend(probability[evaluated].tolist())
+        
+        current_iteration += consumed
+        discarded         += count - consumed
+        temperature        = float(temperatures[consumed - 1]) * alpha
+        
+        # suhu tinggi = banyak move diterima = batch cepat terpotong; ukuran batch mengikuti
+        # jumlah kandidat yang benar-benar terpakai supaya tidak banyak kandidat terbuang
+        batch = min(batch_size, max(MIN_BATCH_SIZE, 2 * consumed))
+    
+    return temperature, current_iteration, local_stucked, stopped_early, discarded
+
+# Mode anytime (time_limit diisi, hanya mode sequential): berhenti di deadline yang dihitung sejak
+# solve() dipanggil, bukan di max_iterations / min_temperature. Tiap CALIBRATION_INTERVAL iterasi
+# laju iterasi/detik diukur dan alpha dihitung ulang supaya suhu mencapai min_temperature tepat di
+# deadline. Kalau search macet (reheat_after kali local_stucked tanpa best baru), suhu dinaikkan lagi
+# ke reheat_ratio * T0. Yang dikembalikan selalu state terbaik yang pernah ditemui.
+def solve(instance, params=None, should_stop=None):
+    solve_start         = time.perf_counter()
+    params              = {**DEFAULT_PARAMS, **(params or {})}
+    if params['mode'] not in MODES:
+        raise ValueError(f"Unknown mode '{params['mode']}', choose one of {MODES}")
+    if params['time_limit'] is not None and params['mode'] != 'sequential':
+        raise ValueError("time_limit is only supported in sequential mode")
+    if params['moves'] is not None and params['mode'] != 'sequential':
+        raise ValueError("moves is only supported in sequential mode")
+    
+    rng                 = random.Random(params['seed'])
+    verbose             = params['verbose']
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+    
+    # state awal: random spawn (default), ffd, atau bfd
+    kontainer = create_initial_solution(instance['barang'], kapasitas_kontainer, params['initial_strategy'], rng=rng)
+    
+    if verbose:
+        print_kontainer(kontainer, kapasitas_kontainer, "SPAWN BARANG DALAM KONTAINER")
+    
+    acceptance_probability  = []
+    iterations              = []
+    history_POF             = []
+    
+    start_time          = time.time()
+    objective_cache     = create_objective_cache(kontainer, kapasitas_kontainer)
+    neighborhood        = SwapNeighborhood(kontainer)   # swap 1-1 tidak mengubah jumlah barang per kontainer
+    generator           = None
+    if params['moves'] is not None:
+        generator = MoveGenerator(kontainer, kapasitas_kontainer, params['moves'], objective_cache['totals'], rng)
+    temperature         = choose_initial_temperature(kontainer, kapasitas_kontainer, objective_cache, neighborhood, params, rng)
+    initial_temperature = temperature
+    alpha               = params['alpha']
+    min_temperature     = params['min_temperature']
+    max_iterations      = params['max_iterations']
+    current_iteration   = 0
+    stopped_early       = False
+    
+    # var untuk local optimum
+    local_stucked       = 0
+    sideways_counter    = 0
+    SIDEWAYS_THRESHOLD  = params['sideways_threshold']
+    last_changed_POF    = float('-inf')
+    
+    # swap 1-1 tidak mengubah jumlah kontainer, jadi cukup dicek sekali di awal (dan lagi setiap kali
+    # move menghapus kontainer)
+    lower_bound       = resolve_lower_bound(instance, params['lower_bound'])
+    reached_lower_bound = lower_bound is not None and count_used_bins(kontainer) <= lower_bound
+    
+    # mode anytime
+    deadline            = solve_start + params['time_limit'] if params['time_limit'] is not None else None
+    loop_start          = time.perf_counter()
+    best                = BestSoFar(kontainer, calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0])
+    stucked_since_best  = 0
+    reheats             = 0
+    
+    def remaining_iterations(now):
+        # perkiraan sisa iterasi sampai deadline dari laju iterasi yang terukur sejauh ini
+        return (deadline - now) * current_iteration / (now - loop_start)
+    
+    if verbose:
+        print(f"\nInitial Temperature (T₀): {temperature:.2f}")
+        print(f"Alpha (cooling rate): {alpha}")
+        print(f"Min Temperature: {min_temperature}")
+        print(f"Max Iterations: {max_iterations}")
+        print("="*60)
+    
+    discarded_proposals = 0
+    
+    if params['mode'] == 'batched' and not reached_lower_bound:
+        temperature, current_iteration, local_stucked, stopped_early, discarded_proposals = run_batched(
+            kontainer, kapasitas_kontainer, objective_cache, neighborhood, temperature, params, rng,
+            should_stop, history_POF, iterations, acceptance_probability, verbose)
+    elif params['mode'] == 'sequential':
+        while not reached_lower_bound and (deadline is not None or (temperature > min_temperature and current_iteration < max_iterations)):
+            if should_stop is not None and current_iteration % STOP_CHECK_INTERVAL == 0 and should_stop():
+                stopped_early = True
+                break
+            
+            if deadline is not None and current_iteration % CALIBRATION_INTERVAL == 0:
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                if current_iteration > 0:
+                    alpha = calibrate_alpha(temperature, min_temperature, remaining_iterations(now))
+            
+            # Objective Function Data Logging
+            current_POF, _, _, _ = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)
+            history_POF.append(current_POF)
+            
+            if last_changed_POF != current_POF:
+                last_changed_POF = current_POF
+                sideways_counter = 0
             
-            if delta_E >= 0:
-                print(f"Iter {current_iteration+1}: [ACCEPT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E:.2f} | T={temperature:.2f}")
             else:
-                print(f"Iter {current_iteration+1}: [PROB-ACCEPT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E:.2f} | P={probability:.4f} | T={temperature:.2f}")
-        else:
-            print(f"Iter {current_iteration+1}: [REJECT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E:.2f} | P={probability:.4f} | T={temperature:.2f}")
+                sideways_counter += 1
+                
+            if sideways_counter >= SIDEWAYS_THRESHOLD:
+                local_stucked += 1
+                sideways_counter = 0
+                
+                stucked_since_best += 1
+                if deadline is not None and stucked_since_best >= params['reheat_after']:
+                    temperature        = max(temperature, params['reheat_ratio'] * initial_temperature)
+                    alpha              = calibrate_alpha(temperature, min_temperature, remaining_iterations(time.perf_counter()))
+                    stucked_since_best = 0
+                    reheats           += 1
+                    if verbose:
+                        print(f"Iter {current_iteration+1}: [REHEAT] T={temperature:.2f}")
+            
+            if generator is not None:
+                if len(kontainer) < 2:
+                    if verbose:
+                        print("No possible moves available. Stopping.")
+                    break
+                
+                move = generator.propose()
+                
+                # sampel yang tidak menghasilkan move (overflow / barang kurang) dilewati seperti swap overflow
+                if move is not None:
+                    delta_cost, delta_K, delta_overflow, delta_squared = calculate_move_delta(move, kapasitas_kontainer)
+                    delta_E             = move_energy(delta_cost, kapasitas_kontainer)
+                    accept, probability = metropolis(delta_E, temperature, rng)
+                    
+                    iterations.append(current_iteration)
+                    acceptance_probability.append(probability)
+                    
+                    if accept:
+                        undo = generator.apply(move, keep_undo=deadline is not None)
+                        apply_move_to_cache(objective_cache, delta_K, delta_overflow, delta_squared)
+                        
+                        if move.emptied and lower_bound is not None and count_used_bins(kontainer) <= lower_bound:
+                            reached_lower_bound = True
+                        
+                        if deadline is not None:
+                            new_POF = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+                            if best.record_move(kontainer, undo, new_POF):
+                                stucked_since_best = 0
+                    
+                    if verbose:
+                        status = ('ACCEPT' if delta_E >= 0 else 'PROB-ACCEPT') if accept else 'REJECT'
+                        print(f"Iter {current_iteration+1}: [{status}] {move.kind} ({len(move.transfers)} barang, "
+                              f"{len(move.emptied)} kontainer dihapus) | ΔE={delta_E:.2f} | P={probability:.4f} | T={temperature:.2f}")
+            
+            else:
+                if len(neighborhood) == 0: 
+                    if verbose:
+                        print("No possible swaps available. Stopping.")
+                    break
+            
+                i, j, index_i, index_j = neighborhood.sample(rng)
+            
+                current_total_i = objective_cache['totals'][i]
+                current_total_j = objective_cache['totals'][j]
+            
+                barang_i_temp = kontainer[i][index_i]['barang']
+                barang_j_temp = kontainer[j][index_j]['barang']
     
-    temperature         *= alpha
-    current_iteration   += 1
-
-end_time        = time.time()
-execution_time  = end_time - start_time
-
-print("\n" + "="*60)
-print("HASIL PENYIMPANAN BARANG DALAM KONTAINER")
-print("="*60)
-
-for idx, container in enumerate(kontainer):
-    print(f"\nKontainer {idx + 1}:")
-    total_ukuran = 0
-    
-    for item in container:
-        barang_i_tempnfo = item['barang']
-        print(f"  - ID: {barang_i_tempnfo['id']}, Ukuran: {barang_i_tempnfo['ukuran']} kg/m³")
-        total_ukuran += barang_i_tempnfo['ukuran']
-    
-    sisa_kapasitas = kapasitas_kontainer - total_ukuran
-    print(f"  Total Terisi: {total_ukuran}/{kapasitas_kontainer} kg/m³")
-    print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
-    print(f"  Efisiensi: {(total_ukuran/kapasitas_kontainer)*100:.2f}%")
-
-print("\n" + "="*60)
-print(f"Total Kontainer Digunakan: {len(kontainer)}")
-print("="*60)
-
-print(f"\nSimulated Annealing completed after {current_iteration} iterations.")
-print(f"Final Temperature: {temperature:.2f}")
-print(f"Execution Time: {execution_time:.4f} seconds")
-
-print(f"Current case of Simulated Annealing made {local_stucked} times")
-
-# plot 1
-plt.ioff()
-
-plt.figure(figsize=(10, 5))
-plt.scatter(iterations, acceptance_probability, c='lightblue', s=20, alpha=0.6, label='Acceptance Probability')
-
-if len(iterations) > 1:
-    z = np.polyfit(iterations, acceptance_probability, 3) 
-    p = np.poly1d(z)
-    plt.plot(iterations, p(iterations), 'b-', linewidth=2, label='Trend Line')
-
-plt.xlabel('Iteration', fontsize=12)
-plt.ylabel('Probability', fontsize=12)
-plt.title('Acceptance Probability over Iterations (ΔE < 0)', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-plt.legend()
-plt.ylim(-0.02, 1.02)
-plt.tight_layout()
-plt.show()
-
+                new_total_i = current_total_i - barang_i_temp['ukuran'] + barang_j_temp['ukuran']
+                new_total_j = current_total_j - barang_j_temp['ukuran'] + barang_i_temp['ukuran']
+    
+                if new_total_i <= kapasitas_kontainer and new_total_j <= kapasitas_kontainer:
+                    current_unused = (kapasitas_kontainer - current_total_i)
+                    new_unused = (kapasitas_kontainer - new_total_i)
+                
+                    delta_E = new_unused - current_unused
+                
+                    accept, probability = metropolis(delta_E, temperature, rng)
+                
+                    iterations.append(current_iteration)
+                    acceptance_probability.append(probability)
+                
+                    if accept:
+                        kontainer[i][index_i]['barang'] = barang_j_temp
+                        kontainer[j][index_j]['barang'] = barang_i_temp
+                        apply_swap_to_cache(objective_cache, i, j, barang_i_temp['ukuran'], barang_j_temp['ukuran'], kapasitas_kontainer)
+                    
+                        if deadline is not None:
+                            new_POF = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+                            if best.record_swap(kontainer, i, index_i, j, index_j, new_POF):
+                                stucked_since_best = 0
+                    
+                        if verbose and delta_E >= 0:
+                            print(f"Iter {current_iteration+1}: [ACCEPT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E:.2f} | T={temperature:.2f}")
+                        elif verbose:
+                            print(f"Iter {current_iteration+1}: [PROB-ACCEPT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E:.2f} | P={probability:.4f} | T={temperature:.2f}")
+                    elif verbose:
+                        print(f"Iter {current_iteration+1}: [REJECT] {barang_i_temp['id']} ↔ {barang_j_temp['id']} | ΔE={delta_E:.2f} | P={probability:.4f} | T={temperature:.2f}")
+            
+            temperature         *= alpha
+            current_iteration   += 1
+            
+            # mode anytime: suhu tidak turun di bawah min_temperature, search jalan terus sampai deadline
+            if deadline is not None and temperature < min_temperature:
+                temperature = min_temperature
+    
+    end_time        = time.time()
+    execution_time  = end_time - start_time
+    
+    final_POF, _, _, _ = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)
+    if deadline is not None and best.objective < final_POF:
+        kontainer = best.restore(kontainer)
+        final_POF = best.objective
+    
+    return Result(
+        algorithm      = 'Simulated Annealing',
+        kontainer      = kontainer,
+        objective      = final_POF,
+        K              = count_used_bins(kontainer),
+        execution_time = execution_time,
+        iterations     = current_iteration,
+        evaluations    = current_iteration,   # satu kandidat swap dinilai per iterasi (kandidat yang dibuang tidak dihitung)
+        history        = history_POF,
+        lower_bound    = lower_bound,
+        extra          = {
+            'mode'                   : params['mode'],
+            'moves'                  : params['moves'],
+            'time_limit'             : params['time_limit'],
+            'reheats'                : reheats,
+            'discarded_proposals'    : discarded_proposals,
+            'initial_temperature'    : initial_temperature,
+            'final_temperature'      : temperature,
+            'local_stucked'          : local_stucked,
+            'accept_iterations'      : iterations,
+            'acceptance_probability' : acceptance_probability,
+            'stopped_early'          : stopped_early,
+            'reached_lower_bound'    : reached_lower_bound,
+        },
+    )
+
+def plot_result(result):
+    # matplotlib/numpy baru di-import saat plot diminta, supaya solve() headless tetap ringan
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
+    iterations             = result.extra['accept_iterations']
+    acceptance_probability = result.extra['acceptance_probability']
+    history_POF            = result.history
+    
+    # plot 1
+    plt.ioff()
+    
+    plt.figure(figsize=(10, 5))
+    plt.scatter(iterations, acceptance_probability, c='lightblue', s=20, alpha=0.6, label='Acceptance Probability')
+    
+    if len(iterations) > 1:
+        z = np.polyfit(iterations, acceptance_probability, 3) 
+        p = np.poly1d(z)
+        plt.plot(iterations, p(iterations), 'b-', linewidth=2, label='Trend Line')
+    
+    plt.xlabel('Iteration', fontsize=12)
+    plt.ylabel('Probability', fontsize=12)
+    plt.title('Acceptance Probability over Iterations (ΔE < 0)', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.ylim(-0.02, 1.02)
+    plt.tight_layout()
+    plt.show()
+    
+    
+    # plot 2 
+    plt.figure(figsize=(10, 5))
+    plt.plot(range(len(history_POF)), history_POF, 'r-', linewidth=2, label='Objective Function Value')
+    plt.xlabel('Iteration', fontsize=12)
+    plt.ylabel('Objective Function Value', fontsize=12)
+    plt.title('Objective Function (POF) over Iterations', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+def main():
+    show_plot  = not pop_flag(sys.argv, '--no-plot')
+    time_limit = pop_option(sys.argv, '--time-limit')   # mis. --time-limit 0.2 (detik, mode anytime)
+    t0         = pop_option(sys.argv, '--t0')           # auto | exhaustive | sampled | angka
+    moves      = pop_option(sys.argv, '--moves')        # mis. --moves swap,relocate,empty_bin
+    
+    if len(sys.argv) > 1:
+        json_filename = sys.argv[1]
+    else:
+        json_filename = 'case6.json'  
+    
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+    mode             = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_PARAMS['mode']
+    
+    instance = load_instance(json_filename, 'SimulatedAnnealing.py')
+    print_instance(instance)
+    
+    try:
+        if t0 is not None and t0 not in T0_METHODS:
+            try:
+                t0 = float(t0)
+            except ValueError:
+                pass   # biarkan solve() yang melaporkan metode yang tidak dikenal
+        result = solve(instance, {'initial_strategy': initial_strategy, 'mode': mode,
+                                  'time_limit': float(time_limit) if time_limit is not None else None,
+                                  'initial_temperature': t0 if t0 is not None else DEFAULT_PARAMS['initial_temperature'],
+                                  'moves': tuple(moves.split(',')) if moves is not None else None})
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    
+    print_kontainer(result.kontainer, instance['kapasitas_kontainer'], "HASIL PENYIMPANAN BARANG DALAM KONTAINER")
+    
+    print(f"\nSimulated Annealing completed after {result.iterations} iterations.")
+    print(f"Final Temperature: {result.extra['final_temperature']:.2f}")
+    print(f"Execution Time: {result.execution_time:.4f} seconds")
+    print_gap(result)
+    
+    print(f"Current case of Simulated Annealing made {result.extra['local_stucked']} times")
+    if result.extra['time_limit'] is not None:
+        print(f"Reheats: {result.extra['reheats']} (time limit {result.extra['time_limit']} s, objective terbaik {result.objective:.4f})")
+    
+    if show_plot:
+        plot_result(result)
 
-# plot 2 
-plt.figure(figsize=(10, 5))
-plt.plot(range(len(history_POF)), history_POF, 'r-', linewidth=2, label='Objective Function Value')
-plt.xlabel('Iteration', fontsize=12)
-plt.ylabel('Objective Function Value', fontsize=12)
-plt.title('Objective Function (POF) over Iterations', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-plt.legend()
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
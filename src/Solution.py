@@ -0,0 +1,141 @@
+import numpy as np
+
+# Representasi solusi bin packing berbasis array, dipakai bersama oleh semua algoritma.
+#
+#   ukuran     : int32[n]   ukuran tiap barang (urutan sesuai data JSON)
+#   assignment : int32[n]   indeks kontainer (0-based) untuk tiap barang
+#   loads      : int64[K]   total ukuran per kontainer
+#   order      : int32[n]   indeks barang dikelompokkan per kontainer (format CSR)
+#   bin_start  : int32[K+1] offset awal tiap kontainer di dalam `order`
+#   position   : int32[n]   posisi tiap barang di dalam `order`
+#
+# `ids` dan `ukuran` tidak pernah berubah sehingga dibagi (tidak di-copy) antar salinan solusi.
+
+class BinPackingSolution:
+    __slots__ = ('kapasitas', 'ids', 'ukuran', 'assignment', 'loads', 'order', 'bin_start', 'position')
+
+    def __init__(self, kapasitas, ids, ukuran, assignment, order=None):
+        self.kapasitas  = kapasitas
+        self.ids        = ids
+        self.ukuran     = np.asarray(ukuran, dtype=np.int32)
+        self.assignment = np.asarray(assignment, dtype=np.int32)
+
+        K = int(self.assignment.max()) + 1 if len(self.assignment) > 0 else 0
+        self.loads     = np.bincount(self.assignment, weights=self.ukuran, minlength=K).astype(np.int64)
+        counts         = np.bincount(self.assignment, minlength=K)
+        self.bin_start = np.zeros(K + 1, dtype=np.int32)
+        np.cumsum(counts, out=self.bin_start[1:])
+
+        if order is None:
+            order = np.argsort(self.assignment, kind='stable')
+        self.order    = np.asarray(order, dtype=np.int32)
+        self.position = np.empty(len(self.order), dtype=np.int32)
+        self.position[self.order] = np.arange(len(self.order), dtype=np.int32)
+
+    # ---------- konversi dari / ke layout lama ----------
+
+    @classmethod
+    def from_data(cls, data, assignment):
+        barang = data['barang']
+        return cls(data['kapasitas_kontainer'], [item['id'] for item in barang],
+                   [item['ukuran'] for item in barang], assignment)
+
+    @classmethod
+    def from_kontainer(cls, kontainer, kapasitas, barang=None):
+        # kontainer boleh berisi {'barang': {...}} (SA/HC/GA) atau langsung {...} (visualizer)
+        flat = []
+        for idx_container, container in enumerate(kontainer):
+            for item in container:
+                flat.append((idx_container, item['barang'] if 'barang' in item else item))
+
+        if barang is None:
+            barang = [item for _, item in flat]
+        item_index = {item['id']: i for i, item in enumerate(barang)}
+
+        assignment = np.empty(len(barang), dtype=np.int32)
+        order      = np.empty(len(barang), dtype=np.int32)
+        for pos, (idx_container, item) in enumerate(flat):
+            i               = item_index[item['id']]
+            assignment[i]   = idx_container
+            order[pos]      = i
+
+        solution = cls(kapasitas, [item['id'] for item in barang],
+                       [item['ukuran'] for item in barang], assignment, order)
+
+        # kontainer kosong di ujung tidak terlihat dari assignment, jadi tambahkan manual
+        missing = len(kontainer) - solution.num_bins
+        if missing > 0:
+            solution.loads     = np.concatenate([solution.loads, np.zeros(missing, dtype=np.int64)])
+            solution.bin_start = np.concatenate([solution.bin_start,
+                                                 np.full(missing, solution.bin_start[-1], dtype=np.int32)])
+        return solution
+
+    @classmethod
+    def from_kromosom(cls, kromosom, barang, kapasitas):
+        # kromosom GA memakai nomor kontainer 1-based
+        return cls(kapasitas, [item['id'] for item in barang], [item['ukuran'] for item in barang],
+                   np.asarray(kromosom, dtype=np.int32) - 1)
+
+    def to_kontainer(self, wrap=True):
+        kontainer = []
+        for b in range(self.num_bins):
+            container = []
+            for i in self.bin_items(b):
+                item = {'id': self.ids[i], 'ukuran': int(self.ukuran[i])}
+                container.append({'barang': item} if wrap else item)
+            kontainer.append(container)
+        return kontainer
+
+    def to_kromosom(self):
+        return (self.assignment + 1).tolist()
+
+    def to_data(self):
+        return {
+            'kapasitas_kontainer': self.kapasitas,
+            'barang': [{'id': self.ids[i], 'ukuran': int(self.ukuran[i])} for i in range(len(self.ids))],
+        }
+
+    # ---------- akses & update ----------
+
+    @property
+    def num_bins(self):
+        return len(self.loads)
+
+    @property
+    def used_bins(self):
+        return int(np.count_nonzero(self.bin_start[1:] - self.bin_start[:-1]))
+
+    @property
+    def nbytes(self):
+        return (self.ukuran.nbytes + self.assignment.nbytes + self.loads.nbytes
+                + self.order.nbytes + self.bin_start.nbytes + self.position.nbytes)
+
+    def bin_items(self, b):
+        return self.order[self.bin_start[b]:self.bin_start[b + 1]]
+
+    def copy(self):
+        clone            = object.__new__(BinPackingSolution)
+        clone.kapasitas  = self.kapasitas
+        clone.ids        = self.ids
+        clone.ukuran     = self.ukuran
+        clone.assignment = self.assignment.copy()
+        clone.loads      = self.loads.copy()
+        clone.order      = self.order.copy()
+        clone.bin_start  = self.bin_start.copy()
+        clone.position   = self.position.copy()
+        return clone
+
+    def swap(self, item_a, item_b):
+        # tukar dua barang antar kontainer dalam O(1)
+        bin_a = self.assignment[item_a]
+        bin_b = self.assignment[item_b]
+        delta = int(self.ukuran[item_b]) - int(self.ukuran[item_a])
+
+        self.loads[bin_a] += delta
+        self.loads[bin_b] -= delta
+        self.assignment[item_a], self.assignment[item_b] = bin_b, bin_a
+
+        pos_a = self.position[item_a]
+        pos_b = self.position[item_b]
+        self.order[pos_a], self.order[pos_b]         = item_b, item_a
+        self.position[item_a], self.position[item_b] = pos_b, pos_a
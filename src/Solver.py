@@ -0,0 +1,135 @@
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from queue import Empty
+
+# Hal-hal yang dipakai bersama oleh semua solver: format hasil, loader JSON, dan printer kontainer.
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+@dataclass
+class Result:
+    algorithm      : str
+    kontainer      : list          # layout lama: list kontainer berisi {'barang': {...}}
+    objective      : float         # nilai objective akhir versi algoritma tsb (lebih kecil lebih baik)
+    K              : int           # jumlah kontainer terpakai (tidak kosong)
+    execution_time : float = 0.0
+    iterations     : int   = 0
+    evaluations    : int   = 0     # jumlah kandidat solusi/move yang dinilai (untuk evaluations/sec)
+    history        : list  = field(default_factory=list)
+    extra          : dict  = field(default_factory=dict)
+    lower_bound    : int   = None  # lower bound jumlah kontainer (Bounds), None kalau tidak dihitung
+
+    @property
+    def gap(self):
+        # selisih K dengan lower bound; 0 berarti solusi terbukti optimal
+        return None if self.lower_bound is None else self.K - self.lower_bound
+
+def count_used_bins(kontainer):
+    return sum(1 for container in kontainer if len(container) > 0)
+
+def resolve_lower_bound(instance, lower_bound):
+    # param 'lower_bound' solver: 'auto' = dihitung dengan Bounds (L1/L2/L3), angka = dipakai langsung,
+    # None = tidak dipakai
+    if lower_bound == 'auto':
+        from Bounds import lower_bound as compute_lower_bound
+        return compute_lower_bound(instance)
+    return lower_bound
+
+def copy_kontainer(kontainer):
+    # solver swap mengubah entry {'barang': ...} in place, jadi entry-nya ikut di-copy (barangnya tidak)
+    return [[{'barang': entry['barang']} for entry in container] for container in kontainer]
+
+WORKER_POLL_INTERVAL = 1.0   # detik; jeda antar cek proses worker saat menunggu queue
+
+def receive_from_workers(queue, processes, poll_interval=WORKER_POLL_INTERVAL):
+    # queue.get() untuk koordinator multiprocessing yang tidak menggantung selamanya kalau ada worker
+    # yang mati (exception, OOM, kill) sebelum sempat mengirim pesan: setiap timeout, exitcode dicek
+    while True:
+        try:
+            return queue.get(timeout=poll_interval)
+        except Empty:
+            pass
+        crashed = [process for process in processes if process.exitcode not in (None, 0)]
+        if crashed or not any(process.is_alive() for process in processes):
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            if crashed:
+                raise RuntimeError(f"worker {crashed[0].name} exited with code {crashed[0].exitcode}")
+            raise RuntimeError("all workers exited before sending their results")
+
+def pop_flag(argv, flag):
+    # buang flag opsional (mis. '--no-plot') dari argv supaya argumen posisi tetap sama
+    if flag in argv:
+        argv.remove(flag)
+        return True
+    return False
+
+def pop_option(argv, option):
+    # buang '--option value' dari argv dan kembalikan value-nya (None kalau tidak ada)
+    if option in argv:
+        index = argv.index(option)
+        if index + 1 >= len(argv):
+            print(f"Error: {option} butuh nilai")
+            sys.exit(1)
+        value = argv[index + 1]
+        del argv[index:index + 2]
+        return value
+    return None
+
+def load_instance(json_filename, script_name=None):
+    # path relatif dicari dari folder src seperti sebelumnya
+    json_path = os.path.join(script_dir, json_filename)
+
+    try:
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        print(f"Using JSON file: {json_filename}")
+    except FileNotFoundError:
+        print(f"Error: {json_filename} not found!")
+        if script_name:
+            print(f"Usage: python3 {script_name} [json_filename] [random|ffd|bfd]")
+            print(f"Example: python3 {script_name} case2.json ffd")
+        sys.exit(1)
+
+    return data
+
+def print_instance(instance):
+    barang    = instance['barang']
+    items_str = [f"{item['id']}({item['ukuran']})" for item in barang]
+
+    print(f"Loaded data from JSON file:")
+    print(f"Kapasitas kontainer: {instance['kapasitas_kontainer']} kg/m³")
+    print(f"Jumlah barang: {len(barang)}")
+    print(f"Barang: {items_str}")
+
+def print_gap(result):
+    if result.lower_bound is None:
+        return
+    print(f"Lower bound: {result.lower_bound} kontainer, K = {result.K}, gap = {result.gap}"
+          f"{' (optimal)' if result.gap <= 0 else ''}")
+
+def print_kontainer(kontainer, kapasitas, title):
+    print("\n" + "="*60)
+    print(title)
+    print("="*60)
+
+    for idx, container in enumerate(kontainer):
+        print(f"\nKontainer {idx + 1}:")
+        total_ukuran = 0
+
+        for item in container:
+            barang_info = item['barang']
+            print(f"  - ID: {barang_info['id']}, Ukuran: {barang_info['ukuran']} kg/m³")
+            total_ukuran += barang_info['ukuran']
+
+        sisa_kapasitas = kapasitas - total_ukuran
+        print(f"  Total Terisi: {total_ukuran}/{kapasitas} kg/m³")
+        print(f"  Sisa Kapasitas: {sisa_kapasitas} kg/m³")
+        print(f"  Efisiensi: {(total_ukuran/kapasitas)*100:.2f}%")
+
+    print("\n" + "="*60)
+    print(f"Total Kontainer Digunakan: {len(kontainer)}")
+    print("="*60)
@@ -0,0 +1,234 @@
+import random
+import sys
+import time
+
+from Anytime import BestSoFar
+from Initializer import create_initial_solution
+from Moves import MoveGenerator
+from SimulatedAnnealing import (apply_move_to_cache, calculate_move_delta, calculate_objective_from_cache,
+                                create_objective_cache)
+from Solver import (Result, count_used_bins, load_instance, pop_flag, pop_option, print_gap, print_instance,
+                    print_kontainer, resolve_lower_bound)
+
+# Tabu search di atas model kontainer/barang yang sama dengan solver lain. Setiap iterasi mengambil
+# `candidate_size` move acak dari Moves (candidate list terbatas, bukan seluruh neighborhood), lalu
+# menerapkan kandidat terbaik yang tidak tabu, walaupun objective-nya memburuk. Jadi search tetap
+# bergerak di plateau tanpa bergantung pada peluang seperti SA.
+#
+# Memori jangka pendek berisi atribut (id barang, kontainer asal) dari barang yang baru dipindah:
+# move yang mengembalikan barang ke kontainer asalnya tabu selama `tabu_tenure` iterasi. Satu slot
+# ring buffer = semua atribut dari satu iterasi (move gabungan seperti swap21/empty_bin memindah
+# beberapa barang sekaligus), plus dict hitungan per atribut, jadi cek O(1). Aspiration: move tabu tetap
+# boleh kalau hasilnya lebih baik dari solusi terbaik. Objective = POF Simulated Annealing.
+
+DEFAULT_PARAMS = {
+    'initial_strategy' : 'random',   # random | ffd | bfd
+    'moves'            : ('swap', 'relocate', 'swap21', 'swap12', 'empty_bin'),   # jenis move dari Moves.MOVE_TYPES
+    'candidate_size'   : 32,         # jumlah kandidat move yang dinilai per iterasi
+    'tabu_tenure'      : 20,         # jumlah iterasi atribut (id barang, kontainer asal) tetap tabu
+    'max_iterations'   : 5000,
+    'max_no_improve'   : 1000,       # berhenti setelah sekian iterasi tanpa solusi terbaik baru (None = mati)
+    'time_limit'       : None,       # detik; kalau diisi: berhenti di deadline, max_iterations/max_no_improve diabaikan
+    'lower_bound'      : 'auto',     # berhenti jika jumlah kontainer terpakai sudah <= lower bound ('auto' = Bounds, None = mati)
+    'seed'             : None,
+    'verbose'          : True,
+}
+
+STOP_CHECK_INTERVAL = 16   # should_stop() / deadline dicek tiap sekian iterasi
+
+class TabuList:
+    def __init__(self, tenure):
+        self.ring   = [()] * max(tenure, 1)   # satu slot per iterasi: tuple atribut iterasi tsb
+        self.next   = 0
+        self.counts = {}   # atribut -> jumlah kemunculan di ring (atribut yang sama bisa masuk dua kali)
+
+    def add(self, attributes):
+        for oldest in self.ring[self.next]:
+            count = self.counts[oldest] - 1
+            if count:
+                self.counts[oldest] = count
+            else:
+                del self.counts[oldest]
+        attributes           = tuple(attributes)
+        self.ring[self.next] = attributes
+        for attribute in attributes:
+            self.counts[attribute] = self.counts.get(attribute, 0) + 1
+        self.next = (self.next + 1) % len(self.ring)
+
+    def __contains__(self, attribute):
+        return attribute in self.counts
+
+def entry_id(kontainer, b, index):
+    return kontainer[b][index]['barang']['id']
+
+def solve(instance, params=None, should_stop=None):
+    solve_start         = time.perf_counter()
+    params              = {**DEFAULT_PARAMS, **(params or {})}
+    rng                 = random.Random(params['seed'])
+    verbose             = params['verbose']
+    kapasitas_kontainer = instance['kapasitas_kontainer']
+
+    # state awal: random spawn (default), ffd, atau bfd
+    kontainer = create_initial_solution(instance['barang'], kapasitas_kontainer, params['initial_strategy'], rng=rng)
+
+    if verbose:
+        print_kontainer(kontainer, kapasitas_kontainer, "SPAWN BARANG DALAM KONTAINER")
+
+    start_time      = time.time()
+    objective_cache = create_objective_cache(kontainer, kapasitas_kontainer)
+    generator       = MoveGenerator(kontainer, kapasitas_kontainer, params['moves'], objective_cache['totals'], rng)
+    tabu            = TabuList(params['tabu_tenure'])
+    # label kontainer tetap walaupun index-nya bergeser saat ada kontainer yang dihapus
+    labels          = list(range(len(kontainer)))
+
+    current_POF     = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+    history_POF     = [current_POF]
+    best            = BestSoFar(kontainer, current_POF)
+    deadline        = solve_start + params['time_limit'] if params['time_limit'] is not None else None
+
+    lower_bound         = resolve_lower_bound(instance, params['lower_bound'])
+    reached_lower_bound = lower_bound is not None and count_used_bins(kontainer) <= lower_bound
+
+    iteration       = 0
+    no_improve      = 0
+    evaluations     = 0
+    tabu_rejected   = 0
+    aspirations     = 0
+    stopped_early   = False
+
+    while not reached_lower_bound and len(kontainer) > 1:
+        if deadline is None and (iteration >= params['max_iterations'] or
+                                 (params['max_no_improve'] is not None and no_improve >= params['max_no_improve'])):
+            break
+        if iteration % STOP_CHECK_INTERVAL == 0:
+            if should_stop is not None and should_stop():
+                stopped_early = True
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        iteration += 1
+
+        # candidate list: kandidat terbaik yang tidak tabu (atau tabu tapi lolos aspiration)
+        chosen = None
+        for _ in range(params['candidate_size']):
+            move = generator.propose()
+            if move is None:
+                continue
+            evaluations += 1
+            delta = calculate_move_delta(move, kapasitas_kontainer)
+            if chosen is not None and delta[0] >= chosen[1][0]:
+                continue
+            if any((entry_id(kontainer, source, index), labels[target]) in tabu
+                   for source, index, target in move.transfers):
+                if current_POF + delta[0] >= best.objective:
+                    tabu_rejected += 1
+                    continue
+                aspirations += 1
+            chosen = (move, delta)
+
+        if chosen is None:
+            history_POF.append(current_POF)
+            no_improve += 1
+            continue
+
+        move, (delta_cost, delta_K, delta_overflow, delta_squared) = chosen
+        attributes = [(entry_id(kontainer, source, index), labels[source]) for source, index, _ in move.transfers]
+        undo       = generator.apply(move, keep_undo=True)
+        apply_move_to_cache(objective_cache, delta_K, delta_overflow, delta_squared)
+        for b in sorted(move.emptied, reverse=True):   # sama dengan penghapusan kontainer di MoveGenerator.apply
+            labels[b] = labels[-1]
+            labels.pop()
+        tabu.add(attributes)
+
+        current_POF = calculate_objective_from_cache(objective_cache, kapasitas_kontainer)[0]
+        history_POF.append(current_POF)
+        if best.record_move(kontainer, undo, current_POF):
+            no_improve = 0
+            if verbose:
+                print(f"Iter {iteration}: [BEST] {move.kind} | POF={current_POF:.4f} | K={len(kontainer)}")
+        else:
+            no_improve += 1
+
+        if move.emptied and lower_bound is not None and count_used_bins(kontainer) <= lower_bound:
+            reached_lower_bound = True
+
+    end_time = time.time()
+    if best.objective < current_POF:
+        kontainer = best.restore(kontainer)
+    K = count_used_bins(kontainer)
+
+    return Result(
+        algorithm      = 'Tabu Search',
+        kontainer      = kontainer,
+        objective      = best.objective,
+        K              = K,
+        execution_time = end_time - start_time,
+        iterations     = iteration,
+        evaluations    = evaluations,
+        history        = history_POF,
+        lower_bound    = lower_bound,
+        extra          = {
+            'moves'               : params['moves'],
+            'candidate_size'      : params['candidate_size'],
+            'tabu_tenure'         : params['tabu_tenure'],
+            'tabu_rejected'       : tabu_rejected,
+            'aspirations'         : aspirations,
+            'time_limit'          : params['time_limit'],
+            'stopped_early'       : stopped_early,
+            'reached_lower_bound' : lower_bound is not None and K <= lower_bound,
+        },
+    )
+
+def plot_result(result):
+    # matplotlib baru di-import saat plot diminta, supaya solve() headless tetap ringan
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 5))
+    plt.plot(range(len(result.history)), result.history, 'r-', linewidth=2, label='Objective Function Value')
+    plt.xlabel('Iteration', fontsize=12)
+    plt.ylabel('Objective Function Value', fontsize=12)
+    plt.title('Tabu Search - Objective Function (POF) over Iterations', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+def main():
+    show_plot  = not pop_flag(sys.argv, '--no-plot')
+    time_limit = pop_option(sys.argv, '--time-limit')   # mis. --time-limit 1 (detik)
+    moves      = pop_option(sys.argv, '--moves')        # mis. --moves swap,relocate,fill_bin
+
+    if len(sys.argv) > 1:
+        json_filename = sys.argv[1]
+    else:
+        json_filename = 'case6.json'
+
+    initial_strategy = sys.argv[2] if len(sys.argv) > 2 else 'random'
+
+    instance = load_instance(json_filename, 'TabuSearch.py')
+    print_instance(instance)
+
+    try:
+        result = solve(instance, {'initial_strategy': initial_strategy,
+                                  'time_limit': float(time_limit) if time_limit is not None else None,
+                                  'moves': tuple(moves.split(',')) if moves is not None else DEFAULT_PARAMS['moves']})
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+
+    print_kontainer(result.kontainer, instance['kapasitas_kontainer'], "HASIL PENYIMPANAN BARANG DALAM KONTAINER")
+
+    print("\n" + "="*60)
+    print(f"TABU SEARCH - {result.iterations} iterasi, {result.evaluations} kandidat dinilai")
+    print("="*60)
+    print(f"Best POF: {result.objective:.4f} (K={result.K})")
+    print(f"Tabu rejected: {result.extra['tabu_rejected']}, aspirations: {result.extra['aspirations']}")
+    print(f"Execution Time: {result.execution_time:.4f} seconds")
+    print_gap(result)
+    print("="*60)
+
+    if show_plot:
+        plot_result(result)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+from array import array
+
+# Jejak (trace) run local search yang ringkas: state awal + daftar move swap
+# (bin_i, idx_i, bin_j, idx_j) dan objective setelah tiap move, disimpan di array packed.
+# Frame ke-f (state setelah f move) dibangun ulang saat diminta dari keyframe terdekat,
+# keyframe disimpan tiap `keyframe_interval` move supaya akses acak tetap murah. Memori trace
+# sebanding dengan jumlah move (+ n * move / keyframe_interval), bukan move x n.
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+def copy_state(kontainer):
+    # barang (dict) dipakai bersama, yang di-copy hanya list per kontainer
+    return [container.copy() for container in kontainer]
+
+class SnapshotTrace:
+    def __init__(self, kontainer, objective, iteration=0, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self.moves             = array('q')   # 4 nilai per move: bin_i, idx_i, bin_j, idx_j
+        self.iterations        = array('q', [iteration])
+        self.objectives        = array('d', [objective])
+        self.keyframes         = [copy_state(kontainer)]
+
+        # state terakhir yang dibangun; frame berurutan (playback) cukup menerapkan satu move
+        self.cursor_frame      = 0
+        self.cursor_state      = copy_state(kontainer)
+
+    def __len__(self):
+        return len(self.objectives)
+
+    def record_move(self, bin_i, idx_i, bin_j, idx_j, objective, iteration=0):
+        self.moves.extend((bin_i, idx_i, bin_j, idx_j))
+        self.objectives.append(objective)
+        self.iterations.append(iteration)
+
+        frame = len(self.objectives) - 1
+        if frame % self.keyframe_interval == 0:
+            self.keyframes.append(copy_state(self.frame(frame)))
+
+    def move(self, frame):
+        # move (bin_i, idx_i, bin_j, idx_j) yang menghasilkan `frame` dari frame sebelumnya
+        offset = 4 * (frame - 1)
+        return tuple(self.moves[offset:offset + 4])
+
+    def apply_move(self, state, frame):
+        # terapkan move yang menghasilkan `frame` pada state, in place
+        bin_i, idx_i, bin_j, idx_j = self.move(frame)
+        state[bin_i][idx_i], state[bin_j][idx_j] = state[bin_j][idx_j], state[bin_i][idx_i]
+
+    # state yang dikembalikan dipakai ulang oleh pemanggilan frame() berikutnya; copy_state()
+    # dulu kalau perlu disimpan
+    def frame(self, frame):
+        if frame < 0:
+            frame += len(self)
+        if not 0 <= frame < len(self):
+            raise IndexError(f"frame {frame} out of range (trace has {len(self)} frames)")
+
+        keyframe = min(frame // self.keyframe_interval, len(self.keyframes) - 1)
+        start    = keyframe * self.keyframe_interval
+
+        # lanjutkan dari cursor kalau lebih dekat daripada keyframe (kasus playback berurutan)
+        if not start <= self.cursor_frame <= frame:
+            self.cursor_frame = start
+            self.cursor_state = copy_state(self.keyframes[keyframe])
+
+        while self.cursor_frame < frame:
+            self.cursor_frame += 1
+            self.apply_move(self.cursor_state, self.cursor_frame)
+
+        return self.cursor_state
+
+    def snapshot(self, frame):
+        # bentuk lama save_snapshot: dict iteration / kontainer / objective
+        if frame < 0:
+            frame += len(self)
+        return {
+            'iteration' : self.iterations[frame],
+            'kontainer' : self.frame(frame),
+            'objective' : self.objectives[frame],
+        }
+
+    @property
+    def nbytes(self):
+        state_refs = sum(len(container) + 1 for container in self.keyframes[0])
+        return (self.moves.itemsize * len(self.moves)
+                + self.iterations.itemsize * len(self.iterations)
+                + self.objectives.itemsize * len(self.objectives)
+                + 8 * state_refs * (len(self.keyframes) + 1))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# modul solver ada di src/ dan di-import dengan nama langsung (seperti saat script dijalankan dari src/)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,14 @@
+import pytest
+
+import HillClimbingStochastic
+from Benchmark import generate_instance
+
+@pytest.mark.parametrize('seed', [1, 3, 4])
+def test_anytime_objective_matches_returned_kontainer(seed):
+    # mode anytime: state terbaik dibangun ulang dari undo log / snapshot BestSoFar, termasuk swap kick
+    instance = generate_instance('uniform', 200, 1)
+    result   = HillClimbingStochastic.solve(instance, {'seed': seed, 'time_limit': 0.05, 'lower_bound': None,
+                                                       'verbose': False})
+
+    assert result.extra['kicks'] > 0
+    assert HillClimbingStochastic.calculate_waste_squared(result.kontainer, instance['kapasitas_kontainer']) == result.objective
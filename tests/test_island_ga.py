@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+import IslandGA
+from Benchmark import generate_instance
+
+def test_dead_island_raises_instead_of_hanging(monkeypatch):
+    # island 0 mati tanpa mengirim hasil; koordinator harus berhenti dengan error, bukan menunggu
+    run_island = IslandGA.run_island
+
+    def crashing_island(island, *args):
+        if island == 0:
+            os._exit(3)
+        run_island(island, *args)
+
+    monkeypatch.setattr(IslandGA, 'run_island', crashing_island)
+    instance = generate_instance('uniform', 50, 1)
+    with pytest.raises(RuntimeError, match='exited with code 3'):
+        IslandGA.run_island_model(instance, {'max_iterations': 5}, {'islands': 2})
@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+import ParallelTempering
+from Benchmark import generate_instance
+
+def test_dead_replica_raises_instead_of_hanging(monkeypatch):
+    # replika 1 mati sebelum mengirim apa pun; koordinator harus berhenti dengan error, bukan menunggu
+    run_replica = ParallelTempering.run_replica
+
+    def crashing_replica(replica, *args):
+        if replica == 1:
+            os._exit(3)
+        run_replica(replica, *args)
+
+    monkeypatch.setattr(ParallelTempering, 'run_replica', crashing_replica)
+    instance = generate_instance('uniform', 50, 1)
+    with pytest.raises(RuntimeError, match='exited with code 3'):
+        ParallelTempering.solve(instance, {'replicas': 3, 'rounds': 5, 'exchange_interval': 10, 'lower_bound': None,
+                                           'seed': 1, 'verbose': False})
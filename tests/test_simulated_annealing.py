@@ -0,0 +1,23 @@
+import random
+
+import pytest
+
+import SimulatedAnnealing
+
+KAPASITAS = 150
+
+def random_kontainer(seed, bins=50):
+    # kontainer acak (termasuk yang kosong), dibangun langsung tanpa instance JSON
+    rng = random.Random(seed)
+    return [[{'barang': {'id': f'B{b}-{k}', 'ukuran': rng.randint(1, KAPASITAS // 3)}}
+             for k in range(rng.randint(0, 3))]
+            for b in range(bins)]
+
+@pytest.mark.parametrize('seed', range(5))
+def test_cached_objective_matches_full_recomputation(seed):
+    # POF dari cache (Σ total² / C²) harus sama persis dengan hitung ulang penuh, bukan hanya mendekati
+    kontainer = random_kontainer(seed)
+    cache     = SimulatedAnnealing.create_objective_cache(kontainer, KAPASITAS)
+
+    assert SimulatedAnnealing.calculate_objective_function(kontainer, KAPASITAS) == \
+           SimulatedAnnealing.calculate_objective_from_cache(cache, KAPASITAS)